@@ -7,7 +7,11 @@ into the workspace's .agents/skills/ directory. It uses git sparse checkout to
 efficiently download only the skill directory without cloning the entire repository.
 
 Usage:
-    python fetch_skill.py <github-url> <workspace-path> [--force]
+    python fetch_skill.py <github-url> [<github-url> ...] <workspace-path> [--force] [--cache-dir DIR]
+    python fetch_skill.py --manifest skills.txt <workspace-path>
+    python fetch_skill.py --update [<github-url> ...] <workspace-path>
+    python fetch_skill.py --prefetch --sources sources.txt --cache-dir DIR [--interval SECONDS] [--once]
+    python fetch_skill.py <github-url> <workspace-path> --cache-dir DIR --offline
 
 Examples:
     # Full GitHub URL with branch
@@ -18,22 +22,153 @@ Examples:
     
     # Shorthand format
     python fetch_skill.py "OpenHands/skills/skills/codereview" /workspace
+    
+    # Several skills from one repository share a single clone
+    python fetch_skill.py "OpenHands/skills/skills/docker" "OpenHands/skills/skills/npm" /workspace
+    
+    # Reuse a local mirror cache across installs
+    python fetch_skill.py "OpenHands/skills/skills/npm" /workspace --cache-dir ~/.cache/skills
 
 The script will:
 1. Parse the GitHub URL to extract owner, repo, branch, and skill path
 2. Use git sparse checkout to download only the specified skill directory
 3. Validate the skill has a SKILL.md file
 4. Copy the skill to <workspace>/.agents/skills/<skill-name>/
+
+Skills requested together (as several URLs or through --manifest) are grouped
+by repository and branch, so each repository is cloned only once, and the
+repositories are fetched concurrently. Failures are collected and reported
+together once every repository has been tried.
+
+With --cache-dir (or SKILL_CACHE_DIR), step 2 goes through a persistent bare
+mirror per owner/repo instead of a fresh clone. The mirror is refreshed with an
+incremental fetch at most once per MIRROR_MAX_AGE seconds, so repeat installs
+from the same repository skip the network entirely.
+
+With --store-dir (or SKILL_STORE_DIR), every skill version is kept once in a
+content-addressed store keyed by its git tree hash, and workspaces get
+hardlinks to the stored files instead of copies. Stored files are read-only,
+since every workspace that installed that version shares them.
+
+Every install is recorded in <workspace>/.agents/skills.lock with the source
+repository, path, branch, resolved commit and tree hash. Locked skills are
+reinstalled at their recorded commit, and skills whose installed files still
+match the recorded tree hash are skipped without touching the network.
+--force ignores the lockfile and installs the branch head.
+
+--transport archive downloads a repository tarball instead of running git,
+streaming it and extracting only the requested skill directories. Transports
+are looked up in the TRANSPORTS registry.
+
+--update moves locked skills to the head of their branch. Only the files that
+differ from the installed version are downloaded.
+
+--prefetch keeps the mirror cache warm in the background: every --interval
+seconds it fetches each listed source and downloads the blobs of its skills.
+Installs with --cache-dir then find everything locally, and --offline
+guarantees they never touch the network.
+
+Installs and updates are staged beside the skill directory and swapped in by
+rename, so a crash never leaves a half-copied skill. On Linux the two
+directories are exchanged in one renameat2(RENAME_EXCHANGE) call, so the skill
+directory exists at every moment. Elsewhere the old version is renamed aside
+first, and the directory is briefly missing between the two renames. Installers
+working on the same workspace take an advisory lock (.agents/.install.lock) and
+run one at a time; the next one recovers anything an interrupted install left
+behind. Readers of .agents/skills (agents loading skills) do not take the lock
+and are not protected by it: they rely only on the swap above.
 """
 
 import argparse
+import base64
+import ctypes
+import errno
+import hashlib
+import json
 import os
 import re
 import shutil
+import stat
 import subprocess
 import sys
+import tarfile
 import tempfile
+import threading
+import time
+import urllib.parse
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Optional
+from urllib.parse import quote
+
+try:
+    import fcntl
+except ImportError:  # Windows: installs are still staged, but not locked across processes
+    fcntl = None
+
+# renameat2(2), for swapping a skill directory in with RENAME_EXCHANGE (Linux, glibc >= 2.28)
+try:
+    _renameat2 = ctypes.CDLL(None, use_errno=True).renameat2 if sys.platform.startswith('linux') else None
+except (OSError, AttributeError):
+    _renameat2 = None
+if _renameat2 is not None:
+    _renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+AT_FDCWD = -100
+RENAME_EXCHANGE = 2
+
+
+# Seconds a mirror branch is considered fresh before it is fetched again
+MIRROR_MAX_AGE = 300
+
+# Threads used to copy downloaded skills into the workspace
+COPY_WORKERS = 8
+
+# Repositories fetched concurrently by fetch_skills()
+FETCH_WORKERS = 4
+
+# Object id of git's empty tree; empty directories are not part of a tree
+EMPTY_TREE = '4b825dc642cb6eb9a060e54bf8d69288fbee4904'
+
+# Seconds between prefetch cycles
+PREFETCH_INTERVAL = 60
+
+# Seconds to wait on an archive download before giving up
+ARCHIVE_TIMEOUT = 60
+
+# Lockfile recording what is installed, relative to the workspace
+LOCKFILE = Path('.agents') / 'skills.lock'
+LOCKFILE_VERSION = 1
+
+# Advisory lock file serializing installers on one workspace
+INSTALL_LOCK = Path('.agents') / '.install.lock'
+
+# Advisory lock file, inside a bare mirror, serializing fetches into it
+MIRROR_LOCK = 'skill-fetch.lock'
+
+# Hidden sibling directories used while swapping a skill into place:
+# .<skill>.install-XXXX / .<skill>.update-XXXX (staging), .<skill>.old-XXXX (moved aside)
+_SWAP_DIR = re.compile(r'^\.(?P<name>.+)\.(?P<kind>install|update|old)-\w+$')
+
+
+class SkillFetchError(Exception):
+    """One or more skills failed to install; errors lists (source, message) pairs."""
+    
+    def __init__(self, errors: list[tuple[str, str]]):
+        self.errors = errors
+        super().__init__('; '.join(f"{source}: {message}" for source, message in errors))
+
+
+_path_locks: dict[Path, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
+
+def _path_lock(path: Path) -> threading.Lock:
+    """Lock serializing work on one mirror or install destination in this process."""
+    with _path_locks_guard:
+        return _path_locks.setdefault(Path(path).absolute(), threading.Lock())
 
 
 def parse_github_url(url: str) -> tuple[str, str, str, str]:
@@ -86,7 +221,607 @@ def parse_github_url(url: str) -> tuple[str, str, str, str]:
     raise ValueError(f"Unable to parse GitHub URL: {url}")
 
 
-def fetch_skill(github_url: str, workspace_path: str, force: bool = False) -> str:
+def build_repo_url(owner: str, repo: str) -> str:
+    """
+    Build the clone URL for a repository.
+    
+    The URL never carries credentials, since clones and mirrors save it in
+    their config; git commands authenticate through _git_env() instead.
+    """
+    return f"https://github.com/{owner}/{repo}.git"
+
+
+def _git_env() -> Optional[dict]:
+    """
+    Environment for git commands that may talk to GitHub.
+    
+    If GITHUB_TOKEN is available it is sent as an HTTP header for github.com,
+    which enables access to private repositories. The header is set through
+    git's GIT_CONFIG_* variables, so it covers lazy partial-clone fetches too
+    but is never written to a repository's config or shown in the process
+    list. Returns None (inherit the environment) without a token.
+    """
+    github_token = os.environ.get('GITHUB_TOKEN')
+    if not github_token:
+        return None
+    env = dict(os.environ)
+    index = int(env.get('GIT_CONFIG_COUNT') or 0)
+    credentials = base64.b64encode(f"x-access-token:{github_token}".encode()).decode()
+    env['GIT_CONFIG_COUNT'] = str(index + 1)
+    env[f'GIT_CONFIG_KEY_{index}'] = 'http.https://github.com/.extraHeader'
+    env[f'GIT_CONFIG_VALUE_{index}'] = f"Authorization: Basic {credentials}"
+    return env
+
+
+def _git(*args: str, **kwargs) -> subprocess.CompletedProcess:
+    """Run a git command (authenticated as in _git_env), raising CalledProcessError on failure."""
+    kwargs.setdefault('env', _git_env())
+    return subprocess.run(['git', *args], check=True, capture_output=True, text=True, **kwargs)
+
+
+def mirror_path(cache_dir: str, owner: str, repo: str) -> Path:
+    """Location of the bare mirror for owner/repo: <cache>/<owner>/<repo>.git"""
+    return Path(cache_dir).expanduser() / owner / f"{repo}.git"
+
+
+def update_mirror(
+    cache_dir: str,
+    owner: str,
+    repo: str,
+    branch: str,
+    max_age: Optional[float] = None,
+    commit: Optional[str] = None,
+    offline: bool = False
+) -> tuple[Path, str]:
+    """
+    Make sure the local mirror has a fresh copy of a branch.
+    
+    The mirror is a bare, blobless clone (--filter=blob:none): it holds
+    commits and trees but fetches file contents only when a skill needs
+    them. An existing mirror is refreshed with an incremental fetch of just
+    the requested branch, and only when the last fetch is older than max_age
+    (MIRROR_MAX_AGE seconds by default).
+    
+    With commit set (a locked install), that commit is used instead of the
+    branch head, and nothing is fetched if the mirror already has it.
+    
+    With offline set nothing is fetched at all; the mirror must already
+    hold the branch (or commit), e.g. from a --prefetch run.
+    
+    Returns:
+        Tuple of (mirror path, commit SHA to install)
+    """
+    if max_age is None:
+        max_age = MIRROR_MAX_AGE
+    mirror = mirror_path(cache_dir, owner, repo)
+    repo_url = build_repo_url(owner, repo)
+    
+    with _path_lock(mirror):
+        if commit and mirror.exists() and _has_commit(mirror, commit):
+            return mirror, commit
+        
+        if offline:
+            if commit or not mirror.exists() or not _has_commit(mirror, f"refs/heads/{branch}"):
+                raise FileNotFoundError(
+                    f"{owner}/{repo}@{commit or branch} is not in the mirror cache; "
+                    "run --prefetch first or drop --offline"
+                )
+            return mirror, _git('-C', str(mirror), 'rev-parse', f"refs/heads/{branch}^{{commit}}").stdout.strip()
+        
+        if not mirror.exists():
+            # Clone next to the final location and rename into place, so a
+            # concurrent or interrupted clone never leaves a half-built mirror
+            mirror.parent.mkdir(parents=True, exist_ok=True)
+            staging = tempfile.mkdtemp(prefix=f"{mirror.name}.tmp-", dir=mirror.parent)
+            print(f"Creating mirror of {owner}/{repo} in {mirror}...")
+            try:
+                _git('clone', '--bare', '--filter=blob:none', '--no-tags', repo_url, staging)
+                Path(staging).rename(mirror)
+            except OSError:
+                # Another installer won the race; use its mirror
+                pass
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+        
+        # Installers and the prefetch daemon may be separate processes
+        with _file_lock(mirror / MIRROR_LOCK):
+            # One timestamp file per branch records when it was last fetched
+            stamp = mirror / 'fetch-stamps' / quote(branch, safe='')
+            fresh = stamp.exists() and time.time() - stamp.stat().st_mtime < max_age
+            if not fresh:
+                _git('-C', str(mirror), 'fetch', '--no-tags', '--filter=blob:none', repo_url,
+                     f"+refs/heads/{branch}:refs/heads/{branch}")
+                stamp.parent.mkdir(exist_ok=True)
+                stamp.touch()
+            
+            if commit:
+                # A pinned commit that is no longer the branch head
+                if not _has_commit(mirror, commit):
+                    _git('-C', str(mirror), 'fetch', '--no-tags', '--filter=blob:none', repo_url, commit)
+                return mirror, commit
+            
+            commit = _git('-C', str(mirror), 'rev-parse', f"refs/heads/{branch}^{{commit}}").stdout.strip()
+    return mirror, commit
+
+
+def _has_commit(repo: Path, commit: str) -> bool:
+    """Whether a repository already contains a commit object."""
+    return subprocess.run(
+        ['git', '-C', str(repo), 'cat-file', '-e', f"{commit}^{{commit}}"],
+        capture_output=True
+    ).returncode == 0
+
+
+def resolve_trees(mirror: Path, commit: str, skill_paths: list[str]) -> dict[str, str]:
+    """Map each skill path to its tree id in commit, leaving out paths that do not exist."""
+    trees = {}
+    for skill_path in skill_paths:
+        try:
+            trees[skill_path] = _git('-C', str(mirror), 'rev-parse', f"{commit}:{skill_path}").stdout.strip()
+        except subprocess.CalledProcessError:
+            continue
+    return trees
+
+
+def fetch_missing_blobs(
+    repo_dir: Path,
+    roots: list[str],
+    only: Optional[set[str]] = None,
+    offline: bool = False
+) -> int:
+    """
+    Download, in one batch, the blobs under roots that a blobless repository lacks.
+    
+    Uses the same request git makes for lazy partial-clone fetches, but for
+    all objects at once instead of one round trip per file.
+    
+    Args:
+        repo_dir: Blobless (partial) clone or mirror
+        roots: Tree or commit ids whose blobs are needed
+        only: If given, only these object ids are wanted
+        offline: Raise FileNotFoundError instead of fetching
+        
+    Returns:
+        Number of blobs downloaded
+    """
+    # List objects under the roots, marking the ones not yet downloaded
+    listing = _git('-C', str(repo_dir), 'rev-list', '--objects', '--missing=print', *roots).stdout
+    missing = [
+        line[1:] for line in listing.splitlines()
+        if line.startswith('?') and (only is None or line[1:] in only)
+    ]
+    if missing and offline:
+        raise FileNotFoundError(f"{len(missing)} file(s) were not prefetched into the mirror cache")
+    if missing:
+        _git('-C', str(repo_dir), '-c', 'fetch.negotiationAlgorithm=noop', 'fetch', 'origin',
+             '--no-tags', '--no-write-fetch-head', '--recurse-submodules=no',
+             '--filter=blob:none', '--stdin', input='\n'.join(missing) + '\n')
+    return len(missing)
+
+
+def export_from_mirror(mirror: Path, trees: dict[str, str], dest: str) -> None:
+    """
+    Extract skill trees ({skill_path: tree id}) from a mirror into dest.
+    
+    Blobs under the trees that the mirror does not have yet are fetched in
+    a single batch, then each directory is streamed out with git archive.
+    """
+    if not trees:
+        return
+    fetch_missing_blobs(mirror, list(trees.values()))
+    
+    for skill_path, tree in trees.items():
+        # Stream the archive straight into tarfile - nothing large touches disk.
+        # Archiving the skill's tree object (rather than commit + pathspec)
+        # keeps git from reading anything outside the skill directory.
+        proc = subprocess.Popen(
+            ['git', '-C', str(mirror), 'archive', '--format=tar', f"--prefix={skill_path}/", tree],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=_git_env()
+        )
+        with tarfile.open(fileobj=proc.stdout, mode='r|') as archive:
+            archive.extractall(dest, filter='tar')
+        stderr = proc.stderr.read().decode()
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args, stderr=stderr)
+
+
+def _hash_object(kind: str, size: int, chunks) -> str:
+    """git object id: sha1 of '<kind> <size>\\0' followed by the content."""
+    digest = hashlib.sha1(f"{kind} {size}\0".encode())
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_chunks(path: str, size: int = 1 << 20):
+    with open(path, 'rb') as f:
+        while chunk := f.read(size):
+            yield chunk
+
+
+def git_tree_hash(path) -> str:
+    """
+    Compute the git tree id of a directory without running git.
+    
+    Produces the same id as `git rev-parse <commit>:<dir>` for the checked
+    out directory: file modes 100644/100755, symlinks as 120000, nested
+    trees as 40000, entries in git's order (directories sort as if their
+    name ended in '/'). Empty directories are left out, as in git.
+    """
+    entries = []
+    for entry in os.scandir(path):
+        if entry.is_symlink():
+            target = os.readlink(entry.path).encode()
+            mode, oid = '120000', _hash_object('blob', len(target), [target])
+        elif entry.is_dir():
+            if entry.name == '.git':
+                continue
+            mode, oid = '40000', git_tree_hash(entry.path)
+            if oid == EMPTY_TREE:
+                continue
+        else:
+            st = entry.stat()
+            mode = '100755' if st.st_mode & stat.S_IXUSR else '100644'
+            oid = _hash_object('blob', st.st_size, _read_chunks(entry.path))
+        sort_key = entry.name.encode() + (b'/' if mode == '40000' else b'')
+        entries.append((sort_key, f"{mode} {entry.name}".encode() + b'\0' + bytes.fromhex(oid)))
+    
+    body = b''.join(raw for _, raw in sorted(entries))
+    return _hash_object('tree', len(body), [body])
+
+
+def _index_files(path) -> dict[str, tuple[str, str]]:
+    """Map each file under path (relative, '/'-separated) to its git (mode, blob id)."""
+    index = {}
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d != '.git' and not os.path.islink(os.path.join(root, d))]
+        links = [d for d in os.listdir(root) if os.path.islink(os.path.join(root, d))]
+        for name in set(files) | set(links):
+            file_path = os.path.join(root, name)
+            rel = os.path.relpath(file_path, path).replace(os.sep, '/')
+            if os.path.islink(file_path):
+                target = os.readlink(file_path).encode()
+                index[rel] = ('120000', _hash_object('blob', len(target), [target]))
+            else:
+                st = os.stat(file_path)
+                mode = '100755' if st.st_mode & stat.S_IXUSR else '100644'
+                index[rel] = (mode, _hash_object('blob', st.st_size, _read_chunks(file_path)))
+    return index
+
+
+def store_entry(store_dir: str, tree: str) -> Path:
+    """Location of a skill version in the store: <store>/<tree[:2]>/<tree>"""
+    return Path(store_dir).expanduser() / tree[:2] / tree
+
+
+def store_skill(store_dir: str, src_skill_dir: Path, tree: Optional[str] = None) -> Path:
+    """
+    Add a skill directory to the content-addressed store if it is not there yet.
+    
+    The entry is staged next to its final location and renamed into place,
+    then made read-only so hardlinked installs cannot modify it.
+    
+    Returns:
+        Path to the store entry
+    """
+    entry = store_entry(store_dir, tree or git_tree_hash(src_skill_dir))
+    with _path_lock(entry):
+        if not entry.exists():
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            staging = tempfile.mkdtemp(prefix=f"{entry.name}.tmp-", dir=entry.parent)
+            try:
+                shutil.copytree(src_skill_dir, staging, symlinks=True, dirs_exist_ok=True)
+                for root, _, files in os.walk(staging):
+                    for name in files:
+                        file_path = os.path.join(root, name)
+                        if not os.path.islink(file_path):
+                            os.chmod(file_path, os.stat(file_path).st_mode & ~0o222)
+                Path(staging).rename(entry)
+            except OSError:
+                # Another installer stored the same tree first
+                pass
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+    return entry
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink a file, copying it when the store is on another filesystem."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def parse_source(source: str) -> tuple[str, str, str, str]:
+    """
+    Parse a prefetch source into (owner, repo, branch, path).
+    
+    A source is either a skill URL in any format fetch_skill accepts, or a
+    whole repository as owner/repo[@branch], for which path is ''.
+    """
+    repo_part, _, branch = source.partition('@')
+    parts = re.sub(r'^(https?://)?(github\.com/)?', '', repo_part).strip('/').split('/')
+    if len(parts) == 2:
+        return parts[0], parts[1].removesuffix('.git'), branch or 'main', ''
+    return parse_github_url(source)
+
+
+def prefetch(
+    sources: list[str],
+    cache_dir: str,
+    interval: float = PREFETCH_INTERVAL,
+    once: bool = False,
+    max_workers: int = FETCH_WORKERS
+) -> list[tuple[str, str]]:
+    """
+    Keep the mirror cache warm for a list of sources.
+    
+    Every cycle fetches the branch of each source into its mirror and then
+    downloads the blobs under the source's skill path (the whole branch for
+    an owner/repo source). Installs with cache_dir therefore find the
+    mirror fresh and complete, and offline installs can be served from it.
+    A failing source is reported and retried on the next cycle.
+    
+    Args:
+        sources: Skill URLs or owner/repo[@branch] strings
+        cache_dir: Mirror cache directory shared with the installers
+        interval: Seconds between cycles
+        once: Run a single cycle and return
+        max_workers: Maximum number of repositories fetched concurrently
+        
+    Returns:
+        Errors of the last cycle as (source, message) pairs
+    """
+    targets: dict[tuple[str, str, str], set[str]] = {}
+    for source in sources:
+        owner, repo, branch, path = parse_source(source)
+        targets.setdefault((owner, repo, branch), set()).add(path)
+    
+    def refresh(target):
+        (owner, repo, branch), paths = target
+        try:
+            mirror, commit = update_mirror(cache_dir, owner, repo, branch, max_age=0)
+            if '' in paths:
+                trees = {'': f"{commit}^{{tree}}"}
+            else:
+                trees = resolve_trees(mirror, commit, sorted(paths))
+            count = fetch_missing_blobs(mirror, list(trees.values())) if trees else 0
+            print(f"✅ Prefetched {owner}/{repo}@{branch} ({commit[:12]}, {count} new file(s))")
+            if len(trees) < len(paths):
+                missing = ', '.join(sorted(paths - trees.keys()))
+                return f"{owner}/{repo}@{branch}", f"skill path(s) not found: {missing}"
+        except subprocess.CalledProcessError as e:
+            return f"{owner}/{repo}@{branch}", (e.stderr or str(e)).strip()
+        except Exception as e:
+            return f"{owner}/{repo}@{branch}", str(e)
+        return None
+    
+    while True:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as pool:
+            errors = [error for error in pool.map(refresh, targets.items()) if error]
+        for source, message in errors:
+            print(f"⚠️  Prefetch of {source} failed: {message}")
+        if once:
+            return errors
+        time.sleep(interval)
+
+
+def load_manifest(manifest_path: str) -> list[str]:
+    """
+    Read skill URLs from a manifest file.
+    
+    A manifest is either a JSON list of URLs (optionally wrapped as
+    {"skills": [...]}) or a text file with one URL per line, where blank
+    lines and '#' comments are ignored.
+    """
+    text = Path(manifest_path).read_text()
+    if text.lstrip().startswith(('[', '{')):
+        data = json.loads(text)
+        return list(data['skills'] if isinstance(data, dict) else data)
+    urls = []
+    for line in text.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if line:
+            urls.append(line)
+    return urls
+
+
+def build_archive_url(owner: str, repo: str, ref: str) -> str:
+    """Tarball URL for a branch or commit of a GitHub repository."""
+    return f"https://codeload.github.com/{owner}/{repo}/tar.gz/{ref}"
+
+
+def _open_url(url: str):
+    """Open an archive URL, authenticating to GitHub with GITHUB_TOKEN if set."""
+    request = urllib.request.Request(url)
+    github_token = os.environ.get('GITHUB_TOKEN')
+    host = urllib.parse.urlparse(url).hostname or ''
+    if github_token and (host == 'github.com' or host.endswith('.github.com')):
+        request.add_header('Authorization', f"token {github_token}")
+    return urllib.request.urlopen(request, timeout=ARCHIVE_TIMEOUT)
+
+
+def _strip_top_dir(name: str) -> Optional[str]:
+    """Archive member path without the single top-level directory, or None for the top itself."""
+    parts = name.strip('/').split('/', 1)
+    return parts[1] if len(parts) == 2 and parts[1] else None
+
+
+def download_archive(
+    owner: str,
+    repo: str,
+    branch: str,
+    skill_paths: list[str],
+    tmpdir: str,
+    commit: Optional[str] = None
+) -> str:
+    """
+    Archive transport: extract skill_paths from a repository archive into tmpdir.
+    
+    A tar.gz archive is read straight off the response in tarfile's stream
+    mode, so the archive itself never touches disk and entries outside the
+    skill paths are skipped as they go by. Zip archives need random access,
+    so they are only supported as local files. The archive's top-level
+    directory (e.g. repo-main/) is stripped.
+    
+    Returns:
+        The commit SHA git archive recorded in the archive, or '' if none
+    """
+    url = build_archive_url(owner, repo, commit or branch)
+    prefixes = tuple(skill_path.rstrip('/') + '/' for skill_path in skill_paths)
+    if urllib.parse.urlparse(url).path.endswith('.zip'):
+        return _extract_zip(url, prefixes, tmpdir)
+    
+    with _open_url(url) as response, tarfile.open(fileobj=response, mode='r|gz') as archive:
+        for member in archive:
+            rel = _strip_top_dir(member.name)
+            if rel is None or not (rel + '/').startswith(prefixes):
+                continue
+            member.name = rel
+            archive.extract(member, tmpdir, filter='tar')
+        return archive.pax_headers.get('comment', '')
+
+
+def _extract_zip(url: str, prefixes: tuple[str, ...], tmpdir: str) -> str:
+    """Extract the entries under prefixes from a local zip archive; returns its commit comment."""
+    parsed = urllib.parse.urlparse(url)
+    if parsed.scheme not in ('', 'file'):
+        raise ValueError(f"zip archives need random access; only local files are supported: {url}")
+    
+    root = Path(tmpdir).resolve()
+    with zipfile.ZipFile(urllib.request.url2pathname(parsed.path)) as archive:
+        for info in archive.infolist():
+            rel = _strip_top_dir(info.filename)
+            if rel is None or not (rel + '/').startswith(prefixes):
+                continue
+            target = root / rel
+            if not target.resolve().is_relative_to(root):
+                raise ValueError(f"Refusing to extract '{info.filename}' outside the target directory")
+            mode = info.external_attr >> 16
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if stat.S_ISLNK(mode):
+                os.symlink(archive.read(info).decode(), target)
+            else:
+                with archive.open(info) as src, open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                if mode & stat.S_IXUSR:
+                    target.chmod(0o755)
+        return archive.comment.decode(errors='replace')
+
+
+def _git_transport(
+    owner: str,
+    repo: str,
+    branch: str,
+    skill_paths: list[str],
+    tmpdir: str,
+    commit: Optional[str] = None
+) -> str:
+    """Git transport: sparse checkout of skill_paths into tmpdir."""
+    return _sparse_clone(build_repo_url(owner, repo), branch, skill_paths, tmpdir, commit)
+
+
+# Download backends selectable with fetch_skills(transport=...) / --transport.
+# Each is called as transport(owner, repo, branch, skill_paths, tmpdir, commit),
+# leaves the skill directories under tmpdir and returns the commit SHA it
+# downloaded ('' if unknown). With cache_dir, 'git' is served by the mirror.
+TRANSPORTS = {
+    'git': _git_transport,
+    'archive': download_archive,
+}
+
+
+def read_lockfile(workspace_path: str) -> dict:
+    """Load <workspace>/.agents/skills.lock, or an empty lock if there is none."""
+    lock_path = Path(workspace_path) / LOCKFILE
+    if not lock_path.exists():
+        return {'version': LOCKFILE_VERSION, 'skills': {}}
+    return json.loads(lock_path.read_text())
+
+
+def write_lockfile(workspace_path: str, lock: dict) -> None:
+    """Write the lockfile atomically (temp file + rename) so readers never see half of it."""
+    lock_path = Path(workspace_path) / LOCKFILE
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='skills.lock.', dir=lock_path.parent)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(lock, f, indent=2, sort_keys=True)
+            f.write('\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, lock_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@contextmanager
+def _file_lock(lock_path: Path):
+    """Hold an advisory lock on lock_path (created if missing) across processes."""
+    with open(lock_path, 'a') as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@contextmanager
+def workspace_lock(workspace_path: str):
+    """
+    Hold the workspace's advisory install lock for the duration of the block.
+    
+    Installers in other processes (and threads) targeting the same workspace
+    wait here, then see what the previous one installed instead of
+    downloading it again. Once the lock is held, leftovers of an interrupted
+    install are cleaned up.
+    """
+    lock_path = Path(workspace_path) / INSTALL_LOCK
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with _file_lock(lock_path):
+        recover_interrupted(Path(workspace_path) / '.agents' / 'skills')
+        yield
+
+
+def recover_interrupted(skills_dir: Path) -> None:
+    """
+    Clean up after installs that crashed part-way; call with the workspace lock held.
+    
+    Staging directories are discarded (after an exchange they may hold the
+    replaced version). A version that _swap_in moved aside is put back if
+    the crash came before the new version was renamed into place, and
+    deleted otherwise.
+    """
+    if not skills_dir.is_dir():
+        return
+    for entry in skills_dir.iterdir():
+        match = _SWAP_DIR.match(entry.name)
+        if not match or not entry.is_dir():
+            continue
+        dest_dir = skills_dir / match['name']
+        if match['kind'] == 'old' and not dest_dir.exists():
+            print(f"Restoring '{dest_dir.name}' after an interrupted install")
+            entry.rename(dest_dir)
+        else:
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def fetch_skill(
+    github_url: str,
+    workspace_path: str,
+    force: bool = False,
+    cache_dir: Optional[str] = None,
+    store_dir: Optional[str] = None,
+    transport: str = 'git',
+    offline: bool = False
+) -> str:
     """
     Fetch a skill from GitHub and install it to the workspace.
     
@@ -101,114 +836,595 @@ def fetch_skill(github_url: str, workspace_path: str, force: bool = False) -> st
         github_url: URL to the skill on GitHub (various formats supported)
         workspace_path: Path to the workspace root directory
         force: If True, overwrite existing skill with same name
+        cache_dir: If set, install through a persistent mirror cache in this
+                   directory instead of a throwaway clone
+        store_dir: If set, keep the skill in this content-addressed store
+                   and install it as hardlinks
+        transport: Download backend from TRANSPORTS ('git' or 'archive')
+        offline: Serve the install from the mirror cache only, never the network
         
     Returns:
         Path to the installed skill directory
         
     Raises:
-        SystemExit: If skill already exists (without --force), path not found,
-                    or skill is invalid (no SKILL.md)
+        SystemExit: If skill already exists (without --force)
+        SkillFetchError: If the download fails, the path is not found, or
+                         the skill is invalid (no SKILL.md)
     """
-    # Parse the URL to get repository details
-    owner, repo, branch, skill_path = parse_github_url(github_url)
+    return fetch_skills([github_url], workspace_path, force, cache_dir,
+                        store_dir=store_dir, transport=transport, offline=offline)[0]
+
+
+def fetch_skills(
+    github_urls: list[str],
+    workspace_path: str,
+    force: bool = False,
+    cache_dir: Optional[str] = None,
+    max_workers: int = FETCH_WORKERS,
+    store_dir: Optional[str] = None,
+    transport: str = 'git',
+    offline: bool = False
+) -> list[str]:
+    """
+    Fetch several skills from GitHub and install them to the workspace.
+    
+    URLs are grouped by (owner, repo, branch) so that each repository is
+    cloned once, with every requested skill path in a single sparse
+    checkout. Up to max_workers repositories are fetched at the same time,
+    and the downloaded skills are copied into place in parallel. A failing
+    repository does not stop the others; all failures are raised together
+    at the end.
+    
+    Installs are recorded in .agents/skills.lock. A skill already in the
+    lock is installed at its locked commit, and is skipped entirely when
+    its installed files still match the locked tree hash.
     
-    # Extract skill name from the path (last component)
-    # e.g., "skills/docker" -> "docker"
-    skill_name = skill_path.rstrip('/').split('/')[-1]
+    Args:
+        github_urls: URLs to the skills on GitHub (various formats supported)
+        workspace_path: Path to the workspace root directory
+        force: If True, overwrite existing skills with the same names
+        cache_dir: If set, install through a persistent mirror cache in this
+                   directory instead of throwaway clones
+        max_workers: Maximum number of repositories fetched concurrently
+        store_dir: If set, keep skills in this content-addressed store and
+                   install them as hardlinks
+        transport: Download backend from TRANSPORTS ('git' or 'archive');
+                   the mirror cache only applies to 'git'
+        offline: Serve installs from the mirror cache only (requires
+                 cache_dir and the git transport); nothing is fetched
+        
+    Returns:
+        Paths to the installed skill directories, in the order requested
+        
+    Raises:
+        SystemExit: If a skill already exists (without --force) or is
+                    requested twice (checked before anything is downloaded)
+        SkillFetchError: If any repository failed to download or contained
+                         a missing or invalid skill
+    """
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown transport '{transport}' (expected one of: {', '.join(TRANSPORTS)})")
+    if offline and (not cache_dir or transport != 'git'):
+        raise ValueError("offline installs are served from the mirror cache: set cache_dir and use the git transport")
     
-    # Determine the destination directory
+    with workspace_lock(workspace_path):
+        return _fetch_skills_locked(
+            github_urls, workspace_path, force, cache_dir, max_workers, store_dir, transport, offline
+        )
+
+
+def _fetch_skills_locked(
+    github_urls: list[str],
+    workspace_path: str,
+    force: bool,
+    cache_dir: Optional[str],
+    max_workers: int,
+    store_dir: Optional[str],
+    transport: str,
+    offline: bool
+) -> list[str]:
+    """Body of fetch_skills(), run with the workspace lock held."""
     # Skills are installed to: <workspace>/.agents/skills/<skill-name>/
-    dest_dir = Path(workspace_path) / '.agents' / 'skills' / skill_name
+    skills_dir = Path(workspace_path) / '.agents' / 'skills'
+    
+    lock = read_lockfile(workspace_path)
     
-    # Check if skill already exists - prevent accidental overwrites
-    if dest_dir.exists():
-        if not force:
+    # Parse every URL and group the skills by repository branch (and locked commit)
+    groups: dict[tuple[str, str, str, Optional[str]], list[tuple[str, Path]]] = {}
+    dest_dirs = []
+    for github_url in github_urls:
+        owner, repo, branch, skill_path = parse_github_url(github_url)
+        
+        # Extract skill name from the path (last component)
+        # e.g., "skills/docker" -> "docker"
+        skill_name = skill_path.rstrip('/').split('/')[-1]
+        dest_dir = skills_dir / skill_name
+        
+        if dest_dir in dest_dirs:
+            print(f"❌ Skill '{skill_name}' is requested more than once")
+            sys.exit(1)
+        
+        # A locked skill is pinned to its commit, and needs no work at all
+        # while the installed files still match the locked tree hash.
+        # --force ignores the lock and reinstalls the branch head.
+        pinned = None
+        locked = None if force else lock['skills'].get(skill_name)
+        if locked and (locked['source'], locked['path'], locked['branch']) == (f"{owner}/{repo}", skill_path, branch):
+            if dest_dir.exists() and git_tree_hash(dest_dir) == locked['tree']:
+                print(f"✅ '{skill_name}' is up to date with {LOCKFILE} ({locked['commit'][:12]})")
+                dest_dirs.append(dest_dir)
+                continue
+            pinned = locked['commit'] or None
+        
+        # Check if skill already exists - prevent accidental overwrites
+        if dest_dir.exists() and not force:
             print(f"⚠️  Skill '{skill_name}' already exists at {dest_dir}")
             print("   Use --force to overwrite")
             sys.exit(1)
-        print(f"Removing existing skill at {dest_dir}")
-        shutil.rmtree(dest_dir)
+        
+        dest_dirs.append(dest_dir)
+        groups.setdefault((owner, repo, branch, pinned), []).append((skill_path, dest_dir))
+    
+    if not groups:
+        return [str(dest_dir) for dest_dir in dest_dirs]
     
     # Ensure the parent directory exists (.agents/skills/)
-    dest_dir.parent.mkdir(parents=True, exist_ok=True)
+    skills_dir.mkdir(parents=True, exist_ok=True)
+    
+    def install(group):
+        (owner, repo, branch, pinned), skills = group
+        try:
+            return _install_from_repo(
+                owner, repo, branch, skills, cache_dir, store_dir, pinned, transport, offline
+            ), None
+        except subprocess.CalledProcessError as e:
+            return {}, (f"{owner}/{repo}@{branch}", (e.stderr or str(e)).strip())
+        except Exception as e:
+            return {}, (f"{owner}/{repo}@{branch}", str(e))
+    
+    errors = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(groups)))) as pool:
+        for records, error in pool.map(install, groups.items()):
+            lock['skills'].update(records)
+            if error:
+                errors.append(error)
+    
+    # Record whatever was installed, even if other repositories failed
+    write_lockfile(workspace_path, lock)
+    if errors:
+        raise SkillFetchError(errors)
+    
+    return [str(dest_dir) for dest_dir in dest_dirs]
+
+
+def _install_from_repo(
+    owner: str,
+    repo: str,
+    branch: str,
+    skills: list[tuple[str, Path]],
+    cache_dir: Optional[str],
+    store_dir: Optional[str] = None,
+    commit: Optional[str] = None,
+    transport: str = 'git',
+    offline: bool = False
+) -> dict[str, dict]:
+    """
+    Download the (skill_path, dest_dir) pairs of one repository branch and install them.
+    
+    Installs the branch head, or commit when one is given, through the named
+    transport (the mirror, for 'git' with cache_dir). Returns the lockfile records of the
+    installed skills, keyed by skill name.
+    """
+    skill_paths = [skill_path for skill_path, _ in skills]
+    trees: dict[str, str] = {}
+    src_dirs: dict[str, Path] = {}
+    names = ', '.join(dest_dir.name for _, dest_dir in skills)
     
     # Use a temporary directory for the git clone operation
     # This keeps the workspace clean and handles cleanup automatically
     with tempfile.TemporaryDirectory() as tmpdir:
-        # Build the repository URL
-        repo_url = f"https://github.com/{owner}/{repo}.git"
+        if len(skills) == 1:
+            print(f"Fetching skill '{names}' from {owner}/{repo}...")
+        else:
+            print(f"Fetching {len(skills)} skills ({names}) from {owner}/{repo}...")
         
-        # If GITHUB_TOKEN is available, use it for authentication
-        # This enables access to private repositories
-        github_token = os.environ.get('GITHUB_TOKEN')
-        if github_token:
-            repo_url = f"https://{github_token}@github.com/{owner}/{repo}.git"
+        if cache_dir and transport == 'git':
+            # Serve the install from the local mirror (fetching only if stale)
+            mirror, commit = update_mirror(cache_dir, owner, repo, branch, commit=commit, offline=offline)
+            trees = resolve_trees(mirror, commit, skill_paths)
+            if store_dir:
+                # Versions already in the store need no download at all
+                for skill_path, tree in trees.items():
+                    if store_entry(store_dir, tree).exists():
+                        src_dirs[skill_path] = store_entry(store_dir, tree)
+            wanted = {p: t for p, t in trees.items() if p not in src_dirs}
+            if offline and wanted:
+                # Fail rather than fall back to lazy blob fetches
+                fetch_missing_blobs(mirror, list(wanted.values()), offline=True)
+            export_from_mirror(mirror, wanted, tmpdir)
+        else:
+            commit = TRANSPORTS[transport](owner, repo, branch, skill_paths, tmpdir, commit)
         
-        print(f"Fetching skill '{skill_name}' from {owner}/{repo}...")
-        
-        # ============================================================
-        # Git Sparse Checkout Process
         # ============================================================
-        # Sparse checkout allows us to download only specific directories
-        # from a repository, rather than the entire repo. This is much
-        # faster and uses less bandwidth/disk space.
-        #
-        # The process:
-        # 1. Clone with --filter=blob:none (don't download file contents yet)
-        # 2. Clone with --no-checkout (don't populate working directory)
-        # 3. Clone with --depth=1 (only get latest commit, no history)
-        # 4. Initialize sparse-checkout in cone mode
-        # 5. Set the specific path we want
-        # 6. Checkout to actually download just those files
+        # Validation and Installation
         # ============================================================
         
-        # Step 1: Clone the repo skeleton (metadata only, no file contents)
-        subprocess.run(
-            ['git', 'clone', '--filter=blob:none', '--no-checkout', '--depth=1',
-             '--branch', branch, repo_url, tmpdir],
-            check=True, capture_output=True, text=True
-        )
+        for skill_path in skill_paths:
+            src_skill_dir = src_dirs.setdefault(skill_path, Path(tmpdir) / skill_path)
+            
+            # Verify the skill path exists in the downloaded content
+            if not src_skill_dir.exists():
+                raise FileNotFoundError(f"Skill path '{skill_path}' not found in repository")
+            
+            # Verify this is a valid skill by checking for SKILL.md
+            # Every valid OpenHands skill must have a SKILL.md file
+            if not (src_skill_dir / 'SKILL.md').exists():
+                raise FileNotFoundError(f"No SKILL.md found in '{skill_path}' - not a valid skill")
         
-        # Step 2: Initialize sparse checkout in "cone" mode
-        # Cone mode is more efficient and works with directory patterns
-        subprocess.run(
-            ['git', '-C', tmpdir, 'sparse-checkout', 'init', '--cone'],
-            check=True, capture_output=True, text=True
-        )
+        # Copy the skill directories to their destinations in parallel
+        def install(item):
+            skill_path, dest_dir = item
+            src_skill_dir = src_dirs[skill_path]
+            tree = trees.get(skill_path) or git_tree_hash(src_skill_dir)
+            if store_dir:
+                src_skill_dir = store_skill(store_dir, src_skill_dir, tree)
+            _copy_skill(src_skill_dir, dest_dir, link=bool(store_dir))
+            return dest_dir.name, {
+                'source': f"{owner}/{repo}",
+                'path': skill_path,
+                'branch': branch,
+                'commit': commit,
+                'tree': tree,
+            }
         
-        # Step 3: Specify which directory we want to download
-        subprocess.run(
-            ['git', '-C', tmpdir, 'sparse-checkout', 'set', skill_path],
-            check=True, capture_output=True, text=True
-        )
-        
-        # Step 4: Checkout - this actually downloads the files we specified
-        subprocess.run(
-            ['git', '-C', tmpdir, 'checkout'],
-            check=True, capture_output=True, text=True
-        )
-        
-        # ============================================================
-        # Validation and Installation
-        # ============================================================
+        with ThreadPoolExecutor(max_workers=min(COPY_WORKERS, len(skills))) as pool:
+            records = dict(pool.map(install, skills))
+    
+    for _, dest_dir in skills:
+        print(f"✅ Successfully installed '{dest_dir.name}' to {dest_dir}")
+    return records
+
+
+def _copy_skill(src_skill_dir: Path, dest_dir: Path, link: bool = False) -> None:
+    """
+    Copy (or hardlink, with link=True) one skill into place.
+    
+    The copy is staged in a hidden sibling directory and swapped in by
+    rename, so an existing install stays intact until the new one is
+    complete. Symlinks are kept as links so the install matches the locked
+    tree hash.
+    """
+    with _path_lock(dest_dir):
+        staging = Path(tempfile.mkdtemp(prefix=f".{dest_dir.name}.install-", dir=dest_dir.parent))
+        try:
+            shutil.copytree(
+                src_skill_dir, staging, symlinks=True, dirs_exist_ok=True,
+                copy_function=_link_or_copy if link else shutil.copy2
+            )
+            if dest_dir.exists():
+                print(f"Replacing existing skill at {dest_dir}")
+            _swap_in(staging, dest_dir)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def update_skills(
+    workspace_path: str,
+    names: Optional[list[str]] = None,
+    cache_dir: Optional[str] = None,
+    store_dir: Optional[str] = None,
+    max_workers: int = FETCH_WORKERS,
+    offline: bool = False
+) -> list[str]:
+    """
+    Update locked skills to the head of their branch, transferring only changed files.
+    
+    For each repository the new tree is listed from a blobless clone (or
+    the mirror) and compared with the installed files; only blobs that are
+    new or different are downloaded. The new version is staged next to the
+    installed one, with unchanged files hardlinked across, and swapped in by
+    rename so agents never see a half-updated skill.
+    
+    Args:
+        workspace_path: Path to the workspace root directory
+        names: Skill names to update (default: every skill in the lockfile)
+        cache_dir: If set, read the remote state through this mirror cache
+        store_dir: If set, reuse and populate this content-addressed store
+        max_workers: Maximum number of repositories checked concurrently
+        offline: Update to what the mirror cache already holds (e.g. from
+                 --prefetch) without fetching; requires cache_dir
         
-        # Verify the skill path exists in the downloaded content
-        src_skill_dir = Path(tmpdir) / skill_path
-        if not src_skill_dir.exists():
-            print(f"❌ Skill path '{skill_path}' not found in repository")
-            sys.exit(1)
+    Returns:
+        Paths of the skills that changed
         
-        # Verify this is a valid skill by checking for SKILL.md
-        # Every valid OpenHands skill must have a SKILL.md file
-        if not (src_skill_dir / 'SKILL.md').exists():
-            print(f"❌ No SKILL.md found in '{skill_path}' - not a valid skill")
-            sys.exit(1)
+    Raises:
+        SkillFetchError: If a skill is not locked, or any repository failed
+    """
+    if offline and not cache_dir:
+        raise ValueError("offline updates are served from the mirror cache: set cache_dir")
+    with workspace_lock(workspace_path):
+        return _update_skills_locked(workspace_path, names, cache_dir, store_dir, max_workers, offline)
+
+
+def _update_skills_locked(
+    workspace_path: str,
+    names: Optional[list[str]],
+    cache_dir: Optional[str],
+    store_dir: Optional[str],
+    max_workers: int,
+    offline: bool
+) -> list[str]:
+    """Body of update_skills(), run with the workspace lock held."""
+    lock = read_lockfile(workspace_path)
+    names = names or sorted(lock['skills'])
+    unknown = [name for name in names if name not in lock['skills']]
+    if unknown:
+        raise SkillFetchError([(name, f"not installed from a lock entry in {LOCKFILE}") for name in unknown])
+    
+    groups: dict[tuple[str, str], dict[str, dict]] = {}
+    for name in names:
+        record = lock['skills'][name]
+        groups.setdefault((record['source'], record['branch']), {})[name] = record
+    skills_dir = Path(workspace_path) / '.agents' / 'skills'
+    
+    def update(group):
+        (source, branch), records = group
+        try:
+            return _update_from_repo(source, branch, records, skills_dir, cache_dir, store_dir, offline), None
+        except subprocess.CalledProcessError as e:
+            return {}, (f"{source}@{branch}", (e.stderr or str(e)).strip())
+        except Exception as e:
+            return {}, (f"{source}@{branch}", str(e))
+    
+    updated, errors = {}, []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(groups)))) as pool:
+        for records, error in pool.map(update, groups.items()):
+            updated.update(records)
+            if error:
+                errors.append(error)
+    
+    lock['skills'].update(updated)
+    write_lockfile(workspace_path, lock)
+    if errors:
+        raise SkillFetchError(errors)
+    return [str(skills_dir / name) for name in updated]
+
+
+def _update_from_repo(
+    source: str,
+    branch: str,
+    records: dict[str, dict],
+    skills_dir: Path,
+    cache_dir: Optional[str],
+    store_dir: Optional[str],
+    offline: bool = False
+) -> dict[str, dict]:
+    """Update the locked skills of one repository branch; returns the changed lock records."""
+    owner, repo = source.split('/', 1)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        print(f"Checking {source}@{branch} for updates...")
+        if cache_dir:
+            repo_dir, commit = update_mirror(cache_dir, owner, repo, branch, max_age=0, offline=offline)
+        else:
+            # Commits and trees only - blobs are fetched below, and only if changed
+            repo_dir = Path(tmpdir) / 'remote.git'
+            _git('clone', '--bare', '--filter=blob:none', '--depth=1', '--no-tags',
+                 '--branch', branch, build_repo_url(owner, repo), str(repo_dir))
+            commit = _git('-C', str(repo_dir), 'rev-parse', 'HEAD').stdout.strip()
         
-        # Copy the skill directory to the final destination
-        shutil.copytree(src_skill_dir, dest_dir)
+        trees = resolve_trees(repo_dir, commit, [record['path'] for record in records.values()])
+        changed = {}
+        for name, record in records.items():
+            tree = trees.get(record['path'])
+            if tree is None:
+                raise FileNotFoundError(f"Skill path '{record['path']}' not found in repository")
+            dest_dir = skills_dir / name
+            if tree == record['tree'] and dest_dir.exists():
+                print(f"✅ '{name}' is already up to date")
+                continue
+            with _path_lock(dest_dir):
+                summary = _apply_update(repo_dir, tree, dest_dir, store_dir, offline)
+            changed[name] = {**record, 'commit': commit, 'tree': tree}
+            print(f"✅ Updated '{name}' to {commit[:12]} ({summary})")
+    return changed
+
+
+def _apply_update(
+    repo_dir: Path,
+    tree: str,
+    dest_dir: Path,
+    store_dir: Optional[str],
+    offline: bool = False
+) -> str:
+    """Stage tree next to dest_dir from the installed files plus changed blobs, then swap it in."""
+    entries = {}
+    listing = _git('-C', str(repo_dir), 'ls-tree', '-r', '-z', tree).stdout
+    for item in filter(None, listing.split('\0')):
+        meta, rel = item.split('\t', 1)
+        mode, kind, oid = meta.split()
+        if kind == 'blob':
+            entries[rel] = (mode, oid)
+    
+    current = _index_files(dest_dir) if dest_dir.exists() else {}
+    changed = {rel: entry for rel, entry in entries.items() if current.get(rel) != entry}
+    added = sum(1 for rel in changed if rel not in current)
+    removed = sum(1 for rel in current if rel not in entries)
+    
+    dest_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{dest_dir.name}.update-", dir=dest_dir.parent))
+    try:
+        stored = store_entry(store_dir, tree) if store_dir else None
+        if stored and stored.exists():
+            # This version is already in the store - nothing to download
+            shutil.copytree(stored, staging, symlinks=True, copy_function=_link_or_copy, dirs_exist_ok=True)
+        else:
+            for rel in entries.keys() - changed.keys():
+                src, dst = dest_dir / rel, staging / rel
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                if src.is_symlink():
+                    os.symlink(os.readlink(src), dst)
+                else:
+                    _link_or_copy(str(src), str(dst))
+            _write_blobs(repo_dir, tree, changed, staging, offline)
+            if git_tree_hash(staging) != tree:
+                raise RuntimeError(f"Staged update of '{dest_dir.name}' does not match tree {tree}")
+            if store_dir:
+                store_skill(store_dir, staging, tree)
+        _swap_in(staging, dest_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return f"{added} added, {len(changed) - added} modified, {removed} removed"
+
+
+def _write_blobs(
+    repo_dir: Path,
+    tree: str,
+    entries: dict[str, tuple[str, str]],
+    dest: Path,
+    offline: bool = False
+) -> None:
+    """Download the blobs of entries ({path: (mode, oid)}) in one batch and write them under dest."""
+    if not entries:
+        return
+    wanted: dict[str, list[tuple[str, str]]] = {}
+    for rel, (mode, oid) in entries.items():
+        wanted.setdefault(oid, []).append((rel, mode))
+    
+    fetch_missing_blobs(repo_dir, [tree], only=set(wanted), offline=offline)
+    
+    # Stream every blob out of one cat-file process, writing each to its paths
+    proc = subprocess.Popen(
+        ['git', '-C', str(repo_dir), 'cat-file', '--batch'],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=_git_env()
+    )
+    writer = threading.Thread(
+        target=lambda: (proc.stdin.write(''.join(f"{oid}\n" for oid in wanted).encode()), proc.stdin.close())
+    )
+    writer.start()
+    try:
+        for _ in wanted:
+            oid, _kind, size = proc.stdout.readline().decode().split()
+            data = proc.stdout.read(int(size))
+            proc.stdout.read(1)
+            for rel, mode in wanted[oid]:
+                target = dest / rel
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if mode == '120000':
+                    os.symlink(data.decode(), target)
+                else:
+                    target.write_bytes(data)
+                    target.chmod(0o755 if mode == '100755' else 0o644)
+    finally:
+        writer.join()
+        proc.stdout.close()
+        proc.wait()
+
+
+def _exchange(a: Path, b: Path) -> bool:
+    """
+    Atomically swap two existing paths with renameat2(RENAME_EXCHANGE).
     
-    print(f"✅ Successfully installed '{skill_name}' to {dest_dir}")
-    return str(dest_dir)
+    Returns False if the platform or filesystem does not support it.
+    """
+    if _renameat2 is None:
+        return False
+    if _renameat2(AT_FDCWD, os.fsencode(a), AT_FDCWD, os.fsencode(b), RENAME_EXCHANGE) == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in (errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP):
+        return False
+    raise OSError(err, os.strerror(err), str(a), None, str(b))
+
+
+def _swap_in(staging: Path, dest_dir: Path) -> None:
+    """
+    Replace dest_dir with staging, then remove the old version.
+    
+    Where _exchange() works, dest_dir is never missing: the old version
+    ends up in staging's place, and a crash before it is removed leaves a
+    staging directory for recover_interrupted() to discard. Otherwise the
+    old version is renamed aside first; if the process dies between the two
+    renames, recover_interrupted() puts it back on the next run.
+    """
+    # Staging directories come from mkdtemp (0700); installs are world-readable
+    staging.chmod(0o755)
+    if not dest_dir.exists():
+        staging.rename(dest_dir)
+        return
+    if _exchange(staging, dest_dir):
+        shutil.rmtree(staging, ignore_errors=True)
+        return
+    aside = Path(tempfile.mkdtemp(prefix=f".{dest_dir.name}.old-", dir=dest_dir.parent))
+    dest_dir.rename(aside)
+    staging.rename(dest_dir)
+    shutil.rmtree(aside, ignore_errors=True)
+
+
+def _sparse_clone(
+    repo_url: str,
+    branch: str,
+    skill_paths: list[str],
+    tmpdir: str,
+    commit: Optional[str] = None
+) -> str:
+    """
+    Download only skill_paths of a branch into tmpdir with one sparse checkout.
+    
+    Checks out commit instead of the branch head when given. Returns the
+    SHA of the checked out commit.
+    """
+    # ============================================================
+    # Git Sparse Checkout Process
+    # ============================================================
+    # Sparse checkout allows us to download only specific directories
+    # from a repository, rather than the entire repo. This is much
+    # faster and uses less bandwidth/disk space.
+    #
+    # The process:
+    # 1. Clone with --filter=blob:none (don't download file contents yet)
+    # 2. Clone with --no-checkout (don't populate working directory)
+    # 3. Clone with --depth=1 (only get latest commit, no history)
+    # 4. Initialize sparse-checkout in cone mode
+    # 5. Set the specific paths we want (all skills from this repo at once)
+    # 6. Checkout to actually download just those files
+    # ============================================================
+    
+    # Step 1: Clone the repo skeleton (metadata only, no file contents)
+    subprocess.run(
+        ['git', 'clone', '--filter=blob:none', '--no-checkout', '--depth=1',
+         '--branch', branch, repo_url, tmpdir],
+        check=True, capture_output=True, text=True, env=_git_env()
+    )
+    
+    # Step 2: Initialize sparse checkout in "cone" mode
+    # Cone mode is more efficient and works with directory patterns
+    subprocess.run(
+        ['git', '-C', tmpdir, 'sparse-checkout', 'init', '--cone'],
+        check=True, capture_output=True, text=True
+    )
+    
+    # Step 3: Specify which directories we want to download
+    subprocess.run(
+        ['git', '-C', tmpdir, 'sparse-checkout', 'set', *skill_paths],
+        check=True, capture_output=True, text=True
+    )
+    
+    # Step 4: Checkout - this actually downloads the files we specified.
+    # A locked commit other than the branch head is fetched by SHA first.
+    if commit:
+        subprocess.run(
+            ['git', '-C', tmpdir, 'fetch', '--depth=1', '--filter=blob:none', 'origin', commit],
+            check=True, capture_output=True, text=True, env=_git_env()
+        )
+    subprocess.run(
+        ['git', '-C', tmpdir, 'checkout', *([commit] if commit else [])],
+        check=True, capture_output=True, text=True, env=_git_env()
+    )
+    
+    return subprocess.run(
+        ['git', '-C', tmpdir, 'rev-parse', 'HEAD'],
+        check=True, capture_output=True, text=True
+    ).stdout.strip()
 
 
 def main():
@@ -225,26 +1441,135 @@ Examples:
   %(prog)s "https://github.com/OpenHands/skills/tree/main/skills/docker" /workspace
   %(prog)s "OpenHands/skills/skills/npm" /workspace
   %(prog)s "owner/repo/my-skill" /workspace --force
+  %(prog)s "OpenHands/skills/skills/docker" "OpenHands/skills/skills/npm" /workspace
+  %(prog)s --manifest skills.txt /workspace
+  %(prog)s "OpenHands/skills/skills/npm" /workspace --cache-dir ~/.cache/skills
+  %(prog)s --update /workspace
+  %(prog)s "OpenHands/skills/skills/npm" /workspace --transport archive
+  %(prog)s --prefetch --sources sources.txt --cache-dir ~/.cache/skills
+  %(prog)s "OpenHands/skills/skills/npm" /workspace --cache-dir ~/.cache/skills --offline
         '''
     )
     parser.add_argument(
-        'url',
+        'urls',
+        nargs='*',
+        metavar='url',
         help='GitHub URL to the skill directory (supports full URLs, github.com URLs, or owner/repo/path shorthand)'
     )
     parser.add_argument(
         'workspace',
+        nargs='?',
         help='Path to the workspace root where the skill will be installed (to .agents/skills/)'
     )
     parser.add_argument(
         '--force', '-f',
         action='store_true',
-        help='Overwrite existing skill if it already exists'
+        help='Overwrite existing skill if it already exists, installing the branch head even if locked'
     )
+    parser.add_argument(
+        '--update', '-u',
+        action='store_true',
+        help='Update locked skills (all, or those given as urls) to their branch head, '
+             'downloading only changed files'
+    )
+    parser.add_argument(
+        '--prefetch',
+        action='store_true',
+        help='Keep the --cache-dir mirrors fresh for the given sources instead of installing '
+             '(positional arguments and --sources entries are skill URLs or owner/repo[@branch])'
+    )
+    parser.add_argument(
+        '--sources',
+        help='File listing prefetch sources (same format as --manifest)'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=PREFETCH_INTERVAL,
+        help=f'Seconds between prefetch cycles (default: {PREFETCH_INTERVAL})'
+    )
+    parser.add_argument(
+        '--once',
+        action='store_true',
+        help='Run a single prefetch cycle and exit (non-zero if a source failed)'
+    )
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Install or update from the --cache-dir mirror only, never the network'
+    )
+    parser.add_argument(
+        '--manifest', '-m',
+        help='File listing skill URLs to install (one per line, or a JSON list)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=FETCH_WORKERS,
+        help=f'Number of repositories to fetch concurrently (default: {FETCH_WORKERS})'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=os.environ.get('SKILL_CACHE_DIR'),
+        help='Keep a bare mirror of each repository here and install from it '
+             '(default: $SKILL_CACHE_DIR; no cache when unset)'
+    )
+    parser.add_argument(
+        '--transport',
+        choices=sorted(TRANSPORTS),
+        default='git',
+        help='Download backend: git sparse checkout, or a streamed repository archive '
+             '(no git binary needed; default: git)'
+    )
+    parser.add_argument(
+        '--store-dir',
+        default=os.environ.get('SKILL_STORE_DIR'),
+        help='Keep skills in this content-addressed store and install them as hardlinks '
+             '(default: $SKILL_STORE_DIR; plain copies when unset)'
+    )
+    
+    args = parser.parse_intermixed_args()
     
-    args = parser.parse_args()
+    if args.prefetch:
+        sources = list(args.urls) + ([args.workspace] if args.workspace else [])
+        if args.sources:
+            sources.extend(load_manifest(args.sources))
+        if not sources:
+            parser.error('--prefetch needs sources (positional or --sources)')
+        if not args.cache_dir:
+            parser.error('--prefetch needs --cache-dir (or SKILL_CACHE_DIR)')
+        try:
+            errors = prefetch(sources, args.cache_dir, args.interval, args.once, args.jobs)
+        except KeyboardInterrupt:
+            return
+        sys.exit(1 if errors else 0)
+    
+    # The last positional is the workspace; the ones before it are urls
+    urls = list(args.urls)
+    if args.workspace is None and urls:
+        args.workspace = urls.pop()
+    if args.workspace is None:
+        parser.error('the workspace argument is required')
+    if args.manifest:
+        urls.extend(load_manifest(args.manifest))
+    if not urls and not args.update:
+        parser.error('at least one url or --manifest is required')
+    if args.offline and not args.cache_dir:
+        parser.error('--offline needs --cache-dir (or SKILL_CACHE_DIR)')
     
     try:
-        fetch_skill(args.url, args.workspace, args.force)
+        if args.update:
+            names = [parse_github_url(url)[3].split('/')[-1] for url in urls]
+            update_skills(args.workspace, names or None, args.cache_dir, args.store_dir, args.jobs, args.offline)
+        else:
+            fetch_skills(urls, args.workspace, args.force, args.cache_dir, args.jobs, args.store_dir,
+                         args.transport, args.offline)
+    except SkillFetchError as e:
+        # Report every failed repository, not just the first
+        print(f"❌ {len(e.errors)} source(s) failed:")
+        for source, message in e.errors:
+            print(f"   {source}: {message}")
+        sys.exit(1)
     except subprocess.CalledProcessError as e:
         # Git command failed - show the error message from git
         print(f"❌ Git error: {e.stderr if e.stderr else e}")
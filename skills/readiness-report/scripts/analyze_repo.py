@@ -8,19 +8,55 @@ agent readiness. Outputs a JSON file with detailed criteria evaluation.
 Usage:
     python analyze_repo.py --repo-path /path/to/repo
     python analyze_repo.py --repo-path . --output /tmp/analysis.json
+    python analyze_repo.py --repo-path /mirrors/repo.git --ref main
+    python analyze_repo.py --remote https://github.com/owner/repo.git
 """
 
 import argparse
+import asyncio
 import json
-import os
 import re
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
+from functools import partial
 from pathlib import Path
 from typing import Optional
 from enum import Enum
 
 
+# External commands probed during analysis. The async entry point runs these
+# concurrently up front so pillar evaluation never waits on a subprocess.
+PROBE_COMMANDS = [
+    ["gh", "auth", "status"],
+    ["glab", "auth", "status"],
+    ["git", "log", "--oneline", "-50"],
+    ["git", "log", "-1", "--format=%ci", "--", "README.md"],
+    ["git", "rev-parse", "HEAD"],
+    ["git", "rev-parse", "--show-toplevel"],
+]
+
+# Upper bound on threads used for file I/O by concurrent async analyses
+IO_EXECUTOR_WORKERS = 8
+
+_io_executor: Optional[ThreadPoolExecutor] = None
+_io_executor_lock = threading.Lock()
+
+
+def _default_io_executor() -> ThreadPoolExecutor:
+    """Return the shared, bounded executor used by async analyses."""
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(
+                max_workers=IO_EXECUTOR_WORKERS,
+                thread_name_prefix="readiness-io"
+            )
+        return _io_executor
+
+
 class CriterionStatus(str, Enum):
     PASS = "pass"
     FAIL = "fail"
@@ -63,28 +99,239 @@ class AnalysisResult:
     total_criteria: int = 0
     repo_type: str = "application"  # library, cli, database, monorepo, application
     languages: list[str] = field(default_factory=list)
+    commit: str = ""
+
+
+# Criteria that do not apply to a repository type, with the reason shown
+SKIP_RULES = {
+    "library": [
+        ("health_checks", "Library, not a deployed service"),
+        ("progressive_rollout", "Not applicable for a library"),
+        ("rollback_automation", "Not applicable for a library"),
+        ("dast_scanning", "Library, not a web service"),
+        ("alerting_configured", "Library without runtime"),
+        ("deployment_observability", "Library without deployments"),
+        ("metrics_collection", "Library without runtime"),
+        ("profiling_instrumentation", "Library where profiling not meaningful"),
+        ("circuit_breakers", "Library without external dependencies"),
+        ("distributed_tracing", "Library without runtime"),
+        ("local_services_setup", "Library without external dependencies"),
+        ("database_schema", "Library without database"),
+        ("n_plus_one_detection", "Library without database/ORM"),
+        ("privacy_compliance", "Library without user data"),
+        ("pii_handling", "Library without user data"),
+    ],
+    "database": [
+        ("n_plus_one_detection", "Database project IS the database layer"),
+        ("dast_scanning", "Database server, not web application"),
+    ],
+    "cli": [
+        ("dast_scanning", "CLI tool, not web application"),
+        ("health_checks", "CLI tool, not a service"),
+        ("progressive_rollout", "CLI tool without deployments"),
+    ],
+}
+
+
+def _glob_to_regex(pattern: str) -> re.Pattern:
+    """Translate a pathlib-style glob (with ``**``) into a path regex."""
+    regex = ""
+    segments = pattern.split("/")
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == "**":
+            if last:
+                # "dir/**" matches the directory itself and everything below it
+                regex = regex[:-1] + "(?:/.*)?" if regex else ".*"
+            else:
+                regex += "(?:[^/]+/)*"
+            continue
+        for char in segment:
+            if char == "*":
+                regex += "[^/]*"
+            elif char == "?":
+                regex += "[^/]"
+            else:
+                regex += re.escape(char)
+        if not last:
+            regex += "/"
+    return re.compile(regex + r"\Z")
+
+
+class WorkingTreeSource:
+    """Reads repository files from a checked-out working tree."""
+    
+    def __init__(self, root: Path):
+        self.root = root
+    
+    def load(self) -> None:
+        """Nothing to prepare; files are read from disk on demand."""
+    
+    def glob(self, pattern: str) -> list[str]:
+        return [p.relative_to(self.root).as_posix() for p in self.root.glob(pattern)]
+    
+    def any_match(self, pattern: str) -> bool:
+        # Stop at the first hit instead of walking the whole tree
+        return next(self.root.glob(pattern), None) is not None
+    
+    def exists(self, path: str) -> bool:
+        return (self.root / path).exists()
+    
+    def read_text(self, path: str) -> Optional[str]:
+        full_path = self.root / path
+        if not full_path.is_file():
+            return None
+        return full_path.read_text(errors='ignore')
+
+
+class GitTreeSource:
+    """
+    Reads repository files straight from a git tree object.
+    
+    Works on bare and partial (``--filter=blob:none``) clones without a
+    checkout: paths come from ``git ls-tree``, and blob contents are only
+    fetched from the promisor remote when a criterion actually reads a file.
+    """
+    
+    def __init__(self, git_dir: Path, ref: str = "HEAD"):
+        self.git_dir = git_dir
+        self.ref = ref
+        self._paths: Optional[list[str]] = None
+        self._path_set: set[str] = set()
+    
+    def load(self) -> None:
+        """
+        List the tree with ``git ls-tree``, once.
+        
+        This is the first analysis step rather than part of ``__init__``, so
+        ``analyze_async`` runs it on the executor instead of the event loop.
+        """
+        if self._paths is not None:
+            return
+        output = subprocess.run(
+            ["git", "--git-dir", str(self.git_dir), "ls-tree", "-r", "-t", "-z",
+             "--name-only", self.ref],
+            check=True, capture_output=True, text=True
+        ).stdout
+        self._paths = sorted(p for p in output.split("\0") if p)
+        self._path_set = set(self._paths)
+    
+    def glob(self, pattern: str) -> list[str]:
+        self.load()
+        regex = _glob_to_regex(pattern)
+        return [p for p in self._paths if regex.match(p)]
+    
+    def any_match(self, pattern: str) -> bool:
+        self.load()
+        regex = _glob_to_regex(pattern)
+        return any(regex.match(p) for p in self._paths)
+    
+    def exists(self, path: str) -> bool:
+        self.load()
+        return path.rstrip("/") in self._path_set
+    
+    def read_text(self, path: str) -> Optional[str]:
+        self.load()
+        if path not in self._path_set:
+            return None
+        result = subprocess.run(
+            ["git", "--git-dir", str(self.git_dir), "cat-file", "blob",
+             f"{self.ref}:{path}"],
+            capture_output=True
+        )
+        if result.returncode != 0:
+            return None
+        return result.stdout.decode(errors='ignore')
+
+
+def is_bare_git_repo(path: Path) -> bool:
+    """Return True if path is a bare git repository (no working tree)."""
+    return (
+        (path / "HEAD").is_file()
+        and (path / "objects").is_dir()
+        and (path / "refs").is_dir()
+    )
+
+
+def is_unchecked_out_clone(path: Path) -> bool:
+    """Return True if path is a clone made with --no-checkout (a .git directory, no files)."""
+    git_dir = path / ".git"
+    return (
+        is_bare_git_repo(git_dir)
+        and not (git_dir / "index").exists()
+        and all(child.name == ".git" for child in path.iterdir())
+    )
+
+
+def clone_partial(url: str, dest: Path) -> Path:
+    """Create a bare, blob-less clone of url at dest for tree-only analysis."""
+    subprocess.run(
+        ["git", "clone", "--bare", "--filter=blob:none", "--quiet", url, str(dest)],
+        check=True, capture_output=True, text=True
+    )
+    return dest
 
 
 class RepoAnalyzer:
     """Analyzes repository for agent readiness criteria."""
     
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, ref: str = "HEAD"):
         self.repo_path = Path(repo_path).resolve()
+        repo_name = self.repo_path.name
+        if is_bare_git_repo(self.repo_path):
+            self.source = GitTreeSource(self.repo_path, ref)
+            repo_name = repo_name.removesuffix(".git")
+        elif is_unchecked_out_clone(self.repo_path):
+            self.source = GitTreeSource(self.repo_path / ".git", ref)
+        else:
+            self.source = WorkingTreeSource(self.repo_path)
         self.result = AnalysisResult(
             repo_path=str(self.repo_path),
-            repo_name=self.repo_path.name
+            repo_name=repo_name
         )
         self._file_cache: dict[str, bool] = {}
         self._content_cache: dict[str, str] = {}
+        self._command_cache: dict[tuple[str, ...], tuple[int, str]] = {}
+        self._skip_reasons: Optional[dict[str, str]] = None
+        self._feature_flags: Optional[bool] = None
         
     def analyze(self) -> AnalysisResult:
         """Run full analysis and return results."""
-        self._detect_repo_type()
-        self._detect_languages()
-        self._evaluate_all_pillars()
-        self._calculate_levels()
+        for step in self._analysis_steps():
+            step()
         return self.result
     
+    async def analyze_async(self, executor: Optional[Executor] = None) -> AnalysisResult:
+        """
+        Run full analysis without blocking the event loop.
+        
+        Subprocess probes run concurrently as asyncio subprocesses, then each
+        analysis step runs on ``executor`` (a shared, bounded thread pool by
+        default). Cancelling the awaiting task kills in-flight probes and
+        stops the analysis before its next step.
+        """
+        loop = asyncio.get_running_loop()
+        if executor is None:
+            executor = _default_io_executor()
+        
+        outputs = await asyncio.gather(
+            *(self._run_command_async(cmd) for cmd in PROBE_COMMANDS)
+        )
+        for cmd, output in zip(PROBE_COMMANDS, outputs):
+            self._command_cache[tuple(cmd)] = output
+        
+        for step in self._analysis_steps():
+            await loop.run_in_executor(executor, step)
+        return self.result
+    
+    def _analysis_steps(self) -> list:
+        """Ordered analysis steps, shared by the sync and async entry points."""
+        steps = [self.source.load, self._detect_repo_type, self._resolve_skips, self._detect_languages]
+        for pillar_name, evaluate_func in self._pillar_evaluators().items():
+            steps.append(partial(self._evaluate_pillar, pillar_name, evaluate_func))
+        steps += [self._calculate_pass_rate, self._calculate_levels, self._detect_commit]
+        return steps
+    
     def _file_exists(self, *patterns: str) -> bool:
         """Check if any of the given file patterns exist."""
         for pattern in patterns:
@@ -96,10 +343,9 @@ class RepoAnalyzer:
             
             # Handle glob patterns
             if "*" in pattern:
-                matches = list(self.repo_path.glob(pattern))
-                exists = len(matches) > 0
+                exists = self.source.any_match(pattern)
             else:
-                exists = (self.repo_path / pattern).exists()
+                exists = self.source.exists(pattern)
             
             self._file_cache[cache_key] = exists
             if exists:
@@ -111,20 +357,21 @@ class RepoAnalyzer:
         if path in self._content_cache:
             return self._content_cache[path]
         
-        full_path = self.repo_path / path
-        if not full_path.exists():
-            return None
-        
         try:
-            content = full_path.read_text(errors='ignore')
-            self._content_cache[path] = content
-            return content
+            content = self.source.read_text(path)
         except Exception:
             return None
+        if content is not None:
+            self._content_cache[path] = content
+        return content
+    
+    def _glob(self, pattern: str) -> list[str]:
+        """Return repo-relative paths matching a glob pattern."""
+        return self.source.glob(pattern)
     
     def _search_files(self, pattern: str, content_pattern: str = None) -> bool:
         """Search for files matching pattern, optionally with content."""
-        matches = list(self.repo_path.glob(pattern))
+        matches = self._glob(pattern)
         if not matches:
             return False
         if content_pattern is None:
@@ -133,8 +380,8 @@ class RepoAnalyzer:
         regex = re.compile(content_pattern, re.IGNORECASE)
         for match in matches[:10]:  # Limit for performance
             try:
-                content = match.read_text(errors='ignore')
-                if regex.search(content):
+                content = self.source.read_text(match)
+                if content and regex.search(content):
                     return True
             except Exception:
                 continue
@@ -142,6 +389,9 @@ class RepoAnalyzer:
     
     def _run_command(self, cmd: list[str], timeout: int = 10) -> tuple[int, str]:
         """Run a command and return (exit_code, output)."""
+        cached = self._command_cache.get(tuple(cmd))
+        if cached is not None:
+            return cached
         try:
             result = subprocess.run(
                 cmd,
@@ -154,6 +404,34 @@ class RepoAnalyzer:
         except Exception as e:
             return -1, str(e)
     
+    async def _run_command_async(self, cmd: list[str], timeout: int = 10) -> tuple[int, str]:
+        """Async variant of _run_command; kills the process on timeout or cancel."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=self.repo_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            return -1, str(e)
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError as e:
+            return -1, str(e) or "Command timed out"
+        finally:
+            if proc.returncode is None:
+                # Reap the killed process so no zombie outlives the event loop
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
+        
+        output = stdout.decode(errors="replace") + stderr.decode(errors="replace")
+        return proc.returncode, output
+    
     def _detect_repo_type(self):
         """Detect repository type for criterion skipping."""
         # Check for library indicators
@@ -164,17 +442,17 @@ class RepoAnalyzer:
         
         if self._file_exists("pyproject.toml"):
             content = self._read_file("pyproject.toml") or ""
-            if "[project]" in content and "Dockerfile" not in os.listdir(self.repo_path):
+            if "[project]" in content and not self._file_exists("Dockerfile"):
                 # Likely a library
                 readme = self._read_file("README.md") or ""
                 if "pip install" in readme.lower() and "docker" not in readme.lower():
                     self.result.repo_type = "library"
                     return
         
-        # Check for CLI tool
-        if self._file_exists("**/cli.py", "**/main.py", "**/cmd/**"):
-            readme = self._read_file("README.md") or ""
-            if any(x in readme.lower() for x in ["command line", "cli", "usage:"]):
+        # Check for CLI tool (README first: it is cached and avoids tree walks)
+        readme = self._read_file("README.md") or ""
+        if any(x in readme.lower() for x in ["command line", "cli", "usage:"]):
+            if self._file_exists("**/cli.py", "**/main.py", "**/cmd/**"):
                 self.result.repo_type = "cli"
                 return
         
@@ -190,6 +468,19 @@ class RepoAnalyzer:
         
         self.result.repo_type = "application"
     
+    def _detect_commit(self):
+        """Record the analyzed commit SHA when the repository is under git."""
+        ref = getattr(self.source, "ref", "HEAD")
+        if isinstance(self.source, WorkingTreeSource):
+            # A plain directory inside another checkout would report the
+            # enclosing repository's HEAD; only record our own commit
+            code, output = self._run_command(["git", "rev-parse", "--show-toplevel"])
+            if code != 0 or Path(output.strip()).resolve() != self.repo_path:
+                return
+        code, output = self._run_command(["git", "rev-parse", ref])
+        if code == 0:
+            self.result.commit = output.strip()
+    
     def _detect_languages(self):
         """Detect primary programming languages."""
         languages = []
@@ -214,68 +505,56 @@ class RepoAnalyzer:
         
         self.result.languages = languages if languages else ["Unknown"]
     
-    def _should_skip(self, criterion_id: str) -> tuple[bool, str]:
-        """Determine if a criterion should be skipped based on repo type."""
+    def _resolve_skips(self):
+        """
+        Resolve which criteria are skipped, before any criterion is checked.
+        
+        Runs right after repo-type detection so that checks for skipped
+        criteria can short-circuit instead of scanning files for a result
+        that would be discarded.
+        """
         repo_type = self.result.repo_type
-        
-        skip_rules = {
-            "library": [
-                ("health_checks", "Library, not a deployed service"),
-                ("progressive_rollout", "Not applicable for a library"),
-                ("rollback_automation", "Not applicable for a library"),
-                ("dast_scanning", "Library, not a web service"),
-                ("alerting_configured", "Library without runtime"),
-                ("deployment_observability", "Library without deployments"),
-                ("metrics_collection", "Library without runtime"),
-                ("profiling_instrumentation", "Library where profiling not meaningful"),
-                ("circuit_breakers", "Library without external dependencies"),
-                ("distributed_tracing", "Library without runtime"),
-                ("local_services_setup", "Library without external dependencies"),
-                ("database_schema", "Library without database"),
-                ("n_plus_one_detection", "Library without database/ORM"),
-                ("privacy_compliance", "Library without user data"),
-                ("pii_handling", "Library without user data"),
-            ],
-            "database": [
-                ("n_plus_one_detection", "Database project IS the database layer"),
-                ("dast_scanning", "Database server, not web application"),
-            ],
-            "cli": [
-                ("dast_scanning", "CLI tool, not web application"),
-                ("health_checks", "CLI tool, not a service"),
-                ("progressive_rollout", "CLI tool without deployments"),
-            ],
-        }
-        
-        for rule_type, rules in skip_rules.items():
-            if repo_type == rule_type:
-                for crit_id, reason in rules:
-                    if criterion_id == crit_id:
-                        return True, reason
+        skips = dict(SKIP_RULES.get(repo_type, []))
         
         # Skip monorepo criteria for non-monorepos
         if repo_type != "monorepo":
-            if criterion_id in ["monorepo_tooling", "version_drift_detection"]:
-                return True, "Single-application repository, not a monorepo"
+            for criterion_id in ["monorepo_tooling", "version_drift_detection"]:
+                skips[criterion_id] = "Single-application repository, not a monorepo"
         
         # Skip prerequisites
-        if criterion_id == "devcontainer_runnable":
-            if not self._file_exists(".devcontainer/devcontainer.json"):
-                return True, "No devcontainer to test (prerequisite failed)"
+        if not self._file_exists(".devcontainer/devcontainer.json"):
+            skips["devcontainer_runnable"] = "No devcontainer to test (prerequisite failed)"
         
-        if criterion_id == "agents_md_validation":
-            if not self._file_exists("AGENTS.md", "CLAUDE.md"):
-                return True, "No AGENTS.md exists (prerequisite failed)"
+        if not self._file_exists("AGENTS.md", "CLAUDE.md"):
+            skips["agents_md_validation"] = "No AGENTS.md exists (prerequisite failed)"
         
-        if criterion_id == "dead_feature_flag_detection":
-            # Check if feature flags exist first
-            if not self._check_feature_flags():
-                return True, "No feature flag infrastructure (prerequisite failed)"
+        # Check if feature flags exist first
+        if not self._check_feature_flags():
+            skips["dead_feature_flag_detection"] = "No feature flag infrastructure (prerequisite failed)"
         
-        return False, ""
+        self._skip_reasons = skips
+    
+    def _should_skip(self, criterion_id: str) -> tuple[bool, str]:
+        """Determine if a criterion should be skipped based on repo type."""
+        if self._skip_reasons is None:
+            self._resolve_skips()
+        reason = self._skip_reasons.get(criterion_id)
+        if reason is None:
+            return False, ""
+        return True, reason
+    
+    def _is_skipped(self, criterion_id: str) -> bool:
+        """Return True if the criterion is skipped and its check can be avoided."""
+        return self._should_skip(criterion_id)[0]
     
     def _check_feature_flags(self) -> bool:
         """Check if feature flag infrastructure exists."""
+        if self._feature_flags is None:
+            self._feature_flags = self._find_feature_flags()
+        return self._feature_flags
+    
+    def _find_feature_flags(self) -> bool:
+        """Scan dependency manifests for a feature flag service."""
         # Check for common feature flag services
         patterns = [
             "launchdarkly", "statsig", "unleash", "growthbook",
@@ -290,9 +569,9 @@ class RepoAnalyzer:
                         return True
         return False
 
-    def _evaluate_all_pillars(self):
-        """Evaluate all criteria across all pillars."""
-        pillars = {
+    def _pillar_evaluators(self) -> dict:
+        """Map each pillar name to the method that evaluates it."""
+        return {
             "Style & Validation": self._evaluate_style_validation,
             "Build System": self._evaluate_build_system,
             "Testing": self._evaluate_testing,
@@ -303,22 +582,25 @@ class RepoAnalyzer:
             "Task Discovery": self._evaluate_task_discovery,
             "Product & Analytics": self._evaluate_product_analytics,
         }
+    
+    def _evaluate_pillar(self, pillar_name: str, evaluate_func) -> None:
+        """Evaluate a single pillar and add it to the running totals."""
+        criteria = evaluate_func()
+        passed = sum(1 for c in criteria if c.status == CriterionStatus.PASS)
+        total = sum(1 for c in criteria if c.status != CriterionStatus.SKIP)
+        
+        self.result.pillars[pillar_name] = PillarResult(
+            name=pillar_name,
+            passed=passed,
+            total=total,
+            criteria=criteria
+        )
         
-        for pillar_name, evaluate_func in pillars.items():
-            criteria = evaluate_func()
-            passed = sum(1 for c in criteria if c.status == CriterionStatus.PASS)
-            total = sum(1 for c in criteria if c.status != CriterionStatus.SKIP)
-            
-            self.result.pillars[pillar_name] = PillarResult(
-                name=pillar_name,
-                passed=passed,
-                total=total,
-                criteria=criteria
-            )
-            
-            self.result.total_passed += passed
-            self.result.total_criteria += total
-        
+        self.result.total_passed += passed
+        self.result.total_criteria += total
+    
+    def _calculate_pass_rate(self):
+        """Compute the overall pass rate from the pillar totals."""
         if self.result.total_criteria > 0:
             self.result.pass_rate = round(
                 (self.result.total_passed / self.result.total_criteria) * 100, 1
@@ -478,10 +760,10 @@ class RepoAnalyzer:
         
         # L3: dead_code_detection
         dead_code = False
-        workflows = list(self.repo_path.glob(".github/workflows/*.yml")) + \
-                   list(self.repo_path.glob(".github/workflows/*.yaml"))
+        workflows = self._glob(".github/workflows/*.yml") + \
+                   self._glob(".github/workflows/*.yaml")
         for wf in workflows[:5]:
-            content = wf.read_text(errors='ignore')
+            content = self._read_file(wf) or ""
             if any(x in content.lower() for x in ["vulture", "knip", "deadcode"]):
                 dead_code = True
                 break
@@ -493,7 +775,7 @@ class RepoAnalyzer:
         # L3: duplicate_code_detection
         duplicate = False
         for wf in workflows[:5]:
-            content = wf.read_text(errors='ignore')
+            content = self._read_file(wf) or ""
             if any(x in content.lower() for x in ["jscpd", "pmd cpd", "sonarqube"]):
                 duplicate = True
                 break
@@ -505,7 +787,7 @@ class RepoAnalyzer:
         # L4: tech_debt_tracking
         tech_debt = False
         for wf in workflows[:5]:
-            content = wf.read_text(errors='ignore')
+            content = self._read_file(wf) or ""
             if any(x in content.lower() for x in ["todo", "fixme", "sonar"]):
                 tech_debt = True
                 break
@@ -516,11 +798,12 @@ class RepoAnalyzer:
         
         # L4: n_plus_one_detection
         n_plus_one = False
-        deps = (self._read_file("requirements.txt") or "") + \
-               (self._read_file("Gemfile") or "") + \
-               (self._read_file("package.json") or "")
-        if any(x in deps.lower() for x in ["nplusone", "bullet", "query-analyzer"]):
-            n_plus_one = True
+        if not self._is_skipped("n_plus_one_detection"):
+            deps = (self._read_file("requirements.txt") or "") + \
+                   (self._read_file("Gemfile") or "") + \
+                   (self._read_file("package.json") or "")
+            if any(x in deps.lower() for x in ["nplusone", "bullet", "query-analyzer"]):
+                n_plus_one = True
         results.append(self._make_result(
             "n_plus_one_detection", pillar, 4, n_plus_one,
             "N+1 detection enabled" if n_plus_one else "No N+1 query detection"
@@ -632,9 +915,9 @@ class RepoAnalyzer:
         # L3: automated_pr_review
         pr_review = self._file_exists("danger.js", "dangerfile.js", "dangerfile.ts")
         if not pr_review:
-            workflows = list(self.repo_path.glob(".github/workflows/*.yml"))
+            workflows = self._glob(".github/workflows/*.yml")
             for wf in workflows[:5]:
-                content = wf.read_text(errors='ignore')
+                content = self._read_file(wf) or ""
                 if any(x in content.lower() for x in ["review", "danger", "lint-pr"]):
                     pr_review = True
                     break
@@ -671,9 +954,9 @@ class RepoAnalyzer:
         
         # L4: unused_dependencies_detection
         unused_deps = False
-        workflows = list(self.repo_path.glob(".github/workflows/*.yml"))
+        workflows = self._glob(".github/workflows/*.yml")
         for wf in workflows[:5]:
-            content = wf.read_text(errors='ignore')
+            content = self._read_file(wf) or ""
             if any(x in content.lower() for x in ["depcheck", "deptry", "go mod tidy"]):
                 unused_deps = True
                 break
@@ -690,7 +973,9 @@ class RepoAnalyzer:
         ))
         
         # L4: monorepo_tooling
-        monorepo_tools = self._file_exists("lerna.json", "nx.json", "turbo.json", "pnpm-workspace.yaml")
+        monorepo_tools = not self._is_skipped("monorepo_tooling") and self._file_exists(
+            "lerna.json", "nx.json", "turbo.json", "pnpm-workspace.yaml"
+        )
         results.append(self._make_result(
             "monorepo_tooling", pillar, 4, monorepo_tools,
             "Monorepo tooling configured" if monorepo_tools else "No monorepo tooling"
@@ -705,10 +990,11 @@ class RepoAnalyzer:
         
         # L5: progressive_rollout
         progressive = False
-        for pattern in ["*.yml", "*.yaml"]:
-            if self._search_files(f".github/workflows/{pattern}", r"canary|gradual|rollout"):
-                progressive = True
-                break
+        if not self._is_skipped("progressive_rollout"):
+            for pattern in ["*.yml", "*.yaml"]:
+                if self._search_files(f".github/workflows/{pattern}", r"canary|gradual|rollout"):
+                    progressive = True
+                    break
         results.append(self._make_result(
             "progressive_rollout", pillar, 5, progressive,
             "Progressive rollout configured" if progressive else "No progressive rollout"
@@ -770,9 +1056,9 @@ class RepoAnalyzer:
         if self._file_exists("pyproject.toml"):
             content = self._read_file("pyproject.toml") or ""
             isolation = "pytest-xdist" in content or "-n auto" in content
-        workflows = list(self.repo_path.glob(".github/workflows/*.yml"))
+        workflows = self._glob(".github/workflows/*.yml")
         for wf in workflows[:5]:
-            content = wf.read_text(errors='ignore')
+            content = self._read_file(wf) or ""
             if "matrix" in content.lower():
                 isolation = True
                 break
@@ -796,7 +1082,7 @@ class RepoAnalyzer:
         # L3: test_coverage_thresholds
         coverage = False
         for wf in workflows[:5]:
-            content = wf.read_text(errors='ignore')
+            content = self._read_file(wf) or ""
             if any(x in content.lower() for x in ["coverage", "codecov", "coveralls"]):
                 coverage = True
                 break
@@ -810,7 +1096,7 @@ class RepoAnalyzer:
         # L4: flaky_test_detection
         flaky = False
         for wf in workflows[:5]:
-            content = wf.read_text(errors='ignore')
+            content = self._read_file(wf) or ""
             if any(x in content.lower() for x in ["retry", "flaky", "quarantine", "rerun"]):
                 flaky = True
                 break
@@ -822,7 +1108,7 @@ class RepoAnalyzer:
         # L4: test_performance_tracking
         test_perf = False
         for wf in workflows[:5]:
-            content = wf.read_text(errors='ignore')
+            content = self._read_file(wf) or ""
             if any(x in content.lower() for x in ["durations", "timing", "benchmark"]):
                 test_perf = True
                 break
@@ -906,12 +1192,13 @@ class RepoAnalyzer:
         
         # L4: agents_md_validation
         agents_validation = False
-        workflows = list(self.repo_path.glob(".github/workflows/*.yml"))
-        for wf in workflows[:5]:
-            content = wf.read_text(errors='ignore')
-            if any(x in content.lower() for x in ["agents.md", "claude.md"]):
-                agents_validation = True
-                break
+        if not self._is_skipped("agents_md_validation"):
+            workflows = self._glob(".github/workflows/*.yml")
+            for wf in workflows[:5]:
+                content = self._read_file(wf) or ""
+                if any(x in content.lower() for x in ["agents.md", "claude.md"]):
+                    agents_validation = True
+                    break
         results.append(self._make_result(
             "agents_md_validation", pillar, 4, agents_validation,
             "AGENTS.md validation in CI" if agents_validation else "No AGENTS.md validation"
@@ -944,7 +1231,7 @@ class RepoAnalyzer:
         
         # L3: devcontainer_runnable
         devcontainer_valid = False
-        if devcontainer:
+        if devcontainer and not self._is_skipped("devcontainer_runnable"):
             content = self._read_file(".devcontainer/devcontainer.json")
             if content and "image" in content.lower():
                 devcontainer_valid = True
@@ -954,7 +1241,7 @@ class RepoAnalyzer:
         ))
         
         # L3: database_schema
-        db_schema = self._file_exists(
+        db_schema = not self._is_skipped("database_schema") and self._file_exists(
             "migrations/**", "db/migrations/**", "alembic/**",
             "prisma/schema.prisma", "schema.sql", "db/schema.rb"
         )
@@ -964,7 +1251,7 @@ class RepoAnalyzer:
         ))
         
         # L3: local_services_setup
-        local_services = self._file_exists(
+        local_services = not self._is_skipped("local_services_setup") and self._file_exists(
             "docker-compose.yml", "docker-compose.yaml",
             "compose.yml", "compose.yaml"
         )
@@ -1036,12 +1323,10 @@ class RepoAnalyzer:
         ))
         
         # L3: health_checks
-        health = self._search_files(
-            "**/*.py", r"health|ready|alive"
-        ) or self._search_files(
-            "**/*.ts", r"health|ready|alive"
-        ) or self._search_files(
-            "**/*.go", r"health|ready|alive"
+        health = not self._is_skipped("health_checks") and (
+            self._search_files("**/*.py", r"health|ready|alive")
+            or self._search_files("**/*.ts", r"health|ready|alive")
+            or self._search_files("**/*.go", r"health|ready|alive")
         )
         results.append(self._make_result(
             "health_checks", pillar, 3, health,
@@ -1058,7 +1343,7 @@ class RepoAnalyzer:
         ))
         
         # L4: alerting_configured
-        alerting = self._file_exists(
+        alerting = not self._is_skipped("alerting_configured") and self._file_exists(
             "**/alerts*.yml", "**/alertmanager*", "monitoring/**"
         )
         results.append(self._make_result(
@@ -1067,7 +1352,7 @@ class RepoAnalyzer:
         ))
         
         # L4: deployment_observability
-        deploy_obs = self._search_files(
+        deploy_obs = not self._is_skipped("deployment_observability") and self._search_files(
             ".github/workflows/*.yml",
             r"(datadog|grafana|newrelic|deploy.*notify)"
         )
@@ -1114,9 +1399,9 @@ class RepoAnalyzer:
         
         # L2: secrets_management
         secrets_mgmt = False
-        workflows = list(self.repo_path.glob(".github/workflows/*.yml"))
+        workflows = self._glob(".github/workflows/*.yml")
         for wf in workflows[:5]:
-            content = wf.read_text(errors='ignore')
+            content = self._read_file(wf) or ""
             if "secrets." in content:
                 secrets_mgmt = True
                 break
@@ -1160,10 +1445,9 @@ class RepoAnalyzer:
         ))
         
         # L3: pii_handling
-        pii = self._search_files(
-            "**/*.py", r"(redact|sanitize|mask|pii)"
-        ) or self._search_files(
-            "**/*.ts", r"(redact|sanitize|mask|pii)"
+        pii = not self._is_skipped("pii_handling") and (
+            self._search_files("**/*.py", r"(redact|sanitize|mask|pii)")
+            or self._search_files("**/*.ts", r"(redact|sanitize|mask|pii)")
         )
         results.append(self._make_result(
             "pii_handling", pillar, 3, pii,
@@ -1191,7 +1475,7 @@ class RepoAnalyzer:
         ))
         
         # L5: dast_scanning
-        dast = self._search_files(
+        dast = not self._is_skipped("dast_scanning") and self._search_files(
             ".github/workflows/*.yml",
             r"(zap|dast|owasp|burp)"
         )
@@ -1201,7 +1485,7 @@ class RepoAnalyzer:
         ))
         
         # L5: privacy_compliance
-        privacy = self._file_exists(
+        privacy = not self._is_skipped("privacy_compliance") and self._file_exists(
             "PRIVACY.md", "docs/privacy/**", "gdpr/**"
         )
         results.append(self._make_result(
@@ -1228,9 +1512,9 @@ class RepoAnalyzer:
         # L2: issue_labeling_system
         labels = False
         if issue_templates:
-            templates = list(self.repo_path.glob(".github/ISSUE_TEMPLATE/*.md"))
+            templates = self._glob(".github/ISSUE_TEMPLATE/*.md")
             for t in templates[:5]:
-                content = t.read_text(errors='ignore')
+                content = self._read_file(t) or ""
                 if "labels:" in content.lower():
                     labels = True
                     break
@@ -1266,9 +1550,9 @@ class RepoAnalyzer:
         
         # L5: error_to_insight_pipeline
         error_pipeline = False
-        workflows = list(self.repo_path.glob(".github/workflows/*.yml"))
+        workflows = self._glob(".github/workflows/*.yml")
         for wf in workflows[:5]:
-            content = wf.read_text(errors='ignore')
+            content = self._read_file(wf) or ""
             if any(x in content.lower() for x in ["sentry", "create.*issue", "error.*issue"]):
                 error_pipeline = True
                 break
@@ -1279,7 +1563,7 @@ class RepoAnalyzer:
         if "sentry" in deps.lower():
             # Check for issue creation automation
             for wf in workflows[:5]:
-                content = wf.read_text(errors='ignore')
+                content = self._read_file(wf) or ""
                 if "issue" in content.lower() and "sentry" in content.lower():
                     error_pipeline = True
                     break
@@ -1330,6 +1614,34 @@ class RepoAnalyzer:
         self.result.achieved_level = achieved if achieved > 0 else 0
 
 
+def analysis_to_dict(result: AnalysisResult) -> dict:
+    """Convert an AnalysisResult into the JSON structure used by the reports."""
+    output = {
+        "repo_path": result.repo_path,
+        "repo_name": result.repo_name,
+        "repo_type": result.repo_type,
+        "languages": result.languages,
+        "commit": result.commit,
+        "pass_rate": result.pass_rate,
+        "total_passed": result.total_passed,
+        "total_criteria": result.total_criteria,
+        "achieved_level": result.achieved_level,
+        "level_scores": result.level_scores,
+        "pillars": {}
+    }
+    
+    for pillar_name, pillar in result.pillars.items():
+        output["pillars"][pillar_name] = {
+            "name": pillar.name,
+            "passed": pillar.passed,
+            "total": pillar.total,
+            "percentage": pillar.percentage,
+            "criteria": [asdict(c) for c in pillar.criteria]
+        }
+    
+    return output
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Analyze repository for agent readiness"
@@ -1337,13 +1649,27 @@ def main():
     parser.add_argument(
         "--repo-path", "-r",
         default=".",
-        help="Path to the repository to analyze"
+        help="Path to the repository to analyze (working tree or bare repo)"
+    )
+    parser.add_argument(
+        "--remote",
+        help="Analyze a remote repository URL via a blob-less bare clone "
+             "instead of a local checkout"
+    )
+    parser.add_argument(
+        "--ref",
+        default="HEAD",
+        help="Git ref to analyze for bare or remote repositories (default: HEAD)"
     )
     parser.add_argument(
         "--output", "-o",
         default="/tmp/readiness_analysis.json",
         help="Output file for analysis results"
     )
+    parser.add_argument(
+        "--trend-db",
+        help="Also append the results to this SQLite trend store"
+    )
     parser.add_argument(
         "--quiet", "-q",
         action="store_true",
@@ -1352,42 +1678,39 @@ def main():
     
     args = parser.parse_args()
     
-    if not args.quiet:
-        print(f"🔍 Analyzing repository: {args.repo_path}")
+    if args.remote:
+        if not args.quiet:
+            print(f"🔍 Analyzing remote repository: {args.remote}")
+        # Only commits and trees are cloned; blobs are fetched lazily for
+        # the handful of files that content checks actually read.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            name = args.remote.rstrip("/").split("/")[-1].removesuffix(".git")
+            clone_dir = clone_partial(args.remote, Path(tmpdir) / f"{name}.git")
+            result = RepoAnalyzer(str(clone_dir), args.ref).analyze()
+        result.repo_path = args.remote
+    else:
+        if not args.quiet:
+            print(f"🔍 Analyzing repository: {args.repo_path}")
+        analyzer = RepoAnalyzer(args.repo_path, args.ref)
+        result = analyzer.analyze()
     
-    analyzer = RepoAnalyzer(args.repo_path)
-    result = analyzer.analyze()
-    
-    output = {
-        "repo_path": result.repo_path,
-        "repo_name": result.repo_name,
-        "repo_type": result.repo_type,
-        "languages": result.languages,
-        "pass_rate": result.pass_rate,
-        "total_passed": result.total_passed,
-        "total_criteria": result.total_criteria,
-        "achieved_level": result.achieved_level,
-        "level_scores": result.level_scores,
-        "pillars": {}
-    }
-    
-    for pillar_name, pillar in result.pillars.items():
-        output["pillars"][pillar_name] = {
-            "name": pillar.name,
-            "passed": pillar.passed,
-            "total": pillar.total,
-            "percentage": pillar.percentage,
-            "criteria": [asdict(c) for c in pillar.criteria]
-        }
+    output = analysis_to_dict(result)
     
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(json.dumps(output, indent=2))
     
+    if args.trend_db:
+        from trend_store import TrendStore
+        with TrendStore(args.trend_db) as store:
+            store.record(output)
+    
     if not args.quiet:
         print(f"✅ Analysis complete: {result.total_passed}/{result.total_criteria} criteria passed ({result.pass_rate}%)")
         print(f"📊 Achieved Level: L{result.achieved_level}")
         print(f"📄 Results saved to: {args.output}")
+        if args.trend_db:
+            print(f"📈 Run recorded in trend store: {args.trend_db}")
     
     return result
 
@@ -2,16 +2,37 @@
 """
 Report Generator for Agent Readiness
 
-Generates formatted markdown reports from analysis JSON.
+Generates formatted markdown, HTML and brief reports from analysis JSON.
+All formats render from one report model through templates that are
+compiled once per process and reused for every report.
 
 Usage:
     python generate_report.py --analysis-file /tmp/readiness_analysis.json
     python generate_report.py --analysis-file /tmp/readiness_analysis.json --format markdown
+    python generate_report.py --analysis-file /tmp/readiness_analysis.json --format html -o report.html
+    python generate_report.py --repo-path . --format brief
+    python generate_report.py --analysis-file new.json --baseline old.json --format json
+    python generate_report.py --fleet analyses/ more.jsonl --format markdown
+    python generate_report.py --trend-db trends.db --format trend --repo my-repo
 """
 
 import argparse
+import html
+import importlib.util
 import json
+import string
+import sys
+from collections import Counter
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Iterable, Iterator
+
+# Percentiles shown for each pillar in fleet reports
+FLEET_PERCENTILES = (10, 25, 50, 75, 90)
+
+CRITERION_ICONS = {"pass": "✓", "fail": "✗", "skip": "—"}
+
+_FORMATTER = string.Formatter()
 
 
 def format_level_bar(level_scores: dict, achieved: int) -> str:
@@ -80,170 +101,861 @@ def get_top_opportunities(data: dict, n: int = 5) -> list[tuple[str, str, str]]:
     return [(o[0], o[2], o[3]) for o in opportunities[:n]]
 
 
-def generate_markdown_report(data: dict) -> str:
-    """Generate a full markdown report from analysis data."""
-    repo_name = data["repo_name"]
-    pass_rate = data["pass_rate"]
+def _next_steps(achieved: int) -> tuple[str, list[str]]:
+    """Recommended next steps for the achieved level."""
+    if achieved < 2:
+        return "Focus on L1/L2 Foundations:", [
+            "Add missing linter and formatter configurations",
+            "Document build and test commands in README",
+            "Set up pre-commit hooks for fast feedback",
+            "Create AGENTS.md with project context for AI agents",
+        ]
+    if achieved < 3:
+        return "Progress to L3 (Production Ready):", [
+            "Add integration/E2E tests",
+            "Set up test coverage thresholds",
+            "Configure devcontainer for reproducible environments",
+            "Add automated PR review tooling",
+        ]
+    return "Optimize for L4+:", [
+        "Implement complexity analysis and dead code detection",
+        "Set up flaky test detection and quarantine",
+        "Add security scanning (CodeQL, Snyk)",
+        "Configure deployment observability",
+    ]
+
+
+def build_report_model(data: dict) -> dict:
+    """
+    Build the format-independent report model from analysis data.
+    
+    Every output format renders from this model, so ranking, level status
+    and recommendations are computed once per analysis.
+    """
     achieved = data["achieved_level"]
-    total_passed = data["total_passed"]
-    total = data["total_criteria"]
-    languages = data.get("languages", ["Unknown"])
-    repo_type = data.get("repo_type", "application")
-    level_scores = data["level_scores"]
+    levels = []
+    for level in range(1, 6):
+        score = data["level_scores"].get(str(level), data["level_scores"].get(level, 0))
+        levels.append({
+            "level": level,
+            "score": score,
+            "remaining": 100 - score,
+            "achieved": achieved > 0 and level <= achieved,
+            "passed": score >= 80,
+            "bar": "█" * int(score / 10) + "░" * (10 - int(score / 10)),
+        })
     
-    lines = []
+    pillars = []
+    for pillar_name, pillar in data["pillars"].items():
+        pillars.append({
+            "name": pillar_name,
+            "passed": pillar["passed"],
+            "total": pillar["total"],
+            "percentage": pillar["percentage"],
+            "criteria": [
+                {
+                    "id": c["id"],
+                    "status": c["status"],
+                    "icon": CRITERION_ICONS.get(c["status"], "—"),
+                    "score": c["score"],
+                    "reason": c["reason"],
+                }
+                for c in pillar["criteria"]
+            ],
+        })
     
-    # Header
-    lines.append(f"# Agent Readiness Report: {repo_name}")
-    lines.append("")
-    lines.append(f"**Languages**: {', '.join(languages)}  ")
-    lines.append(f"**Repository Type**: {repo_type}  ")
-    lines.append(f"**Pass Rate**: {pass_rate}% ({total_passed}/{total} criteria)  ")
-    if achieved > 0:
-        lines.append(f"**Achieved Level**: **L{achieved}**")
-    else:
-        lines.append(f"**Achieved Level**: **Not yet L1** (need 80% at L1)")
-    lines.append("")
+    opportunities = get_top_opportunities(data)
+    next_steps_title, next_steps = _next_steps(achieved)
+    return {
+        "repo_name": data["repo_name"],
+        "languages": ", ".join(data.get("languages", ["Unknown"])),
+        "repo_type": data.get("repo_type", "application"),
+        "pass_rate": data["pass_rate"],
+        "total_passed": data["total_passed"],
+        "total_criteria": data["total_criteria"],
+        "achieved_level": achieved,
+        "level_name": f"Level {achieved}" if achieved > 0 else "Not yet L1",
+        "levels": levels,
+        "strengths": get_top_strengths(data),
+        "opportunities": opportunities,
+        "quick_wins": opportunities[:3],
+        "pillars": pillars,
+        "next_steps_title": next_steps_title,
+        "next_steps": next_steps,
+    }
+
+
+class CompiledTemplate:
+    """
+    A ``str.format``-style template parsed once into literal and field
+    segments. Fields are plain names; values are escaped for the output
+    format unless the field name ends in ``_html`` (a pre-rendered fragment).
+    """
+    
+    __slots__ = ("segments",)
+    
+    def __init__(self, source: str):
+        segments = []
+        for literal, field_name, spec, conversion in _FORMATTER.parse(source):
+            if field_name is not None and (
+                not field_name.isidentifier() or conversion or "{" in (spec or "")
+            ):
+                raise ValueError(f"Unsupported template field: {{{field_name}}}")
+            segments.append((literal, field_name, spec or ""))
+        self.segments = tuple(segments)
+    
+    def render(self, fields: dict, escape) -> str:
+        out = []
+        for literal, field_name, spec in self.segments:
+            out.append(literal)
+            if field_name is not None:
+                value = format(fields[field_name], spec)
+                out.append(value if field_name.endswith("_html") else escape(value))
+        return "".join(out)
+
+
+MARKDOWN_TEMPLATES = {
+    "header": (
+        "# Agent Readiness Report: {repo_name}\n\n"
+        "**Languages**: {languages}  \n"
+        "**Repository Type**: {repo_type}  \n"
+        "**Pass Rate**: {pass_rate}% ({total_passed}/{total_criteria} criteria)  \n"
+    ),
+    "achieved": "**Achieved Level**: **L{achieved_level}**\n\n",
+    "not_achieved": "**Achieved Level**: **Not yet L1** (need 80% at L1)\n\n",
+    "levels": "## Level Progress\n\n| Level | Score | Status |\n|-------|-------|--------|\n",
+    "level_achieved": "| L{level} | {score:.0f}% | ✅ Achieved |\n",
+    "level_passed": "| L{level} | {score:.0f}% | ✅ Passed |\n",
+    "level_pending": "| L{level} | {score:.0f}% | ⬜ {remaining:.0f}% to go |\n",
+    "summary": "\n## Summary\n\n",
+    "strengths": "### Strengths\n\n",
+    "strength": "- **{pillar}** ({percentage}%)\n",
+    "strength_with_examples": "- **{pillar}** ({percentage}%): {examples_html}\n",
+    "code": "`{text}`",
+    "opportunities": (
+        "### Priority Improvements\n\n"
+        "| Criterion | Issue | Pillar |\n|-----------|-------|--------|\n"
+    ),
+    "opportunity": "| `{id}` | {reason} | {pillar} |\n",
+    "section_end": "\n",
+    "details": "## Detailed Results\n\n",
+    "pillar": (
+        "### {name}\n**Score**: {passed}/{total} ({percentage}%)\n\n"
+        "| Status | Criterion | Score | Details |\n|--------|-----------|-------|---------|\n"
+    ),
+    "criterion": "| {icon} | `{id}` | {score} | {reason} |\n",
+    "pillar_end": "\n",
+    "next_steps": "## Recommended Next Steps\n\n**{title}**\n",
+    "next_step": "{number}. {text}\n",
+    "footer": "\n---\n*Report generated from repository analysis*",
+}
+
+BRIEF_TEMPLATES = {
+    "header": (
+        "## Agent Readiness: {repo_name}\n\n"
+        "**{level_name}** | {pass_rate}% ({total_passed}/{total_criteria})\n\n"
+    ),
+    "level_achieved": "L{level} ✅ [{bar}] {score:.0f}%\n",
+    "level_pending": "L{level} ⬜ [{bar}] {score:.0f}%\n",
+    "quick_wins": "\n**Quick Wins:**",
+    "quick_win": "\n- {id}: {reason}",
+}
+
+HTML_STYLE = """
+body { font-family: -apple-system, "Segoe UI", Helvetica, Arial, sans-serif; color: #1f2328;
+       max-width: 960px; margin: 2rem auto; padding: 0 1rem; line-height: 1.5; }
+h1, h2, h3 { border-bottom: 1px solid #d0d7de; padding-bottom: .3em; }
+table { border-collapse: collapse; width: 100%; margin: 1em 0; }
+th, td { border: 1px solid #d0d7de; padding: 6px 12px; text-align: left; vertical-align: top; }
+th { background: #f6f8fa; }
+code { background: #f6f8fa; padding: .1em .4em; border-radius: 4px; font-size: 90%; }
+.meta { color: #59636e; }
+.bar { background: #eaeef2; border-radius: 4px; height: 10px; width: 160px; display: inline-block; }
+.bar span { background: #1f883d; border-radius: 4px; height: 10px; display: block; }
+.pass { color: #1a7f37; } .fail { color: #cf222e; } .skip { color: #59636e; }
+footer { color: #59636e; font-style: italic; margin-top: 2em; }
+"""
+
+HTML_TEMPLATES = {
+    "header": (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+        "<title>Agent Readiness Report: {repo_name}</title>\n"
+        # The stylesheet is inlined at compile time, so braces are escaped
+        "<style>" + HTML_STYLE.replace("{", "{{").replace("}", "}}") + "</style>\n"
+        "</head>\n<body>\n<h1>Agent Readiness Report: {repo_name}</h1>\n"
+        "<p class=\"meta\"><strong>Languages</strong>: {languages}<br>\n"
+        "<strong>Repository Type</strong>: {repo_type}<br>\n"
+        "<strong>Pass Rate</strong>: {pass_rate}% ({total_passed}/{total_criteria} criteria)<br>\n"
+    ),
+    "achieved": "<strong>Achieved Level</strong>: <strong>L{achieved_level}</strong></p>\n",
+    "not_achieved": (
+        "<strong>Achieved Level</strong>: <strong>Not yet L1</strong> (need 80% at L1)</p>\n"
+    ),
+    "levels": (
+        "<h2>Level Progress</h2>\n<table>\n"
+        "<tr><th>Level</th><th>Score</th><th>Progress</th><th>Status</th></tr>\n"
+    ),
+    "level_achieved": (
+        "<tr><td>L{level}</td><td>{score:.0f}%</td><td>{bar_html}</td><td>✅ Achieved</td></tr>\n"
+    ),
+    "level_passed": (
+        "<tr><td>L{level}</td><td>{score:.0f}%</td><td>{bar_html}</td><td>✅ Passed</td></tr>\n"
+    ),
+    "level_pending": (
+        "<tr><td>L{level}</td><td>{score:.0f}%</td><td>{bar_html}</td>"
+        "<td>⬜ {remaining:.0f}% to go</td></tr>\n"
+    ),
+    "bar": "<span class=\"bar\"><span style=\"width: {width:.0f}%\"></span></span>",
+    "summary": "</table>\n<h2>Summary</h2>\n",
+    "strengths": "<h3>Strengths</h3>\n<ul>\n",
+    "strength": "<li><strong>{pillar}</strong> ({percentage}%)</li>\n",
+    "strength_with_examples": (
+        "<li><strong>{pillar}</strong> ({percentage}%): {examples_html}</li>\n"
+    ),
+    "code": "<code>{text}</code>",
+    "strengths_end": "</ul>\n",
+    "opportunities": (
+        "<h3>Priority Improvements</h3>\n<table>\n"
+        "<tr><th>Criterion</th><th>Issue</th><th>Pillar</th></tr>\n"
+    ),
+    "opportunity": "<tr><td><code>{id}</code></td><td>{reason}</td><td>{pillar}</td></tr>\n",
+    "section_end": "</table>\n",
+    "details": "<h2>Detailed Results</h2>\n",
+    "pillar": (
+        "<h3>{name}</h3>\n<p><strong>Score</strong>: {passed}/{total} ({percentage}%)</p>\n"
+        "<table>\n<tr><th>Status</th><th>Criterion</th><th>Score</th><th>Details</th></tr>\n"
+    ),
+    "criterion": (
+        "<tr><td class=\"{status}\">{icon}</td><td><code>{id}</code></td>"
+        "<td>{score}</td><td>{reason}</td></tr>\n"
+    ),
+    "pillar_end": "</table>\n",
+    "next_steps": "<h2>Recommended Next Steps</h2>\n<p><strong>{title}</strong></p>\n<ol>\n",
+    "next_step": "<li>{text}</li>\n",
+    "footer": (
+        "</ol>\n<footer>Report generated from repository analysis</footer>\n</body>\n</html>\n"
+    ),
+}
+
+
+class ReportRenderer:
+    """Renders report models with one format's precompiled templates."""
+    
+    def __init__(self, templates: dict[str, str], escape=None):
+        self.templates = {name: CompiledTemplate(src) for name, src in templates.items()}
+        self.escape = escape or (lambda value: value)
+    
+    def fill(self, name: str, fields: dict = None, **extra) -> str:
+        """Render the named template with fields from a mapping and keywords."""
+        if fields is None:
+            fields = extra
+        elif extra:
+            fields = {**fields, **extra}
+        return self.templates[name].render(fields, self.escape)
+    
+    def has(self, name: str) -> bool:
+        return name in self.templates
+
+
+@lru_cache(maxsize=None)
+def get_renderer(fmt: str) -> ReportRenderer:
+    """Return the renderer for a format; templates are compiled once per process."""
+    if fmt == "markdown":
+        return ReportRenderer(MARKDOWN_TEMPLATES)
+    if fmt == "html":
+        return ReportRenderer(HTML_TEMPLATES, escape=partial(html.escape, quote=True))
+    if fmt == "brief":
+        return ReportRenderer(BRIEF_TEMPLATES)
+    raise ValueError(f"Unknown report format: {fmt}")
+
+
+def _render_full_report(model: dict, r: ReportRenderer) -> str:
+    """Render the full report layout shared by markdown and HTML."""
+    out = [r.fill("header", model)]
+    out.append(r.fill("achieved" if model["achieved_level"] > 0 else "not_achieved", model))
     
     # Level Progress
-    lines.append("## Level Progress")
-    lines.append("")
-    lines.append("| Level | Score | Status |")
-    lines.append("|-------|-------|--------|")
-    for level in range(1, 6):
-        score = level_scores.get(str(level), level_scores.get(level, 0))
-        if achieved > 0 and level <= achieved:
-            status = "✅ Achieved"
-        elif score >= 80:
-            status = "✅ Passed"
+    out.append(r.fill("levels"))
+    for level in model["levels"]:
+        if level["achieved"]:
+            name = "level_achieved"
+        elif level["passed"]:
+            name = "level_passed"
         else:
-            status = f"⬜ {100-score:.0f}% to go"
-        lines.append(f"| L{level} | {score:.0f}% | {status} |")
-    lines.append("")
+            name = "level_pending"
+        bar_html = r.fill("bar", width=min(100, max(0, level["score"]))) if r.has("bar") else ""
+        out.append(r.fill(name, level, bar_html=bar_html))
     
     # Summary
-    lines.append("## Summary")
-    lines.append("")
-    
-    # Strengths
-    strengths = get_top_strengths(data)
-    if strengths:
-        lines.append("### Strengths")
-        lines.append("")
-        for pillar_name, pct, passing in strengths:
+    out.append(r.fill("summary"))
+    if model["strengths"]:
+        out.append(r.fill("strengths"))
+        for pillar_name, pct, passing in model["strengths"]:
             if passing:
-                passing_str = ", ".join(f"`{p}`" for p in passing)
-                lines.append(f"- **{pillar_name}** ({pct}%): {passing_str}")
+                examples = ", ".join(r.fill("code", text=p) for p in passing)
+                out.append(r.fill(
+                    "strength_with_examples",
+                    pillar=pillar_name, percentage=pct, examples_html=examples
+                ))
             else:
-                lines.append(f"- **{pillar_name}** ({pct}%)")
-        lines.append("")
+                out.append(r.fill("strength", pillar=pillar_name, percentage=pct))
+        out.append(r.fill("strengths_end" if r.has("strengths_end") else "section_end"))
     
-    # Opportunities
-    opportunities = get_top_opportunities(data)
-    if opportunities:
-        lines.append("### Priority Improvements")
-        lines.append("")
-        lines.append("| Criterion | Issue | Pillar |")
-        lines.append("|-----------|-------|--------|")
-        for crit_id, reason, pillar in opportunities:
-            lines.append(f"| `{crit_id}` | {reason} | {pillar} |")
-        lines.append("")
+    if model["opportunities"]:
+        out.append(r.fill("opportunities"))
+        for crit_id, reason, pillar_name in model["opportunities"]:
+            out.append(r.fill("opportunity", id=crit_id, reason=reason, pillar=pillar_name))
+        out.append(r.fill("section_end"))
     
     # Detailed Results
-    lines.append("## Detailed Results")
+    out.append(r.fill("details"))
+    for pillar in model["pillars"]:
+        out.append(r.fill("pillar", pillar))
+        for criterion in pillar["criteria"]:
+            out.append(r.fill("criterion", criterion))
+        out.append(r.fill("pillar_end"))
+    
+    # Recommendations
+    out.append(r.fill("next_steps", title=model["next_steps_title"]))
+    for number, text in enumerate(model["next_steps"], 1):
+        out.append(r.fill("next_step", number=number, text=text))
+    out.append(r.fill("footer"))
+    return "".join(out)
+
+
+def _render_brief_report(model: dict, r: ReportRenderer) -> str:
+    """Render the brief summary layout."""
+    out = [r.fill("header", model)]
+    for level in model["levels"]:
+        out.append(r.fill("level_achieved" if level["achieved"] else "level_pending", level))
+    if model["quick_wins"]:
+        out.append(r.fill("quick_wins"))
+        for crit_id, reason, _ in model["quick_wins"]:
+            out.append(r.fill("quick_win", id=crit_id, reason=reason))
+    return "".join(out)
+
+
+def as_report_data(analysis) -> dict:
+    """
+    Return an analysis as the report dict.
+    
+    Accepts the dict written by analyze_repo.py or an in-memory
+    ``AnalysisResult``, so analyzer results feed the report functions
+    directly without a JSON round trip.
+    """
+    if isinstance(analysis, dict):
+        return analysis
+    # Round trip so statuses are plain strings and keys match the JSON file
+    return json.loads(json.dumps(_sibling("analyze_repo").analysis_to_dict(analysis)))
+
+
+def _sibling(name: str):
+    """Import a module from this script's directory, wherever it is loaded from."""
+    path = Path(__file__).resolve().parent / f"{name}.py"
+    module = sys.modules.get(name)
+    if module is not None and Path(getattr(module, "__file__", "")).resolve() == path:
+        return module
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def render_report(data, fmt: str = "markdown") -> str:
+    """Render one analysis as 'markdown', 'html' (self-contained), 'brief' or 'json'."""
+    data = as_report_data(data)
+    if fmt == "json":
+        return json.dumps(data, indent=2)
+    model = build_report_model(data)
+    renderer = get_renderer(fmt)
+    if fmt == "brief":
+        return _render_brief_report(model, renderer)
+    return _render_full_report(model, renderer)
+
+
+def render_reports(analyses: Iterable[dict], fmt: str = "markdown") -> Iterator[str]:
+    """Render many analyses in one process, reusing the compiled templates."""
+    for data in analyses:
+        yield render_report(data, fmt)
+
+
+def analyze_and_report(repo_path: str, fmt: str = "markdown", ref: str = "HEAD") -> tuple[dict, str]:
+    """
+    Analyze a repository and render its report in one process.
+    
+    Returns (analysis data, rendered report). Nothing is written to disk.
+    """
+    data = as_report_data(_sibling("analyze_repo").RepoAnalyzer(repo_path, ref).analyze())
+    return data, render_report(data, fmt)
+
+
+async def analyze_and_report_async(
+    repo_path: str, fmt: str = "markdown", ref: str = "HEAD", executor=None
+) -> tuple[dict, str]:
+    """Async variant of analyze_and_report built on RepoAnalyzer.analyze_async."""
+    result = await _sibling("analyze_repo").RepoAnalyzer(repo_path, ref).analyze_async(executor)
+    data = as_report_data(result)
+    return data, render_report(data, fmt)
+
+
+def generate_markdown_report(data: dict) -> str:
+    """Generate a full markdown report from analysis data."""
+    return render_report(data, "markdown")
+
+
+def generate_html_report(data: dict) -> str:
+    """Generate a self-contained HTML report (inline CSS, no external assets)."""
+    return render_report(data, "html")
+
+
+def generate_brief_report(data: dict) -> str:
+    """Generate a brief summary report."""
+    return render_report(data, "brief")
+
+
+def _index_criteria(data: dict) -> dict[str, dict]:
+    """Map criterion id to the criterion, with its pillar name attached."""
+    return {
+        criterion["id"]: {**criterion, "pillar": pillar_name}
+        for pillar_name, pillar in data["pillars"].items()
+        for criterion in pillar["criteria"]
+    }
+
+
+def diff_analyses(baseline: dict, current: dict) -> dict:
+    """
+    Compute a criterion-level diff between two analyses.
+    
+    Returns newly passing and newly failing criteria, skip changes (a
+    criterion entering or leaving the skipped state), criteria that exist
+    on only one side, and changes in pass rate, achieved level and
+    per-level scores.
+    """
+    baseline, current = as_report_data(baseline), as_report_data(current)
+    before = _index_criteria(baseline)
+    after = _index_criteria(current)
+    
+    def entry(crit_id: str) -> dict:
+        old, new = before.get(crit_id), after.get(crit_id)
+        ref = new or old
+        return {
+            "id": crit_id,
+            "pillar": ref["pillar"],
+            "level": ref["level"],
+            "before": old["status"] if old else None,
+            "after": new["status"] if new else None,
+            "reason": ref.get("reason", ""),
+        }
+    
+    newly_passing, newly_failing, skip_changes = [], [], []
+    for crit_id in before.keys() & after.keys():
+        old_status, new_status = before[crit_id]["status"], after[crit_id]["status"]
+        if old_status == new_status:
+            continue
+        if "skip" in (old_status, new_status):
+            skip_changes.append(entry(crit_id))
+        elif new_status == "pass":
+            newly_passing.append(entry(crit_id))
+        else:
+            newly_failing.append(entry(crit_id))
+    
+    level_changes = {}
+    for level in range(1, 6):
+        old_score = baseline["level_scores"].get(str(level), baseline["level_scores"].get(level, 0))
+        new_score = current["level_scores"].get(str(level), current["level_scores"].get(level, 0))
+        if old_score != new_score:
+            level_changes[level] = {
+                "before": old_score,
+                "after": new_score,
+                "delta": round(new_score - old_score, 1),
+            }
+    
+    def by_level(entries: list[dict]) -> list[dict]:
+        return sorted(entries, key=lambda e: (e["level"], e["id"]))
+    
+    return {
+        "repo_name": current["repo_name"],
+        "pass_rate": {
+            "before": baseline["pass_rate"],
+            "after": current["pass_rate"],
+            "delta": round(current["pass_rate"] - baseline["pass_rate"], 1),
+        },
+        "achieved_level": {
+            "before": baseline["achieved_level"],
+            "after": current["achieved_level"],
+        },
+        "level_scores": level_changes,
+        "newly_passing": by_level(newly_passing),
+        "newly_failing": by_level(newly_failing),
+        "skip_changes": by_level(skip_changes),
+        "added": by_level([entry(c) for c in after.keys() - before.keys()]),
+        "removed": by_level([entry(c) for c in before.keys() - after.keys()]),
+    }
+
+
+def generate_diff_report(diff: dict, brief: bool = False) -> str:
+    """Generate a compact markdown delta, suitable for a PR comment."""
+    level = diff["achieved_level"]
+    pass_rate = diff["pass_rate"]
+    
+    def level_label(value: int) -> str:
+        return f"L{value}" if value > 0 else "Not yet L1"
+    
+    lines = []
+    lines.append(f"## Agent Readiness Diff: {diff['repo_name']}")
+    lines.append("")
+    lines.append(
+        f"**Level**: {level_label(level['before'])} → {level_label(level['after'])} | "
+        f"**Pass Rate**: {pass_rate['before']}% → {pass_rate['after']}% "
+        f"({pass_rate['delta']:+.1f})"
+    )
     lines.append("")
     
-    for pillar_name, pillar in data["pillars"].items():
-        pct = pillar["percentage"]
-        passed = pillar["passed"]
-        total = pillar["total"]
-        
-        lines.append(f"### {pillar_name}")
-        lines.append(f"**Score**: {passed}/{total} ({pct}%)")
+    sections = [
+        ("✗ Newly Failing", diff["newly_failing"]),
+        ("✓ Newly Passing", diff["newly_passing"]),
+        ("— Skip Changes", diff["skip_changes"]),
+        ("New Criteria", diff["added"]),
+        ("Removed Criteria", diff["removed"]),
+    ]
+    if not any(entries for _, entries in sections):
+        lines.append("No criterion changes.")
+        return "\n".join(lines)
+    
+    if brief:
+        labels = ["newly failing", "newly passing", "skip changes", "new criteria", "removed criteria"]
+        counts = [f"{len(entries)} {label}"
+                  for label, (_, entries) in zip(labels, sections) if entries]
+        lines.append(", ".join(counts))
+        return "\n".join(lines)
+    
+    for title, entries in sections:
+        if not entries:
+            continue
+        lines.append(f"**{title}** ({len(entries)})")
+        for e in entries:
+            detail = e["reason"]
+            if e["before"] and e["after"] and "skip" in (e["before"], e["after"]):
+                detail = f"{e['before']} → {e['after']} ({e['reason']})"
+            lines.append(f"- `{e['id']}` (L{e['level']}, {e['pillar']}): {detail}")
         lines.append("")
-        lines.append("| Status | Criterion | Score | Details |")
-        lines.append("|--------|-----------|-------|---------|")
+    
+    if diff["level_scores"]:
+        changes = ", ".join(
+            f"L{lvl} {c['before']:.0f}% → {c['after']:.0f}%"
+            for lvl, c in diff["level_scores"].items()
+        )
+        lines.append(f"*Level scores: {changes}*")
+    
+    return "\n".join(lines).rstrip()
+
+
+def iter_analyses(sources: Iterable[str], errors: list[str] = None) -> Iterator[dict]:
+    """
+    Stream analysis dicts from files, directories and JSON Lines inputs.
+    
+    Directories are searched recursively for ``*.json`` and ``*.jsonl``
+    files; ``-`` reads JSON Lines from stdin. Only one analysis is held in
+    memory at a time. Unreadable inputs are reported through ``errors``.
+    """
+    for source in sources:
+        if source == "-":
+            yield from _iter_json_lines(sys.stdin, "<stdin>", errors)
+            continue
         
-        for criterion in pillar["criteria"]:
-            status = criterion["status"]
-            if status == "pass":
-                icon = "✓"
-            elif status == "fail":
-                icon = "✗"
-            else:
-                icon = "—"
-            
-            crit_id = criterion["id"]
-            score = criterion["score"]
-            reason = criterion["reason"]
-            lines.append(f"| {icon} | `{crit_id}` | {score} | {reason} |")
+        path = Path(source)
+        if path.is_dir():
+            files = (p for p in path.rglob("*") if p.suffix in (".json", ".jsonl", ".ndjson"))
+        else:
+            files = [path]
         
-        lines.append("")
+        for file_path in files:
+            try:
+                if file_path.suffix in (".jsonl", ".ndjson"):
+                    with file_path.open() as f:
+                        yield from _iter_json_lines(f, str(file_path), errors)
+                else:
+                    yield _analysis_object(json.loads(file_path.read_text()))
+            except (OSError, ValueError) as e:
+                if errors is not None:
+                    errors.append(f"{file_path}: {e}")
+
+
+def _analysis_object(data):
+    """Reject JSON that is not an analysis object (a list, number, ...)."""
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+    return data
+
+
+def _iter_json_lines(lines: Iterable[str], name: str, errors: list[str] = None) -> Iterator[dict]:
+    """Yield one analysis per non-empty JSON Lines record."""
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield _analysis_object(json.loads(line))
+        except ValueError as e:
+            if errors is not None:
+                errors.append(f"{name}:{line_no}: {e}")
+
+
+def _histogram_percentile(histogram: list[int], count: int, percentile: float) -> int:
+    """Nearest-rank percentile over a histogram of integer buckets."""
+    if count == 0:
+        return 0
+    rank = max(1, -(-count * percentile // 100))  # ceil without floats
+    seen = 0
+    for bucket, bucket_count in enumerate(histogram):
+        seen += bucket_count
+        if seen >= rank:
+            return bucket
+    return len(histogram) - 1
+
+
+class FleetAggregator:
+    """
+    Incremental aggregates over many analyses in constant memory.
     
-    # Recommendations
-    lines.append("## Recommended Next Steps")
+    Memory is bounded by the number of distinct criteria and pillars, not
+    the number of repositories: pillar scores are whole percentages, so
+    exact percentiles come from fixed 101-bucket histograms.
+    """
+    
+    def __init__(self):
+        self.repo_count = 0
+        self.level_distribution: Counter = Counter()
+        self.pass_rate_sum = 0.0
+        self.pass_rate_histogram = [0] * 101
+        self.criteria: dict[str, dict] = {}
+        self.pillar_histograms: dict[str, list[int]] = {}
+        self.pillar_counts: Counter = Counter()
+    
+    def add(self, data: dict) -> None:
+        """Fold one analysis into the aggregates."""
+        data = as_report_data(data)
+        self.repo_count += 1
+        self.level_distribution[data.get("achieved_level", 0)] += 1
+        pass_rate = data.get("pass_rate", 0.0)
+        self.pass_rate_sum += pass_rate
+        self.pass_rate_histogram[min(100, max(0, int(pass_rate)))] += 1
+        
+        for pillar_name, pillar in data.get("pillars", {}).items():
+            if pillar["total"] > 0:
+                histogram = self.pillar_histograms.setdefault(pillar_name, [0] * 101)
+                histogram[min(100, max(0, pillar["percentage"]))] += 1
+                self.pillar_counts[pillar_name] += 1
+            
+            for criterion in pillar["criteria"]:
+                stats = self.criteria.get(criterion["id"])
+                if stats is None:
+                    stats = self.criteria[criterion["id"]] = {
+                        "pillar": pillar_name,
+                        "level": criterion["level"],
+                        "pass": 0,
+                        "fail": 0,
+                        "skip": 0,
+                    }
+                stats[criterion["status"]] += 1
+    
+    def pillar_percentiles(self) -> dict[str, dict[int, int]]:
+        """Pillar score percentiles across repositories that score the pillar."""
+        return {
+            name: {
+                p: _histogram_percentile(histogram, self.pillar_counts[name], p)
+                for p in FLEET_PERCENTILES
+            }
+            for name, histogram in self.pillar_histograms.items()
+        }
+    
+    def criterion_pass_rates(self) -> list[tuple[str, dict, float]]:
+        """Criteria with their pass rate over applicable repos, lowest first."""
+        rates = []
+        for crit_id, stats in self.criteria.items():
+            applicable = stats["pass"] + stats["fail"]
+            rate = (stats["pass"] / applicable * 100) if applicable else 100.0
+            rates.append((crit_id, stats, round(rate, 1)))
+        rates.sort(key=lambda x: (x[2], x[1]["level"], x[0]))
+        return rates
+    
+    def summary(self) -> dict:
+        """JSON-serializable summary of the aggregates."""
+        return {
+            "repo_count": self.repo_count,
+            "mean_pass_rate": round(self.pass_rate_sum / self.repo_count, 1) if self.repo_count else 0.0,
+            "median_pass_rate": _histogram_percentile(self.pass_rate_histogram, self.repo_count, 50),
+            "level_distribution": {
+                level: self.level_distribution.get(level, 0) for level in range(0, 6)
+            },
+            "pillar_percentiles": self.pillar_percentiles(),
+            "criteria": {
+                crit_id: {**stats, "pass_rate": rate}
+                for crit_id, stats, rate in self.criterion_pass_rates()
+            },
+        }
+
+
+def generate_fleet_report(fleet: FleetAggregator, brief: bool = False) -> str:
+    """Generate a markdown summary report across many analyses."""
+    summary = fleet.summary()
+    count = fleet.repo_count
+    
+    lines = []
+    lines.append("# Agent Readiness Fleet Report")
+    lines.append("")
+    lines.append(f"**Repositories**: {count}  ")
+    lines.append(f"**Mean Pass Rate**: {summary['mean_pass_rate']}%  ")
+    lines.append(f"**Median Pass Rate**: {summary['median_pass_rate']}%")
     lines.append("")
     
-    if achieved < 2:
-        lines.append("**Focus on L1/L2 Foundations:**")
-        lines.append("1. Add missing linter and formatter configurations")
-        lines.append("2. Document build and test commands in README")
-        lines.append("3. Set up pre-commit hooks for fast feedback")
-        lines.append("4. Create AGENTS.md with project context for AI agents")
-    elif achieved < 3:
-        lines.append("**Progress to L3 (Production Ready):**")
-        lines.append("1. Add integration/E2E tests")
-        lines.append("2. Set up test coverage thresholds")
-        lines.append("3. Configure devcontainer for reproducible environments")
-        lines.append("4. Add automated PR review tooling")
-    else:
-        lines.append("**Optimize for L4+:**")
-        lines.append("1. Implement complexity analysis and dead code detection")
-        lines.append("2. Set up flaky test detection and quarantine")
-        lines.append("3. Add security scanning (CodeQL, Snyk)")
-        lines.append("4. Configure deployment observability")
+    # Level distribution
+    lines.append("## Level Distribution")
+    lines.append("")
+    lines.append("| Level | Repositories | Share |")
+    lines.append("|-------|--------------|-------|")
+    for level, repos in summary["level_distribution"].items():
+        label = f"L{level}" if level > 0 else "Not yet L1"
+        share = (repos / count * 100) if count else 0
+        lines.append(f"| {label} | {repos} | {share:.0f}% |")
+    lines.append("")
     
+    # Pillar percentiles
+    lines.append("## Pillar Scores")
+    lines.append("")
+    header = " | ".join(f"p{p}" for p in FLEET_PERCENTILES)
+    lines.append(f"| Pillar | {header} |")
+    lines.append("|--------|" + "-----|" * len(FLEET_PERCENTILES))
+    for pillar_name, percentiles in summary["pillar_percentiles"].items():
+        values = " | ".join(f"{percentiles[p]}%" for p in FLEET_PERCENTILES)
+        lines.append(f"| {pillar_name} | {values} |")
     lines.append("")
+    
+    if not brief:
+        # Per-criterion pass rates, weakest first
+        lines.append("## Criteria Pass Rates")
+        lines.append("")
+        lines.append("| Criterion | Level | Pillar | Pass Rate | Pass | Fail | Skip |")
+        lines.append("|-----------|-------|--------|-----------|------|------|------|")
+        for crit_id, stats, rate in fleet.criterion_pass_rates():
+            lines.append(
+                f"| `{crit_id}` | L{stats['level']} | {stats['pillar']} | {rate}% "
+                f"| {stats['pass']} | {stats['fail']} | {stats['skip']} |"
+            )
+        lines.append("")
+    
     lines.append("---")
-    lines.append(f"*Report generated from repository analysis*")
+    lines.append(f"*Fleet report generated from {count} repository analyses*")
     
     return "\n".join(lines)
 
 
-def generate_brief_report(data: dict) -> str:
-    """Generate a brief summary report."""
-    repo_name = data["repo_name"]
-    pass_rate = data["pass_rate"]
-    achieved = data["achieved_level"]
-    total_passed = data["total_passed"]
-    total = data["total_criteria"]
+def _run_label(run) -> str:
+    """Short label for a stored run: timestamp and abbreviated commit."""
+    commit = (run["commit_sha"] or "")[:8] or "—"
+    return f"{run['recorded_at']} ({commit})"
+
+
+def generate_trend_report(store, repo: str = None, limit: int = 30, base_commit: str = None) -> str:
+    """
+    Render score history and regressions from a trend store.
     
+    With a repo, the latest run is compared with the previous run (or with
+    the run recorded for base_commit); without one, every repository's two
+    latest runs are compared.
+    """
+    if repo is None:
+        return _generate_fleet_trend_report(store)
+    
+    runs = store.history(repo, limit)
     lines = []
-    lines.append(f"## Agent Readiness: {repo_name}")
-    lines.append("")
-    level_str = f"Level {achieved}" if achieved > 0 else "Not yet L1"
-    lines.append(f"**{level_str}** | {pass_rate}% ({total_passed}/{total})")
+    lines.append(f"# Readiness Trend: {repo}")
     lines.append("")
+    if not runs:
+        lines.append("No runs recorded for this repository.")
+        return "\n".join(lines)
     
-    # Quick level summary
-    for level in range(1, 6):
-        score = data["level_scores"].get(str(level), data["level_scores"].get(level, 0))
-        bar = "█" * int(score / 10) + "░" * (10 - int(score / 10))
-        check = "✅" if achieved > 0 and level <= achieved else "⬜"
-        lines.append(f"L{level} {check} [{bar}] {score:.0f}%")
+    base = runs[1] if len(runs) >= 2 else None
+    if base_commit:
+        base = store.run_for_commit(repo, base_commit)
+        if base is None:
+            lines.append(f"No run recorded for commit `{base_commit}`.")
+            lines.append("")
     
-    lines.append("")
+    if base is not None:
+        delta = store.compare(base, runs[0])
+        lines.append(f"**Latest**: {_run_label(runs[0])}  ")
+        lines.append(f"**Baseline**: {_run_label(base)}  ")
+        lines.append(
+            f"**Pass Rate**: {runs[0]['pass_rate']}% ({delta['pass_rate_delta']:+.1f})  "
+        )
+        lines.append(
+            f"**Achieved Level**: L{runs[0]['achieved_level']} ({delta['level_delta']:+d})"
+        )
+        lines.append("")
+        lines.extend(_change_table("Regressions", delta["regressions"]))
+        lines.extend(_change_table("Improvements", delta["improvements"]))
     
-    # Top opportunities
-    opps = get_top_opportunities(data, 3)
-    if opps:
-        lines.append("**Quick Wins:**")
-        for crit_id, reason, _ in opps:
-            lines.append(f"- {crit_id}: {reason}")
+    lines.append("## History")
+    lines.append("")
+    lines.append("| Recorded | Commit | Level | Pass Rate | Δ |")
+    lines.append("|----------|--------|-------|-----------|---|")
+    for i, run in enumerate(runs):
+        if i + 1 < len(runs):
+            change = f"{run['pass_rate'] - runs[i + 1]['pass_rate']:+.1f}"
+        else:
+            change = "—"
+        commit = (run["commit_sha"] or "")[:8] or "—"
+        lines.append(
+            f"| {run['recorded_at']} | {commit} | L{run['achieved_level']} "
+            f"| {run['pass_rate']}% | {change} |"
+        )
     
     return "\n".join(lines)
 
 
+def _change_table(title: str, changes: list[dict]) -> list[str]:
+    """Format criterion status changes as a markdown table section."""
+    if not changes:
+        return []
+    lines = [f"### {title}", "", "| Criterion | Level | Pillar | Change |",
+             "|-----------|-------|--------|--------|"]
+    for c in changes:
+        lines.append(
+            f"| `{c['criterion_id']}` | L{c['level']} | {c['pillar']} "
+            f"| {c['before']} → {c['after']} |"
+        )
+    lines.append("")
+    return lines
+
+
+def _generate_fleet_trend_report(store) -> str:
+    """Render the latest score delta of every repository in a trend store."""
+    deltas = store.latest_deltas()
+    lines = []
+    lines.append("# Readiness Trend: Fleet")
+    lines.append("")
+    lines.append("Latest run compared with the previous run of each repository, "
+                 "largest drops first.")
+    lines.append("")
+    lines.append("| Repository | Level | Pass Rate | Δ | Regressions |")
+    lines.append("|------------|-------|-----------|---|-------------|")
+    for delta in deltas:
+        head = delta["head"]
+        regressed = ", ".join(f"`{c['criterion_id']}`" for c in delta["regressions"][:5])
+        if len(delta["regressions"]) > 5:
+            regressed += f" (+{len(delta['regressions']) - 5} more)"
+        lines.append(
+            f"| {delta['repo']} | L{head['achieved_level']} ({delta['level_delta']:+d}) "
+            f"| {head['pass_rate']}% | {delta['pass_rate_delta']:+.1f} | {regressed or '—'} |"
+        )
+    return "\n".join(lines)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate Agent Readiness report from analysis"
@@ -253,40 +965,134 @@ def main():
         default="/tmp/readiness_analysis.json",
         help="Path to analysis JSON file"
     )
+    parser.add_argument(
+        "--repo-path", "-r",
+        help="Analyze this repository in-process and report on it directly, "
+             "instead of reading --analysis-file"
+    )
+    parser.add_argument(
+        "--ref",
+        default="HEAD",
+        help="Git ref to analyze with --repo-path for bare repositories (default: HEAD)"
+    )
+    parser.add_argument(
+        "--baseline", "-b",
+        help="Earlier analysis JSON to diff against; renders only the changes"
+    )
+    parser.add_argument(
+        "--fleet",
+        nargs="+",
+        metavar="SOURCE",
+        help="Summarize many analyses: JSON files, directories of them, "
+             "JSON Lines files, or '-' for JSON Lines on stdin"
+    )
     parser.add_argument(
         "--output", "-o",
         help="Output file (default: stdout)"
     )
     parser.add_argument(
         "--format", "-f",
-        choices=["markdown", "brief", "json"],
+        choices=["markdown", "html", "brief", "json", "trend"],
         default="markdown",
-        help="Output format"
+        help="Output format ('html' is a self-contained page; "
+             "'trend' renders history from --trend-db)"
+    )
+    parser.add_argument(
+        "--trend-db",
+        help="SQLite trend store to record into (--record) or report from (--format trend)"
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Append the analysis to --trend-db before rendering"
+    )
+    parser.add_argument(
+        "--repo",
+        help="Repository key in the trend store (default: the analysis repo_name; "
+             "omit with --format trend for a fleet-wide summary)"
+    )
+    parser.add_argument(
+        "--trend-base",
+        metavar="COMMIT",
+        help="Compare the latest run against the run for this commit (--format trend)"
     )
     
     args = parser.parse_args()
     
-    # Load analysis
-    analysis_path = Path(args.analysis_file)
-    if not analysis_path.exists():
-        print(f"❌ Analysis file not found: {args.analysis_file}")
-        print("Run analyze_repo.py first to generate the analysis.")
-        return 1
+    if (args.format == "trend" or args.record) and not args.trend_db:
+        parser.error("--format trend and --record require --trend-db")
+    if args.format == "html" and (args.fleet or args.baseline):
+        parser.error("--format html renders single analyses; use markdown or json "
+                     "with --fleet and --baseline")
     
-    data = json.loads(analysis_path.read_text())
+    if args.format == "trend" and not args.record:
+        TrendStore = _sibling("trend_store").TrendStore
+        with TrendStore(args.trend_db) as store:
+            report = generate_trend_report(store, args.repo, base_commit=args.trend_base)
+        return _write_report(report, args.output)
+    
+    if args.fleet:
+        fleet = FleetAggregator()
+        errors: list[str] = []
+        for data in iter_analyses(args.fleet, errors):
+            fleet.add(data)
+        for error in errors:
+            print(f"⚠️  Skipped unreadable analysis: {error}", file=sys.stderr)
+        if fleet.repo_count == 0:
+            print("❌ No analyses found in the given sources.")
+            return 1
+        if args.format == "json":
+            report = json.dumps(fleet.summary(), indent=2)
+        else:
+            report = generate_fleet_report(fleet, brief=args.format == "brief")
+        return _write_report(report, args.output)
+    
+    # Load analysis, or produce it in-process
+    if args.repo_path:
+        analyzer = _sibling("analyze_repo").RepoAnalyzer(args.repo_path, args.ref)
+        data = as_report_data(analyzer.analyze())
+    else:
+        analysis_path = Path(args.analysis_file)
+        if not analysis_path.exists():
+            print(f"❌ Analysis file not found: {args.analysis_file}")
+            print("Run analyze_repo.py first to generate the analysis.")
+            return 1
+        
+        data = json.loads(analysis_path.read_text())
+    
+    if args.baseline:
+        baseline_path = Path(args.baseline)
+        if not baseline_path.exists():
+            print(f"❌ Baseline file not found: {args.baseline}")
+            return 1
+        diff = diff_analyses(json.loads(baseline_path.read_text()), data)
+        if args.format == "json":
+            report = json.dumps(diff, indent=2)
+        else:
+            report = generate_diff_report(diff, brief=args.format == "brief")
+        return _write_report(report, args.output)
+    
+    if args.record:
+        TrendStore = _sibling("trend_store").TrendStore
+        with TrendStore(args.trend_db) as store:
+            store.record(data, repo=args.repo)
+            if args.format == "trend":
+                report = generate_trend_report(
+                    store, args.repo or data["repo_name"], base_commit=args.trend_base
+                )
+                return _write_report(report, args.output)
     
     # Generate report
-    if args.format == "markdown":
-        report = generate_markdown_report(data)
-    elif args.format == "brief":
-        report = generate_brief_report(data)
-    else:  # json
-        report = json.dumps(data, indent=2)
-    
-    # Output
-    if args.output:
-        Path(args.output).write_text(report)
-        print(f"✅ Report saved to: {args.output}")
+    report = render_report(data, args.format)
+    
+    return _write_report(report, args.output)
+
+
+def _write_report(report: str, output: str = None) -> int:
+    """Write a rendered report to a file, or stdout when no file is given."""
+    if output:
+        Path(output).write_text(report)
+        print(f"✅ Report saved to: {output}")
     else:
         print(report)
     
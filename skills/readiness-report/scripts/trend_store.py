@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Trend Store for Agent Readiness
+
+Keeps the history of readiness analyses in a local SQLite database so that
+score deltas and regressions can be reported between runs. Runs are indexed
+by repository, commit and timestamp; every query used by the reports is an
+index range scan, so years of nightly fleet data stay fast.
+
+Usage:
+    python analyze_repo.py --repo-path . --trend-db ~/.readiness/trends.db
+    python generate_report.py --trend-db ~/.readiness/trends.db --format trend --repo my-repo
+    python generate_report.py --analysis-file a.json --trend-db trends.db --record
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    repo TEXT NOT NULL,
+    commit_sha TEXT,
+    recorded_at TEXT NOT NULL,
+    pass_rate REAL NOT NULL,
+    achieved_level INTEGER NOT NULL,
+    total_passed INTEGER NOT NULL,
+    total_criteria INTEGER NOT NULL,
+    level_scores TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_repo_recorded ON runs (repo, recorded_at);
+CREATE INDEX IF NOT EXISTS runs_repo_commit ON runs (repo, commit_sha);
+DROP INDEX IF EXISTS runs_recorded;
+
+CREATE TABLE IF NOT EXISTS criteria (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    criterion_id TEXT NOT NULL,
+    pillar TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    PRIMARY KEY (run_id, criterion_id)
+) WITHOUT ROWID;
+"""
+
+RUN_COLUMNS = (
+    "id, repo, commit_sha, recorded_at, pass_rate, achieved_level, "
+    "total_passed, total_criteria, level_scores"
+)
+
+
+class TrendStore:
+    """Append-only history of analyses backed by an embedded SQLite database."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+    
+    def close(self):
+        self.conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    def record(
+        self,
+        data: dict,
+        repo: Optional[str] = None,
+        commit: Optional[str] = None,
+        recorded_at: Optional[str] = None
+    ) -> int:
+        """
+        Append one analysis to the store and return its run id.
+    
+        Args:
+            data: Analysis dict as written by analyze_repo.py
+            repo: Repository key (defaults to the analysis repo_name)
+            commit: Commit SHA (defaults to the analysis commit, if any)
+            recorded_at: ISO-8601 UTC timestamp (defaults to now)
+        """
+        repo = repo or data["repo_name"]
+        commit = commit or data.get("commit") or None
+        recorded_at = recorded_at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+    
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (repo, commit_sha, recorded_at, pass_rate, achieved_level, "
+                "total_passed, total_criteria, level_scores) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    repo, commit, recorded_at, data["pass_rate"], data["achieved_level"],
+                    data["total_passed"], data["total_criteria"],
+                    json.dumps({str(k): v for k, v in data["level_scores"].items()}),
+                )
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO criteria (run_id, criterion_id, pillar, level, status) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    (run_id, c["id"], pillar_name, c["level"], c["status"])
+                    for pillar_name, pillar in data["pillars"].items()
+                    for c in pillar["criteria"]
+                )
+            )
+        return run_id
+    
+    def repos(self) -> list[str]:
+        """All repositories with at least one run."""
+        rows = self.conn.execute("SELECT DISTINCT repo FROM runs ORDER BY repo")
+        return [row["repo"] for row in rows]
+    
+    def history(self, repo: str, limit: int = 30) -> list[sqlite3.Row]:
+        """Most recent runs for a repository, newest first."""
+        return self.conn.execute(
+            f"SELECT {RUN_COLUMNS} FROM runs WHERE repo = ? "
+            "ORDER BY recorded_at DESC, id DESC LIMIT ?",
+            (repo, limit)
+        ).fetchall()
+    
+    def run_for_commit(self, repo: str, commit: str) -> Optional[sqlite3.Row]:
+        """Latest run recorded for a commit (full SHA or unique prefix)."""
+        return self.conn.execute(
+            f"SELECT {RUN_COLUMNS} FROM runs WHERE repo = ? "
+            "AND commit_sha >= ? AND commit_sha < ? "
+            "ORDER BY recorded_at DESC, id DESC LIMIT 1",
+            (repo, commit, commit + "\uffff")
+        ).fetchone()
+    
+    def criterion_changes(self, base_run_id: int, head_run_id: int) -> list[sqlite3.Row]:
+        """Criteria whose status differs between two runs (primary-key join)."""
+        return self.conn.execute(
+            "SELECT h.criterion_id, h.pillar, h.level, b.status AS before, h.status AS after "
+            "FROM criteria h JOIN criteria b "
+            "ON b.run_id = ? AND b.criterion_id = h.criterion_id "
+            "WHERE h.run_id = ? AND b.status != h.status "
+            "ORDER BY h.level, h.criterion_id",
+            (base_run_id, head_run_id)
+        ).fetchall()
+    
+    def compare(self, base: sqlite3.Row, head: sqlite3.Row) -> dict:
+        """Score deltas, regressions and improvements from base to head."""
+        changes = self.criterion_changes(base["id"], head["id"])
+        return {
+            "repo": head["repo"],
+            "base": dict(base),
+            "head": dict(head),
+            "pass_rate_delta": round(head["pass_rate"] - base["pass_rate"], 1),
+            "level_delta": head["achieved_level"] - base["achieved_level"],
+            "regressions": [dict(c) for c in changes if c["before"] == "pass"],
+            "improvements": [dict(c) for c in changes if c["after"] == "pass"],
+        }
+    
+    def latest_deltas(self) -> list[dict]:
+        """Compare the two most recent runs of every repository."""
+        deltas = []
+        for repo in self.repos():
+            runs = self.history(repo, limit=2)
+            if len(runs) == 2:
+                deltas.append(self.compare(runs[1], runs[0]))
+        deltas.sort(key=lambda d: (d["pass_rate_delta"], d["repo"]))
+        return deltas
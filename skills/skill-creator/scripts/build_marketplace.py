@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Marketplace Index Builder - Generates or checks .plugin/marketplace.json
+
+Each plugin entry's name and description come from the skill's SKILL.md
+frontmatter; curated fields (category, keywords, ...) are kept from the
+existing index. Only frontmatter is read, and with --cache only skills whose
+SKILL.md changed since the last run (by size and mtime) are parsed again.
+
+Usage:
+    build_marketplace.py [--marketplace .plugin/marketplace.json] [--skills-dir DIR]
+    build_marketplace.py --check
+    build_marketplace.py --cache .git/marketplace-cache.json
+
+Examples:
+    build_marketplace.py                 # Rewrite the index from skills/*/SKILL.md
+    build_marketplace.py --check         # Report drift, exit 1 if there is any
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+from frontmatter import FrontmatterError, load_frontmatter
+
+
+DEFAULT_MARKETPLACE = Path('.plugin') / 'marketplace.json'
+# A JSON array of strings, as laid out by json.dumps(indent=2)
+STRING_LIST_RE = re.compile(r'\[\n\s*("(?:[^"\\\n]|\\.)*"(?:,\n\s*"(?:[^"\\\n]|\\.)*")*)\n\s*\]')
+
+
+def scan_skills(skills_dir, cache=None):
+    """
+    Read name and description of every skills_dir/*/SKILL.md.
+
+    cache maps skill directory names to a previous scan's entries
+    ({'stat': [size, mtime_ns], 'name': ..., 'description': ...}); entries
+    whose SKILL.md is unchanged are reused without opening the file.
+
+    Returns (skills, errors): skills as {dir name: entry} in directory
+    order, errors as {dir name: message} for unreadable frontmatter.
+    """
+    cache = cache or {}
+    skills, errors = {}, {}
+    with os.scandir(skills_dir) as it:
+        dirs = sorted(e.name for e in it if e.is_dir() and not e.name.startswith('.'))
+    for dirname in dirs:
+        try:
+            st = os.stat(os.path.join(skills_dir, dirname, 'SKILL.md'))
+        except FileNotFoundError:
+            continue
+        stat = [st.st_size, st.st_mtime_ns]
+        cached = cache.get(dirname)
+        if cached and cached.get('stat') == stat:
+            skills[dirname] = cached
+            continue
+        try:
+            frontmatter = load_frontmatter(Path(skills_dir) / dirname / 'SKILL.md')
+        except (FrontmatterError, UnicodeDecodeError) as e:
+            errors[dirname] = str(e)
+            continue
+        skills[dirname] = {
+            'stat': stat,
+            'name': str(frontmatter.get('name') or dirname).strip(),
+            'description': str(frontmatter.get('description') or '').strip(),
+            'keywords': [str(t) for t in frontmatter.get('triggers') or [] if t is not None],
+        }
+    return skills, errors
+
+
+def build_marketplace(marketplace, skills):
+    """Marketplace dict with one plugin per scanned skill, keeping curated fields"""
+    existing = {p.get('source'): p for p in marketplace.get('plugins', [])}
+    plugins = []
+    for dirname, skill in skills.items():
+        source = f"./{dirname}"
+        plugin = dict(existing.get(source) or {'keywords': skill.get('keywords', [])})
+        plugin.update(name=skill['name'], source=source, description=skill['description'])
+        # Keep the usual key order for new entries and stable order for old ones
+        order = ['name', 'source', 'description']
+        plugins.append({**{k: plugin[k] for k in order}, **plugin})
+    plugins.sort(key=lambda p: p['name'])
+    return {**marketplace, 'plugins': plugins}
+
+
+def check_marketplace(marketplace, skills):
+    """Differences between the index and the skills' frontmatter, as messages"""
+    problems = []
+    listed = {}
+    for plugin in marketplace.get('plugins', []):
+        source = plugin.get('source', '')
+        dirname = source[2:] if source.startswith('./') else source
+        listed[dirname] = plugin
+        skill = skills.get(dirname)
+        if skill is None:
+            problems.append(f"{plugin.get('name')}: source {source} has no SKILL.md")
+            continue
+        if plugin.get('name') != skill['name']:
+            problems.append(f"{dirname}: name is '{plugin.get('name')}' but SKILL.md says '{skill['name']}'")
+        if plugin.get('description') != skill['description']:
+            problems.append(f"{dirname}: description differs from SKILL.md frontmatter")
+    for dirname in skills:
+        if dirname not in listed:
+            problems.append(f"{dirname}: missing from marketplace")
+    return problems
+
+
+def dump_marketplace(marketplace):
+    """Serialize like the hand-written index: 2-space indent, string lists on one line"""
+    text = json.dumps(marketplace, indent=2, ensure_ascii=False)
+    text = STRING_LIST_RE.sub(lambda m: '[' + re.sub(r',\n\s*', ', ', m.group(1)) + ']', text)
+    return text + '\n'
+
+
+def _write_atomic(path, text):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or check the marketplace index')
+    parser.add_argument('--marketplace', default=str(DEFAULT_MARKETPLACE),
+                        help=f'Marketplace index (default: {DEFAULT_MARKETPLACE})')
+    parser.add_argument('--skills-dir',
+                        help="Skills directory (default: the index's metadata.pluginRoot)")
+    parser.add_argument('--check', action='store_true',
+                        help='Report drift instead of writing; exit 1 if there is any')
+    parser.add_argument('--cache', metavar='FILE',
+                        help='Reuse frontmatter of unchanged skills from this cache file')
+    args = parser.parse_args()
+
+    marketplace_path = Path(args.marketplace)
+    try:
+        marketplace = json.loads(marketplace_path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        marketplace = {'plugins': []}
+    except ValueError as e:
+        print(f"❌ Error: {marketplace_path} is not valid JSON: {e}")
+        sys.exit(1)
+
+    root = marketplace.get('metadata', {}).get('pluginRoot', './skills')
+    skills_dir = Path(args.skills_dir or marketplace_path.resolve().parent.parent / root)
+
+    cache = {}
+    if args.cache:
+        try:
+            cache = json.loads(Path(args.cache).read_text())
+        except (OSError, ValueError):
+            cache = {}
+    skills, errors = scan_skills(skills_dir, cache)
+    if args.cache:
+        _write_atomic(args.cache, json.dumps(skills))
+
+    for dirname, message in errors.items():
+        print(f"❌ {dirname}: {message}")
+
+    if args.check:
+        problems = check_marketplace(marketplace, skills)
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems or errors:
+            sys.exit(1)
+        print(f"✅ {marketplace_path} matches {len(skills)} skills")
+        return
+
+    text = dump_marketplace(build_marketplace(marketplace, skills))
+    if marketplace_path.exists() and marketplace_path.read_text(encoding='utf-8') == text:
+        print(f"✅ {marketplace_path} is up to date")
+    else:
+        _write_atomic(marketplace_path, text)
+        print(f"✅ Wrote {marketplace_path} ({len(skills)} skills)")
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
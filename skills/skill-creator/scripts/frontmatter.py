@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Fast SKILL.md frontmatter reader
+
+Reads a SKILL.md only up to the closing '---' and parses the flat subset
+of YAML that skills use (plain or quoted `key: value` scalars and `- item`
+lists, as in name/description/triggers) without importing PyYAML. Anything
+outside that subset (block scalars, nested mappings, numbers, booleans, ...)
+is handed to yaml.safe_load, so results always match a full YAML parse.
+
+Usage:
+    from frontmatter import load_frontmatter
+    meta = load_frontmatter('skills/docker/SKILL.md')
+"""
+
+import re
+from pathlib import Path
+
+
+class FrontmatterError(ValueError):
+    """SKILL.md has no frontmatter, or it is not a YAML mapping"""
+
+
+KEY_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_-]*):(?: (.*))?$')
+ITEM_RE = re.compile(r'^ *- (.*)$')
+# Plain scalars YAML would resolve to something other than a string
+SPECIAL_RE = re.compile(
+    r'^(?:[-+]?[0-9.].*|[-+]?\.(?:inf|Inf|INF)|\.(?:nan|NaN|NAN)|~|null|Null|NULL'
+    r'|y|Y|yes|Yes|YES|n|N|no|No|NO|true|True|TRUE|false|False|FALSE'
+    r'|on|On|ON|off|Off|OFF|=|<<)$'
+)
+INDICATORS = set('-?:,[]{}#&*!|>%@`')
+
+
+class _NeedsYaml(Exception):
+    """Frontmatter is outside the fast subset"""
+
+
+def read_frontmatter_text(skill_md):
+    """
+    Return the raw frontmatter of a SKILL.md, reading no further than its end.
+
+    Raises FrontmatterError if the file does not start with a frontmatter block.
+    """
+    # Binary line reads: the body after the frontmatter is never decoded
+    with open(skill_md, 'rb') as f:
+        first = f.readline()
+        if not first.startswith(b'---'):
+            raise FrontmatterError("No YAML frontmatter found")
+        if first.rstrip(b'\r\n') != b'---':
+            raise FrontmatterError("Invalid frontmatter format")
+        lines = []
+        for line in f:
+            if line.startswith(b'---'):
+                return b''.join(lines).decode('utf-8').rstrip('\r\n')
+            lines.append(line)
+    raise FrontmatterError("Invalid frontmatter format")
+
+
+def _scalar(value):
+    """Parse a one-line scalar, or raise _NeedsYaml"""
+    if not value:
+        return None
+    if value[0] == "'":
+        if len(value) < 2 or not value.endswith("'") or "'" in value[1:-1].replace("''", ''):
+            raise _NeedsYaml
+        return value[1:-1].replace("''", "'")
+    if value[0] == '"':
+        if len(value) < 2 or not value.endswith('"') or '\\' in value or '"' in value[1:-1]:
+            raise _NeedsYaml
+        return value[1:-1]
+    if (value[0] in INDICATORS or SPECIAL_RE.match(value) or '\t' in value
+            or ': ' in value or value.endswith(':') or ' #' in value or value != value.strip()):
+        raise _NeedsYaml
+    return value
+
+
+def _parse_simple(text):
+    """Parse the flat key/list subset, or raise _NeedsYaml"""
+    data = {}
+    key = None
+    for raw in text.splitlines():
+        line = raw.rstrip('\r')
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        match = KEY_RE.match(line.rstrip())
+        if match:
+            key = match.group(1)
+            if key in data or SPECIAL_RE.match(key):
+                raise _NeedsYaml
+            data[key] = _scalar((match.group(2) or '').strip())
+            continue
+        match = ITEM_RE.match(line.rstrip())
+        if match and key is not None and (data[key] is None or isinstance(data[key], list)):
+            if data[key] is None:
+                data[key] = []
+            data[key].append(_scalar(match.group(1).strip()))
+            continue
+        raise _NeedsYaml
+    return data
+
+
+def parse_frontmatter(text):
+    """Parse frontmatter text into a dict, using PyYAML only when needed"""
+    try:
+        data = _parse_simple(text)
+        if data:
+            return data
+    except _NeedsYaml:
+        pass
+    import yaml
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        raise FrontmatterError(f"Invalid YAML in frontmatter: {e}")
+    if not isinstance(data, dict):
+        raise FrontmatterError("Frontmatter must be a YAML dictionary")
+    return data
+
+
+def load_frontmatter(skill_md):
+    """Read and parse the frontmatter of a SKILL.md file"""
+    return parse_frontmatter(read_frontmatter_text(Path(skill_md)))
@@ -4,20 +4,40 @@ Skill Initializer - Creates a new skill from template
 
 Usage:
     init_skill.py <skill-name> --path <path>
+    init_skill.py --manifest <specs.csv|specs.json> --path <path> [--jobs N]
 
 Examples:
     init_skill.py my-new-skill --path skills/public
     init_skill.py my-api-helper --path skills/private
     init_skill.py custom-skill --path /custom/location
+    init_skill.py --manifest service-catalog.csv --path skills/private
+
+A manifest lists one skill per row (CSV with a header) or per object (JSON
+list, optionally wrapped as {"skills": [...]}) with a required `name` and
+optional `description` and `path` (overrides --path for that skill).
 """
 
+import argparse
+import csv
+import json
+import os
+import re
+import shutil
+import string
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from frontmatter import FrontmatterError, parse_frontmatter
+
+
+DEFAULT_DESCRIPTION = "[TODO: Complete and informative explanation of what the skill does and when to use it. Include WHEN to use this skill - specific scenarios, file types, or tasks that trigger it.]"
+
 
 SKILL_TEMPLATE = """---
 name: {skill_name}
-description: [TODO: Complete and informative explanation of what the skill does and when to use it. Include WHEN to use this skill - specific scenarios, file types, or tasks that trigger it.]
+description: {description}
 ---
 
 # {skill_title}
@@ -186,11 +206,73 @@ Note: This is a text placeholder. Actual assets can be any file type.
 """
 
 
+class CompiledTemplate:
+    """
+    Skill file template, split once into (literal, field, conversion, format spec).
+
+    Rendering gives the same text as source.format(**fields). Fields must be
+    plain names without nested replacement fields, which is checked here.
+    """
+
+    __slots__ = ("segments",)
+
+    CONVERSIONS = {None: None, 's': str, 'r': repr, 'a': ascii}
+
+    def __init__(self, source):
+        segments = []
+        for literal, field_name, spec, conversion in string.Formatter().parse(source):
+            if field_name is not None and (
+                not field_name.isidentifier() or conversion not in self.CONVERSIONS or '{' in spec
+            ):
+                raise ValueError(f"Unsupported template field: {{{field_name}}}")
+            segments.append((literal, field_name, self.CONVERSIONS.get(conversion), spec or ''))
+        self.segments = tuple(segments)
+
+    def render(self, **fields):
+        out = []
+        for literal, field_name, convert, spec in self.segments:
+            out.append(literal)
+            if field_name is not None:
+                value = fields[field_name]
+                out.append(format(convert(value) if convert else value, spec))
+        return "".join(out)
+
+
+TEMPLATES = {
+    'SKILL.md': CompiledTemplate(SKILL_TEMPLATE),
+    'scripts/example.py': CompiledTemplate(EXAMPLE_SCRIPT),
+    'references/api_reference.md': CompiledTemplate(EXAMPLE_REFERENCE),
+    'assets/example_asset.txt': CompiledTemplate(EXAMPLE_ASSET),
+}
+
+NAME_RE = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
+
+
 def title_case_skill_name(skill_name):
     """Convert hyphenated skill name to Title Case for display."""
     return ' '.join(word.capitalize() for word in skill_name.split('-'))
 
 
+def yaml_scalar(text):
+    """Frontmatter form of a string: plain if it reads back unchanged, else double-quoted."""
+    try:
+        if parse_frontmatter(f"value: {text}") == {'value': text}:
+            return text
+    except FrontmatterError:
+        pass
+    return json.dumps(text, ensure_ascii=False)
+
+
+def render_skill(skill_name, description=None):
+    """Render every template file of a new skill as {relative path: content}."""
+    fields = {
+        'skill_name': skill_name,
+        'skill_title': title_case_skill_name(skill_name),
+        'description': yaml_scalar(description or DEFAULT_DESCRIPTION),
+    }
+    return {rel: template.render(**fields) for rel, template in TEMPLATES.items()}
+
+
 def init_skill(skill_name, path):
     """
     Initialize a new skill directory with template SKILL.md.
@@ -219,15 +301,11 @@ def init_skill(skill_name, path):
         return None
 
     # Create SKILL.md from template
-    skill_title = title_case_skill_name(skill_name)
-    skill_content = SKILL_TEMPLATE.format(
-        skill_name=skill_name,
-        skill_title=skill_title
-    )
+    files = render_skill(skill_name)
 
     skill_md_path = skill_dir / 'SKILL.md'
     try:
-        skill_md_path.write_text(skill_content)
+        skill_md_path.write_text(files['SKILL.md'])
         print("✅ Created SKILL.md")
     except Exception as e:
         print(f"❌ Error creating SKILL.md: {e}")
@@ -239,7 +317,7 @@ def init_skill(skill_name, path):
         scripts_dir = skill_dir / 'scripts'
         scripts_dir.mkdir(exist_ok=True)
         example_script = scripts_dir / 'example.py'
-        example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name))
+        example_script.write_text(files['scripts/example.py'])
         example_script.chmod(0o755)
         print("✅ Created scripts/example.py")
 
@@ -247,14 +325,14 @@ def init_skill(skill_name, path):
         references_dir = skill_dir / 'references'
         references_dir.mkdir(exist_ok=True)
         example_reference = references_dir / 'api_reference.md'
-        example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title))
+        example_reference.write_text(files['references/api_reference.md'])
         print("✅ Created references/api_reference.md")
 
         # Create assets/ directory with example asset placeholder
         assets_dir = skill_dir / 'assets'
         assets_dir.mkdir(exist_ok=True)
         example_asset = assets_dir / 'example_asset.txt'
-        example_asset.write_text(EXAMPLE_ASSET)
+        example_asset.write_text(files['assets/example_asset.txt'])
         print("✅ Created assets/example_asset.txt")
     except Exception as e:
         print(f"❌ Error creating resource directories: {e}")
@@ -270,7 +348,125 @@ def init_skill(skill_name, path):
     return skill_dir
 
 
+def load_specs(manifest_path):
+    """
+    Read skill specs from a CSV or JSON manifest.
+
+    Returns a list of dicts with at least 'name'; empty CSV cells are dropped.
+    """
+    text = Path(manifest_path).read_text()
+    if text.lstrip().startswith(('[', '{')):
+        data = json.loads(text)
+        specs = data['skills'] if isinstance(data, dict) else data
+    else:
+        specs = [
+            {k.strip(): v.strip() for k, v in row.items() if k and v and v.strip()}
+            for row in csv.DictReader(text.splitlines())
+        ]
+    for i, spec in enumerate(specs, 1):
+        if not isinstance(spec, dict) or not spec.get('name'):
+            raise ValueError(f"Skill spec #{i} in {manifest_path} has no name")
+        for key in ('name', 'description', 'path'):
+            if key in spec and not isinstance(spec[key], str):
+                raise ValueError(f"Skill spec #{i} in {manifest_path}: {key} must be a string")
+    return specs
+
+
+def _create_skill(spec, path):
+    """Write one skill into a staging directory, validate it, then move it into place."""
+    from quick_validate import validate_skill
+
+    name = spec['name']
+    if not NAME_RE.match(name):
+        return name, None, "Name should be hyphen-case (lowercase letters, digits, and hyphens only)"
+    parent = Path(spec.get('path') or path).resolve()
+    skill_dir = parent / name
+    if skill_dir.exists():
+        return name, None, f"Skill directory already exists: {skill_dir}"
+
+    parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=parent, prefix=f".{name}.init-"))
+    try:
+        for rel, content in render_skill(name, spec.get('description')).items():
+            target = staging / rel
+            target.parent.mkdir(exist_ok=True)
+            target.write_text(content)
+        (staging / 'scripts' / 'example.py').chmod(0o755)
+        os.chmod(staging, 0o755)
+        valid, message = validate_skill(staging)
+        if not valid:
+            return name, None, message
+        if skill_dir.exists():
+            return name, None, f"Skill directory already exists: {skill_dir}"
+        os.rename(staging, skill_dir)
+        return name, skill_dir, message
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def init_skills(specs, path, max_workers=None):
+    """
+    Create many skills from specs in parallel.
+
+    Each skill is rendered from the precompiled templates, validated in
+    process and only then moved into place, so a failing spec leaves no
+    directory behind.
+
+    Returns a list of (name, skill_dir or None, message) in spec order.
+    """
+    seen = set()
+    duplicates = set()
+    for spec in specs:
+        key = (spec.get('path') or path, spec['name'])
+        if key in seen:
+            duplicates.add(key)
+        seen.add(key)
+
+    def create(spec):
+        if (spec.get('path') or path, spec['name']) in duplicates:
+            return spec['name'], None, "Skill is listed more than once in the manifest"
+        try:
+            return _create_skill(spec, path)
+        except OSError as e:
+            return spec['name'], None, f"Error creating skill: {e}"
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(create, specs))
+
+
+def batch_main(argv):
+    parser = argparse.ArgumentParser(prog='init_skill.py', description='Create skills from a manifest')
+    parser.add_argument('--manifest', '-m', required=True, help='CSV or JSON file of skill specs')
+    parser.add_argument('--path', required=True, help='Directory to create the skills in')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Parallel writers (default: automatic)')
+    args = parser.parse_args(argv)
+
+    try:
+        specs = load_specs(args.manifest)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error reading manifest: {e}")
+        sys.exit(1)
+
+    print(f"🚀 Initializing {len(specs)} skill(s) from {args.manifest}")
+    print(f"   Location: {args.path}")
+    print()
+
+    results = init_skills(specs, args.path, args.jobs)
+    for name, skill_dir, message in results:
+        if skill_dir:
+            print(f"✅ {name}: {skill_dir}")
+        else:
+            print(f"❌ {name}: {message}")
+    failed = sum(1 for _, skill_dir, _ in results if not skill_dir)
+    print(f"\n{len(results) - failed}/{len(results)} skill(s) initialized")
+    sys.exit(1 if failed else 0)
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in ('--manifest', '-m'):
+        batch_main(sys.argv[1:])
+        return
+
     if len(sys.argv) < 4 or sys.argv[2] != '--path':
         print("Usage: init_skill.py <skill-name> --path <path>")
         print("\nSkill name requirements:")
@@ -282,6 +478,7 @@ def main():
         print("  init_skill.py my-new-skill --path skills/public")
         print("  init_skill.py my-api-helper --path skills/private")
         print("  init_skill.py custom-skill --path /custom/location")
+        print("  init_skill.py --manifest service-catalog.csv --path skills/private")
         sys.exit(1)
 
     skill_name = sys.argv[1]
@@ -1,16 +1,41 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+Usage:
+    quick_validate.py <skill_directory>
+    quick_validate.py --all [root ...] [--format text|json|junit] [--output FILE] [--jobs N]
+    quick_validate.py --all skills --cache .git/skill-validation-cache.json
+    quick_validate.py --all skills --deep
+    quick_validate.py --all skills --triggers
 """
 
+import argparse
+import hashlib
+import json
 import sys
 import os
 import re
-import yaml
+import tempfile
+import urllib.parse
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-def validate_skill(skill_path):
-    """Basic validation of a skill"""
+from frontmatter import FrontmatterError, load_frontmatter
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+# Least recently used results beyond this are dropped from the cache file
+MAX_CACHE_ENTRIES = 4096
+# Files under assets/ larger than this are reported by --deep
+MAX_ASSET_SIZE = 5 * 1024 * 1024
+
+MD_LINK_RE = re.compile(r'!?\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+["\'(][^)]*)?\)')
+CODE_SPAN_RE = re.compile(r'`[^`]*`')
+
+def validate_skill(skill_path, deep=False):
+    """Basic validation of a skill (plus scripts, links and assets when deep)"""
     skill_path = Path(skill_path)
 
     # Check SKILL.md exists
@@ -18,28 +43,14 @@ def validate_skill(skill_path):
     if not skill_md.exists():
         return False, "SKILL.md not found"
 
-    # Read and validate frontmatter
-    content = skill_md.read_text()
-    if not content.startswith('---'):
-        return False, "No YAML frontmatter found"
-
-    # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format"
-
-    frontmatter_text = match.group(1)
-
-    # Parse YAML frontmatter
+    # Read and parse frontmatter (PyYAML is only loaded for non-trivial YAML)
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return False, "Frontmatter must be a YAML dictionary"
-    except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+        frontmatter = load_frontmatter(skill_md)
+    except FrontmatterError as e:
+        return False, str(e)
 
     # Define allowed properties
-    ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata'}
+    ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata', 'triggers'}
 
     # Check for unexpected properties (excluding nested keys under metadata)
     unexpected_keys = set(frontmatter.keys()) - ALLOWED_PROPERTIES
@@ -83,13 +94,313 @@ def validate_skill(skill_path):
         if len(description) > 1024:
             return False, f"Description is too long ({len(description)} characters). Maximum is 1024 characters."
 
+    # Validate triggers (optional list of activation keywords)
+    if 'triggers' in frontmatter:
+        triggers = frontmatter['triggers']
+        if not isinstance(triggers, list):
+            return False, f"Triggers must be a list of strings, got {type(triggers).__name__}"
+        seen = set()
+        for i, trigger in enumerate(triggers, 1):
+            if not isinstance(trigger, str) or not trigger.strip():
+                return False, f"Trigger #{i} must be a non-empty string"
+            normalized = ' '.join(trigger.lower().split())
+            if normalized in seen:
+                return False, f"Duplicate trigger '{trigger}'"
+            seen.add(normalized)
+
+    if deep:
+        problems = deep_check(skill_path)
+        if problems:
+            return False, '; '.join(problems)
+
     return True, "Skill is valid!"
 
+
+def _index_skill(skill_path):
+    """Relative paths of all files and directories in a skill, from one walk"""
+    files, dirs = {}, {''}
+    for dirpath, dirnames, filenames in os.walk(skill_path):
+        dirnames[:] = sorted(d for d in dirnames if d not in ('.git', '__pycache__'))
+        rel_dir = os.path.relpath(dirpath, skill_path).replace(os.sep, '/')
+        rel_dir = '' if rel_dir == '.' else rel_dir + '/'
+        dirs.update(rel_dir + d for d in dirnames)
+        for filename in filenames:
+            files[rel_dir + filename] = os.path.join(dirpath, filename)
+    return files, dirs
+
+
+def _markdown_links(text):
+    """Link targets in markdown text, ignoring fenced code blocks and code spans"""
+    in_fence = False
+    for line in text.splitlines():
+        if line.lstrip().startswith(('```', '~~~')):
+            in_fence = not in_fence
+            continue
+        if not in_fence:
+            for match in MD_LINK_RE.finditer(CODE_SPAN_RE.sub('', line)):
+                yield match.group(1)
+
+
+def deep_check(skill_path):
+    """
+    Check what a skill bundles, not just its frontmatter.
+
+    Byte-compiles every Python file under scripts/, resolves the relative
+    links of every markdown file against an index of the skill's files,
+    and flags files under assets/ larger than MAX_ASSET_SIZE. Files that
+    cannot be read (dangling symlinks, no permission) are reported too.
+
+    Returns a list of problems (empty if none).
+    """
+    skill_path = Path(skill_path)
+    files, dirs = _index_skill(skill_path)
+    problems = []
+    for rel, full in sorted(files.items()):
+        if rel.startswith('scripts/') and rel.endswith('.py'):
+            try:
+                compile(Path(full).read_bytes(), rel, 'exec', dont_inherit=True)
+            except (SyntaxError, ValueError) as e:
+                line = f":{e.lineno}" if getattr(e, 'lineno', None) else ''
+                problems.append(f"{rel}{line}: {e.__class__.__name__}: {getattr(e, 'msg', e)}")
+            except OSError as e:
+                problems.append(f"{rel}: unreadable: {e.strerror or e}")
+        elif rel.endswith('.md'):
+            base = rel.rpartition('/')[0]
+            try:
+                text = Path(full).read_text(errors='replace')
+            except OSError as e:
+                problems.append(f"{rel}: unreadable: {e.strerror or e}")
+                continue
+            for target in _markdown_links(text):
+                if urllib.parse.urlsplit(target).scheme or target.startswith(('#', '/')):
+                    continue
+                target = urllib.parse.unquote(target.split('#', 1)[0].split('?', 1)[0])
+                resolved = os.path.normpath(os.path.join(base, target)).replace(os.sep, '/')
+                if resolved in files or resolved.rstrip('/') in dirs:
+                    continue
+                # Links leaving the skill cannot be answered from the index
+                if resolved.startswith('../') and (skill_path / resolved).exists():
+                    continue
+                problems.append(f"{rel}: broken link to {target}")
+        if rel.startswith('assets/'):
+            try:
+                size = os.path.getsize(full)
+            except OSError as e:
+                # A dangling symlink, or a file in an unreadable directory
+                problems.append(f"{rel}: unreadable: {e.strerror or e}")
+                continue
+            if size > MAX_ASSET_SIZE:
+                problems.append(
+                    f"{rel}: asset is {size / 1024 / 1024:.1f} MiB "
+                    f"(limit {MAX_ASSET_SIZE / 1024 / 1024:.0f} MiB)"
+                )
+    return problems
+
+
+def find_skills(root):
+    """Skill directories (containing SKILL.md) under root, skipping hidden directories"""
+    skills = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if 'SKILL.md' in filenames:
+            skills.append(Path(dirpath))
+            # A skill's own folders never hold further skills
+            dirnames.clear()
+            continue
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+    return sorted(skills)
+
+
+def validator_version():
+    """Fingerprint of the validation rules: the validator and frontmatter parser sources"""
+    digest = hashlib.sha256()
+    for name in ('quick_validate.py', 'frontmatter.py'):
+        digest.update((SCRIPTS_DIR / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def cache_key(skill_path, deep=False):
+    """
+    Hash of everything a skill's validation depends on, or None without SKILL.md.
+
+    Basic validation only reads SKILL.md. Deep validation also depends on
+    the content of scripts and markdown files and on the names and sizes
+    of all other files.
+    """
+    try:
+        digest = hashlib.sha256((Path(skill_path) / 'SKILL.md').read_bytes())
+    except OSError:
+        return None
+    if deep:
+        files, dirs = _index_skill(skill_path)
+        digest.update(b'\0deep\0' + '\0'.join(sorted(dirs)).encode())
+        for rel, full in sorted(files.items()):
+            digest.update(b'\0' + rel.encode() + b'\0')
+            try:
+                if rel.endswith(('.py', '.md')):
+                    digest.update(Path(full).read_bytes())
+                else:
+                    digest.update(str(os.path.getsize(full)).encode())
+            except OSError:
+                # deep_check reports the file as unreadable
+                digest.update(b'\0unreadable')
+    return digest.hexdigest()
+
+
+def load_cache(cache_path):
+    """Cached results {content hash: [valid, message]}; empty if missing or from another validator"""
+    try:
+        data = json.loads(Path(cache_path).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('validator') != validator_version():
+        return {}
+    return data.get('results', {})
+
+
+def save_cache(cache_path, results):
+    """Atomically write the cache, keeping the most recently used entries"""
+    results = dict(list(results.items())[-MAX_CACHE_ENTRIES:])
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_path.parent, prefix=f".{cache_path.name}.")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'validator': validator_version(), 'results': results}, f)
+        os.replace(tmp, cache_path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _validate_safely(skill_path, deep=False):
+    """validate_skill, reporting an unexpected error as a failure of this skill only"""
+    try:
+        return validate_skill(skill_path, deep=deep)
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+
+def validate_skills(skill_paths, max_workers=None, cache_path=None, deep=False):
+    """
+    Validate many skills in one process pool.
+
+    With deep, scripts, markdown links and assets are checked as well
+    (see deep_check). With cache_path, skills whose SKILL.md content was already validated by
+    this validator version are answered from the cache and not re-parsed.
+
+    Returns a list of (skill_path, valid, message) in the order of skill_paths.
+    """
+    skill_paths = [str(p) for p in skill_paths]
+    results = {}
+    if cache_path:
+        cache = load_cache(cache_path)
+        keys = {p: cache_key(p, deep) for p in skill_paths}
+        for p, key in keys.items():
+            if key in cache:
+                # Re-insert so the entry counts as recently used
+                results[p] = tuple(cache[key])
+                cache[key] = cache.pop(key)
+    todo = [p for p in dict.fromkeys(skill_paths) if p not in results]
+
+    validate = partial(_validate_safely, deep=deep)
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(todo) < 2:
+        fresh = [validate(p) for p in todo]
+    else:
+        workers = min(workers, len(todo))
+        # Hand out work in chunks so per-task IPC stays small next to parsing
+        chunksize = max(1, len(todo) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fresh = list(pool.map(validate, todo, chunksize=chunksize))
+    results.update(zip(todo, fresh))
+
+    if cache_path and todo:
+        for p, (valid, message) in zip(todo, fresh):
+            if keys[p]:
+                cache[keys[p]] = [valid, message]
+        save_cache(cache_path, cache)
+    return [(p, *results[p]) for p in skill_paths]
+
+
+def format_report(results, fmt='text', triggers=None):
+    """Render batch results (and a trigger overlap report) as text, JSON or JUnit XML"""
+    failed = [r for r in results if not r[1]]
+    if fmt == 'json':
+        data = {
+            'total': len(results),
+            'passed': len(results) - len(failed),
+            'failed': len(failed),
+            'results': [
+                {'skill': path, 'valid': valid, 'message': message}
+                for path, valid, message in results
+            ],
+        }
+        if triggers is not None:
+            data['triggers'] = triggers
+        return json.dumps(data, indent=2)
+    if fmt == 'junit':
+        suite = ET.Element('testsuite', name='skill-validation', tests=str(len(results)),
+                           failures=str(len(failed)), errors='0')
+        for path, valid, message in results:
+            case = ET.SubElement(suite, 'testcase', classname='skills', name=path)
+            if not valid:
+                ET.SubElement(case, 'failure', message=message).text = message
+        if triggers is not None:
+            from trigger_index import format_overlaps
+            ET.SubElement(suite, 'system-out').text = '\n'.join(format_overlaps(triggers))
+        ET.indent(suite)
+        return ET.tostring(suite, encoding='unicode', xml_declaration=True)
+    lines = [f"{'✅' if valid else '❌'} {path}: {message}" for path, valid, message in results]
+    if triggers is not None:
+        from trigger_index import format_overlaps
+        lines.extend(format_overlaps(triggers))
+    lines.append(f"{len(results) - len(failed)}/{len(results)} skills valid")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate skill directories')
+    parser.add_argument('paths', nargs='*', help='Skill directories, or roots to search with --all')
+    parser.add_argument('--all', action='store_true',
+                        help='Validate every skill found under the given roots (default: .)')
+    parser.add_argument('--format', choices=['text', 'json', 'junit'], default='text',
+                        help='Report format for batch runs (default: text)')
+    parser.add_argument('--output', '-o', help='Write the report to this file instead of stdout')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--cache', metavar='FILE',
+                        help='Reuse results for unchanged SKILL.md files from this cache file')
+    parser.add_argument('--deep', action='store_true',
+                        help='Also compile scripts, check relative markdown links and asset sizes')
+    parser.add_argument('--triggers', action='store_true',
+                        help='Report triggers duplicated or overlapping across skills (warnings only)')
+    args = parser.parse_args()
+
+    if (not args.all and len(args.paths) == 1 and args.format == 'text'
+            and not args.output and not args.cache and not args.triggers):
+        valid, message = validate_skill(args.paths[0], args.deep)
+        print(message)
+        sys.exit(0 if valid else 1)
+
+    if args.all:
+        skill_paths = [p for root in (args.paths or ['.']) for p in find_skills(root)]
+    else:
+        skill_paths = args.paths
+    if not skill_paths:
+        parser.error('no skills to validate')
+
+    results = validate_skills(skill_paths, args.jobs, args.cache, args.deep)
+    triggers = None
+    if args.triggers:
+        from trigger_index import find_overlaps, load_triggers
+        triggers = find_overlaps(load_triggers(skill_paths))
+    report = format_report(results, args.format, triggers)
+    if args.output:
+        Path(args.output).write_text(report + '\n')
+    else:
+        print(report)
+    sys.exit(0 if all(valid for _, valid, _ in results) else 1)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python quick_validate.py <skill_directory>")
-        sys.exit(1)
-    
-    valid, message = validate_skill(sys.argv[1])
-    print(message)
-    sys.exit(0 if valid else 1)
\ No newline at end of file
+    main()
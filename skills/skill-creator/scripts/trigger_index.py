@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Trigger Index - Finds duplicate and overlapping skill triggers
+
+Skills are activated when a message contains one of their `triggers:`.
+A trigger that another skill's trigger contains (`git` inside `github`)
+activates both skills for the same message, so every overlap costs context.
+All triggers are kept in one trie: a trigger's overlaps are found by walking
+the trie from each of its character positions, which costs O(length^2) per
+trigger instead of comparing every pair of triggers.
+
+Usage:
+    trigger_index.py [skills_dir ...] [--format text|json]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from frontmatter import FrontmatterError, load_frontmatter
+
+
+def normalize_trigger(trigger):
+    """Case- and whitespace-insensitive form used for matching"""
+    return ' '.join(str(trigger).lower().split())
+
+
+def load_triggers(skill_paths):
+    """{skill name: [normalized triggers]} for skills declaring triggers"""
+    triggers = {}
+    for skill_path in skill_paths:
+        try:
+            frontmatter = load_frontmatter(Path(skill_path) / 'SKILL.md')
+        except (OSError, FrontmatterError, UnicodeDecodeError):
+            continue
+        values = frontmatter.get('triggers')
+        if not isinstance(values, list):
+            continue
+        name = str(frontmatter.get('name') or Path(skill_path).name)
+        normalized = [normalize_trigger(t) for t in values if isinstance(t, str) and t.strip()]
+        triggers.setdefault(name, [])
+        triggers[name].extend(t for t in dict.fromkeys(normalized) if t not in triggers[name])
+    return triggers
+
+
+class TriggerTrie:
+    """Character trie of triggers; terminal nodes hold the skills declaring them."""
+
+    __slots__ = ('root',)
+
+    def __init__(self, triggers_by_skill=None):
+        # A node is a dict of child characters; the None key holds the owning skills
+        self.root = {}
+        for skill, triggers in (triggers_by_skill or {}).items():
+            for trigger in triggers:
+                self.add(trigger, skill)
+
+    def add(self, trigger, skill):
+        node = self.root
+        for char in trigger:
+            node = node.setdefault(char, {})
+        node.setdefault(None, set()).add(skill)
+
+    def __iter__(self):
+        """(trigger, skills) for every trigger in the trie"""
+        stack = [('', self.root)]
+        while stack:
+            prefix, node = stack.pop()
+            if None in node:
+                yield prefix, node[None]
+            stack.extend((prefix + char, child) for char, child in node.items() if char is not None)
+
+    def contained(self, text):
+        """(start, trigger, skills) for every trigger occurring in text"""
+        for start in range(len(text)):
+            node = self.root
+            for end in range(start, len(text)):
+                node = node.get(text[end])
+                if node is None:
+                    break
+                if None in node:
+                    yield start, text[start:end + 1], node[None]
+
+
+def find_overlaps(triggers_by_skill):
+    """
+    Duplicate triggers and triggers contained in other skills' triggers.
+
+    Returns {'duplicates': [...], 'overlaps': [...]}. A duplicate is one
+    trigger declared by several skills; an overlap is a trigger that occurs
+    inside a longer trigger (as a 'prefix' or 'substring'), reported when it
+    activates a skill the longer trigger does not.
+    """
+    trie = TriggerTrie(triggers_by_skill)
+    duplicates, overlaps = [], []
+    for trigger, skills in sorted(trie):
+        if len(skills) > 1:
+            duplicates.append({'trigger': trigger, 'skills': sorted(skills)})
+        reported = set()
+        for start, inner, inner_skills in trie.contained(trigger):
+            if inner == trigger or inner in reported or not inner_skills - skills:
+                continue
+            reported.add(inner)
+            overlaps.append({
+                'trigger': inner,
+                'skills': sorted(inner_skills),
+                'within': trigger,
+                'within_skills': sorted(skills),
+                'kind': 'prefix' if start == 0 else 'substring',
+            })
+    return {'duplicates': duplicates, 'overlaps': overlaps}
+
+
+def format_overlaps(report):
+    """Human-readable lines for a find_overlaps report"""
+    lines = []
+    for dup in report['duplicates']:
+        lines.append(f"⚠️  Duplicate trigger '{dup['trigger']}': {', '.join(dup['skills'])}")
+    for overlap in report['overlaps']:
+        lines.append(
+            f"⚠️  Trigger '{overlap['trigger']}' ({', '.join(overlap['skills'])}) is a {overlap['kind']} "
+            f"of '{overlap['within']}' ({', '.join(overlap['within_skills'])})"
+        )
+    return lines
+
+
+def main():
+    from quick_validate import find_skills
+
+    parser = argparse.ArgumentParser(description='Report duplicate and overlapping skill triggers')
+    parser.add_argument('roots', nargs='*', default=['.'], help='Directories to search for skills')
+    parser.add_argument('--format', choices=['text', 'json'], default='text')
+    args = parser.parse_args()
+
+    skill_paths = [p for root in args.roots for p in find_skills(root)]
+    report = find_overlaps(load_triggers(skill_paths))
+    if args.format == 'json':
+        print(json.dumps(report, indent=2))
+    else:
+        lines = format_overlaps(report)
+        print('\n'.join(lines) if lines else "✅ No duplicate or overlapping triggers")
+    sys.exit(1 if report['duplicates'] or report['overlaps'] else 0)
+
+
+if __name__ == "__main__":
+    main()
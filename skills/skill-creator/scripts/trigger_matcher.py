@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Trigger Matcher - Finds the skills a message activates in one pass
+
+All `triggers:` of a skill registry are compiled into a single Aho-Corasick
+automaton, so a message is scanned once, character by character, however
+many skills there are (instead of one substring search per trigger). The
+automaton is saved as JSON and reused until a SKILL.md changes.
+
+Matching follows skill activation: case-insensitive substring matches, or
+with word_boundaries only matches not inside a longer word.
+
+Usage:
+    trigger_matcher.py [skills_dir ...] --match "How do I rebase on GitHub?"
+    trigger_matcher.py skills --automaton .cache/triggers.json --match "..."
+    trigger_matcher.py skills --benchmark messages.txt [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+from trigger_index import load_triggers, normalize_trigger
+
+# Bump when the serialized layout changes
+FORMAT_VERSION = 1
+
+
+class TriggerMatcher:
+    """
+    Aho-Corasick automaton over normalized triggers.
+
+    State 0 is the root. goto[s] maps a character to the next state,
+    fail[s] is the longest proper suffix state, and out[s] lists the
+    trigger ids ending at s (including those reached via fail links).
+    """
+
+    __slots__ = ('triggers', 'skills', 'goto', 'fail', 'out', 'word_boundaries')
+
+    def __init__(self, triggers, skills, goto, fail, out, word_boundaries=False):
+        self.triggers = triggers
+        self.skills = skills
+        self.goto = goto
+        self.fail = fail
+        self.out = out
+        self.word_boundaries = word_boundaries
+
+    @classmethod
+    def compile(cls, triggers_by_skill, word_boundaries=False):
+        """Build the automaton from {skill: [triggers]}"""
+        ids = {}
+        skills = []
+        for skill, values in triggers_by_skill.items():
+            for trigger in values:
+                trigger = normalize_trigger(trigger)
+                if not trigger:
+                    continue
+                if trigger not in ids:
+                    ids[trigger] = len(ids)
+                    skills.append([])
+                if skill not in skills[ids[trigger]]:
+                    skills[ids[trigger]].append(skill)
+        triggers = list(ids)
+
+        goto, out = [{}], [[]]
+        for tid, trigger in enumerate(triggers):
+            state = 0
+            for char in trigger:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = goto[state][char] = len(goto)
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(tid)
+
+        # Breadth-first, so fail states are complete before their children need them
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and char not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(char, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+        return cls(triggers, skills, goto, fail, out, word_boundaries)
+
+    def _scan(self, text):
+        """(start, end, trigger id) for every occurrence, in order of end position"""
+        goto, fail, out, triggers = self.goto, self.fail, self.out, self.triggers
+        root = goto[0]
+        state = 0
+        for i, char in enumerate(text):
+            if state == 0 and char not in root:
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for tid in out[state]:
+                start = i + 1 - len(triggers[tid])
+                if self.word_boundaries and not _on_word_boundaries(text, start, i + 1):
+                    continue
+                yield start, i + 1, tid
+
+    def find(self, message):
+        """(start, end, trigger) for every trigger occurrence in the normalized message"""
+        for start, end, tid in self._scan(normalize_trigger(message)):
+            yield start, end, self.triggers[tid]
+
+    def match(self, message):
+        """Skills activated by message, in order of their first trigger's position"""
+        found = {}
+        for _, _, tid in sorted(self._scan(normalize_trigger(message))):
+            for skill in self.skills[tid]:
+                found.setdefault(skill, None)
+        return list(found)
+
+    def to_dict(self):
+        return {
+            'version': FORMAT_VERSION,
+            'word_boundaries': self.word_boundaries,
+            'triggers': self.triggers,
+            'skills': self.skills,
+            'goto': self.goto,
+            'fail': self.fail,
+            'out': self.out,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported automaton format: {data.get('version')}")
+        return cls(data['triggers'], data['skills'], data['goto'], data['fail'], data['out'],
+                   data['word_boundaries'])
+
+
+def _on_word_boundaries(text, start, end):
+    """True unless the match continues a word on either side"""
+    if start > 0 and text[start].isalnum() and text[start - 1].isalnum():
+        return False
+    if end < len(text) and text[end - 1].isalnum() and text[end].isalnum():
+        return False
+    return True
+
+
+def registry_fingerprint(skill_paths):
+    """Size and mtime of every SKILL.md, to detect a stale saved automaton"""
+    fingerprint = []
+    for skill_path in sorted(str(p) for p in skill_paths):
+        try:
+            st = os.stat(os.path.join(skill_path, 'SKILL.md'))
+        except FileNotFoundError:
+            continue
+        fingerprint.append([skill_path, st.st_size, st.st_mtime_ns])
+    return fingerprint
+
+
+def load_matcher(skill_paths, automaton_path=None, word_boundaries=False):
+    """
+    Matcher for a set of skills, reusing the automaton saved at automaton_path.
+
+    The saved automaton is rebuilt (and rewritten) when any SKILL.md or
+    the matching mode changed since it was saved.
+    """
+    fingerprint = registry_fingerprint(skill_paths)
+    if automaton_path:
+        try:
+            data = json.loads(Path(automaton_path).read_text())
+            if data.get('registry') == fingerprint and data.get('word_boundaries') == word_boundaries:
+                return TriggerMatcher.from_dict(data)
+        except (OSError, ValueError, KeyError):
+            pass
+    matcher = TriggerMatcher.compile(load_triggers(skill_paths), word_boundaries)
+    if automaton_path:
+        save_matcher(matcher, automaton_path, fingerprint)
+    return matcher
+
+
+def save_matcher(matcher, automaton_path, fingerprint=None):
+    """Atomically write a matcher (and the registry fingerprint it was built from)"""
+    automaton_path = Path(automaton_path)
+    automaton_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=automaton_path.parent, prefix=f".{automaton_path.name}.")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({**matcher.to_dict(), 'registry': fingerprint}, f, separators=(',', ':'))
+        os.replace(tmp, automaton_path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def naive_match(triggers_by_skill, message):
+    """Reference matcher: one substring search per (normalized) trigger of every skill"""
+    text = normalize_trigger(message)
+    return {
+        skill for skill, triggers in triggers_by_skill.items()
+        if any(t in text for t in triggers)
+    }
+
+
+def benchmark(triggers_by_skill, messages, repeat=3):
+    """
+    Time the compiled matcher against the naive scan over a message corpus.
+
+    Returns a dict of best-of-repeat seconds per corpus pass and the number
+    of messages on which the two disagreed (always 0 unless broken).
+    """
+    triggers_by_skill = {
+        skill: [normalize_trigger(t) for t in triggers] for skill, triggers in triggers_by_skill.items()
+    }
+    start = time.perf_counter()
+    matcher = TriggerMatcher.compile(triggers_by_skill)
+    compile_seconds = time.perf_counter() - start
+
+    def best(fn):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for message in messages:
+                fn(message)
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    mismatches = sum(
+        1 for message in messages
+        if set(matcher.match(message)) != naive_match(triggers_by_skill, message)
+    )
+    return {
+        'messages': len(messages),
+        'skills': len(triggers_by_skill),
+        'triggers': len(matcher.triggers),
+        'compile_seconds': compile_seconds,
+        'automaton_seconds': best(matcher.match),
+        'naive_seconds': best(lambda m: naive_match(triggers_by_skill, m)),
+        'mismatches': mismatches,
+    }
+
+
+def main():
+    from quick_validate import find_skills
+
+    parser = argparse.ArgumentParser(description='Match messages against skill triggers')
+    parser.add_argument('roots', nargs='*', default=['.'], help='Directories to search for skills')
+    parser.add_argument('--automaton', metavar='FILE',
+                        help='Load the compiled automaton from FILE, rebuilding it when stale')
+    parser.add_argument('--word-boundaries', action='store_true',
+                        help='Ignore matches inside longer words (git in github)')
+    parser.add_argument('--match', metavar='MESSAGE', help='Print the skills a message activates')
+    parser.add_argument('--benchmark', metavar='CORPUS',
+                        help='Time matching of a corpus (one message per line) against a naive scan')
+    parser.add_argument('--repeat', type=int, default=3, help='Benchmark repetitions (default: 3)')
+    args = parser.parse_args()
+
+    skill_paths = [p for root in args.roots for p in find_skills(root)]
+    if args.benchmark:
+        messages = Path(args.benchmark).read_text().splitlines()
+        result = benchmark(load_triggers(skill_paths), messages, args.repeat)
+        print(f"📊 {result['messages']} messages, {result['skills']} skills, {result['triggers']} triggers")
+        print(f"   Compile:   {result['compile_seconds'] * 1000:.1f} ms")
+        for label, key in (('Automaton', 'automaton_seconds'), ('Naive', 'naive_seconds')):
+            seconds = result[key]
+            rate = result['messages'] / seconds if seconds else float('inf')
+            print(f"   {label + ':':<10} {seconds * 1000:.1f} ms ({rate:,.0f} messages/s)")
+        if result['mismatches']:
+            print(f"❌ {result['mismatches']} message(s) matched differently")
+            sys.exit(1)
+        return
+
+    matcher = load_matcher(skill_paths, args.automaton, args.word_boundaries)
+    if args.match is not None:
+        for skill in matcher.match(args.match):
+            print(skill)
+    else:
+        print(f"✅ Compiled {len(matcher.triggers)} triggers into {len(matcher.goto)} states")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+FETCH_SKILL_PATH = Path(__file__).resolve().parents[1] / 'skills' / 'add-skill' / 'scripts' / 'fetch_skill.py'
+
+
+def load_fetch_skill_module():
+    spec = importlib.util.spec_from_file_location('fetch_skill', FETCH_SKILL_PATH)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def git(*args, **kwargs) -> str:
+    return subprocess.run(['git', '-c', 'user.name=t', '-c', 'user.email=t@example.com', *args],
+                          check=True, capture_output=True, text=True, **kwargs).stdout
+
+
+def commit_repo(root: Path, message: str = 'init') -> Path:
+    """Turn a directory into a repository with one commit on main that serves partial clones."""
+    git('init', '-q', '-b', 'main', str(root))
+    git('-C', str(root), 'config', 'uploadpack.allowFilter', 'true')
+    git('-C', str(root), 'add', '.')
+    git('-C', str(root), 'commit', '-qm', message)
+    return root
+
+
+@pytest.fixture
+def make_upstream(monkeypatch):
+    """
+    Commit a prepared upstream directory and serve it to a freshly loaded fetch_skill.
+
+    make_upstream(root, message) returns (module, root); every owner/repo
+    resolves to root.
+    """
+    def make(root: Path, message: str = 'init'):
+        mod = load_fetch_skill_module()
+        commit_repo(root, message)
+        monkeypatch.setattr(mod, 'build_repo_url', lambda owner, repo: root.as_uri())
+        return mod, root
+
+    return make
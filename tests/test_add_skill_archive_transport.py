@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import functools
+import http.server
+import json
+import os
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+from conftest import commit_repo, git, load_fetch_skill_module
+
+
+@pytest.fixture
+def archives(tmp_path):
+    root = tmp_path / 'upstream'
+    skill = root / 'skills' / 'docker'
+    (skill / 'scripts').mkdir(parents=True)
+    (skill / 'SKILL.md').write_text('---\nname: docker\n---\n')
+    (skill / 'scripts' / 'run.sh').write_text('#!/bin/sh\n')
+    (skill / 'scripts' / 'run.sh').chmod(0o755)
+    os.symlink('SKILL.md', skill / 'README.md')
+    (root / 'skills' / 'dockerfile').mkdir()
+    (root / 'skills' / 'dockerfile' / 'SKILL.md').write_text('similar prefix\n')
+    commit_repo(root)
+    served = tmp_path / 'served'
+    served.mkdir()
+    for fmt in ('tar.gz', 'zip'):
+        git('-C', str(root), 'archive', f'--format={fmt}', '--prefix=skills-main/',
+            '-o', str(served / f'main.{fmt}'), 'main')
+    return served, git('-C', str(root), 'rev-parse', 'main').strip()
+
+
+@pytest.fixture
+def no_git(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('git must not run with the archive transport')
+
+    monkeypatch.setattr(subprocess, 'run', fail)
+    monkeypatch.setattr(subprocess, 'Popen', fail)
+
+
+def _check_install(installed: Path) -> None:
+    assert (installed / 'SKILL.md').read_text() == '---\nname: docker\n---\n'
+    assert os.access(installed / 'scripts' / 'run.sh', os.X_OK)
+    assert os.readlink(installed / 'README.md') == 'SKILL.md'
+
+
+@pytest.mark.parametrize('fmt', ['tar.gz', 'zip'])
+def test_archive_from_local_file(archives, tmp_path, monkeypatch, no_git, fmt):
+    mod = load_fetch_skill_module()
+    served, commit = archives
+    monkeypatch.setattr(mod, 'build_archive_url', lambda owner, repo, ref: (served / f'{ref}.{fmt}').as_uri())
+
+    installed = Path(mod.fetch_skill('o/skills/skills/docker', str(tmp_path / 'ws'), transport='archive'))
+
+    _check_install(installed)
+    assert sorted(p.name for p in installed.parent.iterdir()) == ['docker']
+    lock = json.loads((tmp_path / 'ws' / '.agents' / 'skills.lock').read_text())
+    assert lock['skills']['docker']['commit'] == commit
+    assert lock['skills']['docker']['tree'] == mod.git_tree_hash(installed)
+
+
+@pytest.fixture
+def http_server(archives):
+    served, _ = archives
+    class QuietHandler(http.server.SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    handler = functools.partial(QuietHandler, directory=str(served))
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+
+
+def test_tarball_streams_over_http(http_server, tmp_path, monkeypatch, no_git):
+    mod = load_fetch_skill_module()
+    monkeypatch.setattr(mod, 'build_archive_url', lambda owner, repo, ref: f'{http_server}/{ref}.tar.gz')
+
+    _check_install(Path(mod.fetch_skill('o/skills/skills/docker', str(tmp_path / 'ws'), transport='archive')))
+
+
+def test_zip_over_http_is_rejected(http_server, tmp_path, monkeypatch):
+    mod = load_fetch_skill_module()
+    monkeypatch.setattr(mod, 'build_archive_url', lambda owner, repo, ref: f'{http_server}/{ref}.zip')
+
+    with pytest.raises(mod.SkillFetchError, match='only local files'):
+        mod.fetch_skill('o/skills/skills/docker', str(tmp_path / 'ws'), transport='archive')
+
+
+def test_custom_transport_can_be_registered(tmp_path, monkeypatch):
+    mod = load_fetch_skill_module()
+
+    def fake_transport(owner, repo, branch, skill_paths, tmpdir, commit=None):
+        for skill_path in skill_paths:
+            (Path(tmpdir) / skill_path).mkdir(parents=True)
+            (Path(tmpdir) / skill_path / 'SKILL.md').write_text(f'{owner}/{repo}@{branch}\n')
+        return 'f' * 40
+
+    monkeypatch.setitem(mod.TRANSPORTS, 'fake', fake_transport)
+    installed = Path(mod.fetch_skill('o/r/tree/dev/skills/x', str(tmp_path / 'ws'), transport='fake'))
+
+    assert (installed / 'SKILL.md').read_text() == 'o/r@dev\n'
+    with pytest.raises(ValueError):
+        mod.fetch_skill('o/r/skills/y', str(tmp_path / 'ws'), transport='carrier-pigeon')
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from conftest import FETCH_SKILL_PATH, git, load_fetch_skill_module
+
+
+@pytest.fixture
+def upstream(tmp_path, make_upstream):
+    root = tmp_path / 'upstream'
+    (root / 'skills' / 'docker').mkdir(parents=True)
+    (root / 'skills' / 'docker' / 'SKILL.md').write_text('v1\n')
+    return make_upstream(root, 'v1')
+
+
+def test_failed_reinstall_keeps_existing_skill(upstream, tmp_path, monkeypatch):
+    mod, _ = upstream
+    installed = Path(mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws')))
+    (installed / 'SKILL.md').write_text('local\n')
+
+    def broken_copytree(*args, **kwargs):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(shutil, 'copytree', broken_copytree)
+    with pytest.raises(mod.SkillFetchError, match='disk full'):
+        mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws'), force=True)
+
+    assert (installed / 'SKILL.md').read_text() == 'local\n'
+    assert [p.name for p in installed.parent.iterdir()] == ['docker']
+
+
+def test_interrupted_swap_is_recovered(upstream, tmp_path):
+    mod, _ = upstream
+    skills_dir = tmp_path / 'ws' / '.agents' / 'skills'
+    # Crash after the old version was moved aside, before the new one landed
+    (skills_dir / '.docker.old-abc123').mkdir(parents=True)
+    (skills_dir / '.docker.old-abc123' / 'SKILL.md').write_text('previous\n')
+    (skills_dir / '.docker.install-xyz789').mkdir()
+    # Crash with both versions present: the moved-aside one is stale
+    (skills_dir / 'npm').mkdir()
+    (skills_dir / '.npm.old-def456').mkdir()
+
+    with mod.workspace_lock(str(tmp_path / 'ws')):
+        pass
+
+    assert sorted(p.name for p in skills_dir.iterdir()) == ['docker', 'npm']
+    assert (skills_dir / 'docker' / 'SKILL.md').read_text() == 'previous\n'
+
+
+def test_lockfile_write_is_atomic(tmp_path, monkeypatch):
+    mod = load_fetch_skill_module()
+    mod.write_lockfile(str(tmp_path), {'version': 1, 'skills': {'a': {}}})
+
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(mod.json, 'dump', crash)
+    with pytest.raises(KeyboardInterrupt):
+        mod.write_lockfile(str(tmp_path), {'version': 1, 'skills': {}})
+
+    assert mod.read_lockfile(str(tmp_path))['skills'] == {'a': {}}
+    assert sorted(p.name for p in (tmp_path / '.agents').iterdir()) == ['skills.lock']
+
+
+def test_concurrent_processes_install_once(upstream, tmp_path):
+    _, root = upstream
+    driver = tmp_path / 'driver.py'
+    driver.write_text(textwrap.dedent(f'''
+        import importlib.util, sys
+        spec = importlib.util.spec_from_file_location('fetch_skill', {str(FETCH_SKILL_PATH)!r})
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        mod.build_repo_url = lambda owner, repo: {root.as_uri()!r}
+        mod.fetch_skills(['o/r/skills/docker'], sys.argv[1])
+    '''))
+    ws = str(tmp_path / 'ws')
+
+    procs = [subprocess.Popen([sys.executable, str(driver), ws], stdout=subprocess.PIPE, text=True)
+             for _ in range(4)]
+    outputs = [proc.communicate()[0] for proc in procs]
+
+    assert [proc.returncode for proc in procs] == [0, 0, 0, 0]
+    assert sum('Fetching skill' in out for out in outputs) == 1
+    assert sum('is up to date' in out for out in outputs) == 3
+    assert (tmp_path / 'ws' / '.agents' / 'skills' / 'docker' / 'SKILL.md').read_text() == 'v1\n'
+
+
+@pytest.mark.skipif(load_fetch_skill_module()._renameat2 is None, reason='needs renameat2')
+@pytest.mark.parametrize('operation', ['reinstall', 'update'])
+def test_skill_directory_present_throughout_swap(upstream, tmp_path, monkeypatch, operation):
+    mod, root = upstream
+    installed = Path(mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws')))
+    (root / 'skills' / 'docker' / 'SKILL.md').write_text('v2\n')
+    git('-C', str(root), 'commit', '-qam', 'v2')
+
+    # Check the installed skill before and after every rename the swap makes
+    seen = []
+
+    def spy(name, real):
+        def call(*args, **kwargs):
+            seen.append((name, (installed / 'SKILL.md').is_file()))
+            try:
+                return real(*args, **kwargs)
+            finally:
+                seen.append((name, (installed / 'SKILL.md').is_file()))
+        return call
+
+    monkeypatch.setattr(mod, '_renameat2', spy('renameat2', mod._renameat2))
+    monkeypatch.setattr(Path, 'rename', spy('rename', Path.rename))
+    monkeypatch.setattr(mod.os, 'rename', spy('rename', mod.os.rename))
+
+    if operation == 'reinstall':
+        mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws'), force=True)
+    else:
+        mod.update_skills(str(tmp_path / 'ws'))
+
+    assert ('renameat2', True) in seen
+    assert all(present for _, present in seen)
+    assert (installed / 'SKILL.md').read_text() == 'v2\n'
+    assert [p.name for p in installed.parent.iterdir()] == ['docker']
+
+
+def test_swap_without_exchange_falls_back_to_rename(upstream, tmp_path, monkeypatch):
+    mod, root = upstream
+    installed = Path(mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws')))
+    (root / 'skills' / 'docker' / 'SKILL.md').write_text('v2\n')
+    git('-C', str(root), 'commit', '-qam', 'v2')
+    monkeypatch.setattr(mod, '_renameat2', None)
+
+    mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws'), force=True)
+
+    assert (installed / 'SKILL.md').read_text() == 'v2\n'
+    assert [p.name for p in installed.parent.iterdir()] == ['docker']
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from conftest import git
+
+
+@pytest.fixture
+def upstream(tmp_path, make_upstream):
+    root = tmp_path / 'upstream'
+    skill = root / 'skills' / 'pdf'
+    (skill / 'scripts').mkdir(parents=True)
+    (skill / 'a').mkdir()
+    (skill / 'SKILL.md').write_text('---\nname: pdf\n---\n')
+    (skill / 'scripts' / 'run.sh').write_text('#!/bin/sh\necho run\n')
+    (skill / 'scripts' / 'run.sh').chmod(0o755)
+    (skill / 'a' / 'nested.txt').write_text('nested\n')
+    (skill / 'a.b').write_text('sorts after the a/ tree\n')
+    (skill / 'a-b').write_text('sorts before the a/ tree\n')
+    (skill / 'theme.pdf').write_bytes(os.urandom(4096))
+    os.symlink('SKILL.md', skill / 'README.md')
+    return make_upstream(root)
+
+
+def test_tree_hash_matches_git(upstream):
+    mod, root = upstream
+    (root / 'skills' / 'pdf' / 'empty-dir').mkdir()
+
+    expected = git('-C', str(root), 'rev-parse', 'HEAD:skills/pdf').strip()
+    assert mod.git_tree_hash(root / 'skills' / 'pdf') == expected
+
+
+@pytest.mark.parametrize('use_mirror', [False, True])
+def test_installs_share_hardlinked_store_entry(upstream, tmp_path, use_mirror):
+    mod, root = upstream
+    store = tmp_path / 'store'
+    cache = str(tmp_path / 'cache') if use_mirror else None
+    tree = git('-C', str(root), 'rev-parse', 'HEAD:skills/pdf').strip()
+
+    first = Path(mod.fetch_skill('o/r/skills/pdf', str(tmp_path / 'ws1'), cache_dir=cache, store_dir=str(store)))
+    second = Path(mod.fetch_skill('o/r/skills/pdf', str(tmp_path / 'ws2'), cache_dir=cache, store_dir=str(store)))
+
+    entry = store / tree[:2] / tree
+    assert entry.is_dir()
+    for rel in ('SKILL.md', 'theme.pdf', 'a/nested.txt'):
+        assert (first / rel).stat().st_ino == (second / rel).stat().st_ino == (entry / rel).stat().st_ino
+    assert os.readlink(second / 'README.md') == 'SKILL.md'
+    assert os.access(second / 'scripts' / 'run.sh', os.X_OK)
+    assert not (entry / 'SKILL.md').stat().st_mode & 0o222
+
+
+def test_stored_version_skips_mirror_export(upstream, tmp_path, monkeypatch):
+    mod, _ = upstream
+    store, cache = str(tmp_path / 'store'), str(tmp_path / 'cache')
+    mod.fetch_skill('o/r/skills/pdf', str(tmp_path / 'ws1'), cache_dir=cache, store_dir=store)
+
+    exported = []
+    monkeypatch.setattr(mod, 'export_from_mirror', lambda mirror, trees, dest: exported.extend(trees))
+    installed = Path(mod.fetch_skill('o/r/skills/pdf', str(tmp_path / 'ws2'), cache_dir=cache, store_dir=store))
+
+    assert exported == []
+    assert (installed / 'SKILL.md').exists()
+
+
+def test_force_reinstall_over_hardlinked_skill(upstream, tmp_path):
+    mod, _ = upstream
+    store = str(tmp_path / 'store')
+    mod.fetch_skill('o/r/skills/pdf', str(tmp_path / 'ws'), store_dir=store)
+
+    installed = Path(mod.fetch_skill('o/r/skills/pdf', str(tmp_path / 'ws'), force=True, store_dir=store))
+
+    assert (installed / 'SKILL.md').read_text() == '---\nname: pdf\n---\n'
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import subprocess
 from pathlib import Path
 
 
@@ -17,7 +18,13 @@ def _load_fetch_skill_module():
 def test_fetch_skill_installs_into_agents_skills_dir(tmp_path: Path, monkeypatch):
     fetch_skill_mod = _load_fetch_skill_module()
     fetch_skill = fetch_skill_mod.fetch_skill
-    monkeypatch.setattr('subprocess.run', lambda *args, **kwargs: None)
+
+    def fake_run(cmd, *args, **kwargs):
+        # Only the final rev-parse HEAD is read; the clone steps need no output
+        stdout = '0' * 40 + '\n' if cmd[-2:] == ['rev-parse', 'HEAD'] else ''
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr='')
+
+    monkeypatch.setattr('subprocess.run', fake_run)
 
     skill_path = 'skills/example-skill'
     src_skill_dir = tmp_path / skill_path
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from conftest import git
+
+
+@pytest.fixture
+def upstream(tmp_path, make_upstream):
+    root = tmp_path / 'upstream'
+    (root / 'skills' / 'docker').mkdir(parents=True)
+    (root / 'skills' / 'docker' / 'SKILL.md').write_text('v1\n')
+    return make_upstream(root, 'v1')
+
+
+def _advance(root: Path) -> None:
+    (root / 'skills' / 'docker' / 'SKILL.md').write_text('v2\n')
+    git('-C', str(root), 'commit', '-qam', 'v2')
+
+
+def test_install_writes_lock_entry(upstream, tmp_path):
+    mod, root = upstream
+    mod.fetch_skill('OpenHands/skills/skills/docker', str(tmp_path / 'ws'))
+
+    lock = json.loads((tmp_path / 'ws' / '.agents' / 'skills.lock').read_text())
+    assert lock['version'] == 1
+    assert lock['skills']['docker'] == {
+        'source': 'OpenHands/skills',
+        'path': 'skills/docker',
+        'branch': 'main',
+        'commit': git('-C', str(root), 'rev-parse', 'main').strip(),
+        'tree': git('-C', str(root), 'rev-parse', 'main:skills/docker').strip(),
+    }
+
+
+def test_matching_install_skips_network(upstream, tmp_path, monkeypatch):
+    mod, _ = upstream
+    mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws'))
+
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError('network/git used on the fast path')
+
+    monkeypatch.setattr(subprocess, 'run', no_subprocess)
+    monkeypatch.setattr(subprocess, 'Popen', no_subprocess)
+    assert mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws')) == str(
+        tmp_path / 'ws' / '.agents' / 'skills' / 'docker')
+
+
+@pytest.mark.parametrize('use_mirror', [False, True])
+def test_missing_locked_skill_reinstalls_pinned_commit(upstream, tmp_path, monkeypatch, use_mirror):
+    mod, root = upstream
+    cache = str(tmp_path / 'cache') if use_mirror else None
+    installed = Path(mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws'), cache_dir=cache))
+    _advance(root)
+    monkeypatch.setattr(mod, 'MIRROR_MAX_AGE', 0)
+    (installed / 'SKILL.md').unlink()
+    installed.rmdir()
+
+    mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws'), cache_dir=cache)
+
+    assert (installed / 'SKILL.md').read_text() == 'v1\n'
+
+
+def test_modified_install_still_needs_force(upstream, tmp_path):
+    mod, _ = upstream
+    installed = Path(mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws')))
+    (installed / 'SKILL.md').write_text('local edit\n')
+
+    with pytest.raises(SystemExit):
+        mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws'))
+    mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws'), force=True)
+    assert (installed / 'SKILL.md').read_text() == 'v1\n'
+
+
+@pytest.mark.parametrize('use_mirror', [False, True])
+def test_force_ignores_lock_and_installs_branch_head(upstream, tmp_path, monkeypatch, use_mirror):
+    mod, root = upstream
+    cache = str(tmp_path / 'cache') if use_mirror else None
+    installed = Path(mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws'), cache_dir=cache))
+    _advance(root)
+    monkeypatch.setattr(mod, 'MIRROR_MAX_AGE', 0)
+
+    mod.fetch_skill('o/r/skills/docker', str(tmp_path / 'ws'), force=True, cache_dir=cache)
+
+    assert (installed / 'SKILL.md').read_text() == 'v2\n'
+    lock = json.loads((tmp_path / 'ws' / '.agents' / 'skills.lock').read_text())
+    assert lock['skills']['docker']['commit'] == git('-C', str(root), 'rev-parse', 'main').strip()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from conftest import commit_repo, git, load_fetch_skill_module
+
+
+def _write_upstream(root: Path) -> Path:
+    skill = root / 'skills' / 'docker'
+    skill.mkdir(parents=True)
+    (skill / 'SKILL.md').write_text('---\nname: docker\n---\n')
+    (skill / 'scripts').mkdir()
+    (skill / 'scripts' / 'run.sh').write_text('echo run\n')
+    (root / 'skills' / 'other').mkdir()
+    (root / 'skills' / 'other' / 'SKILL.md').write_text('other\n')
+    return root
+
+
+@pytest.fixture
+def upstream(tmp_path, make_upstream):
+    return make_upstream(_write_upstream(tmp_path / 'upstream'))
+
+
+def _spy_git(monkeypatch):
+    calls = []
+    real_run = subprocess.run
+
+    def run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, 'run', run)
+    return calls
+
+
+def test_install_through_mirror_and_reuse_it(upstream, tmp_path, monkeypatch):
+    mod, _ = upstream
+    cache = tmp_path / 'cache'
+
+    first = Path(mod.fetch_skill('OpenHands/skills/skills/docker', str(tmp_path / 'ws1'), cache_dir=str(cache)))
+    assert (first / 'SKILL.md').read_text() == '---\nname: docker\n---\n'
+    assert (first / 'scripts' / 'run.sh').exists()
+    mirror = cache / 'OpenHands' / 'skills.git'
+    assert (mirror / 'HEAD').exists()
+    listing = subprocess.run(['git', '-C', str(mirror), 'rev-list', '--objects', '--missing=print', 'main'],
+                             check=True, capture_output=True, text=True).stdout
+    assert any(line.startswith('?') for line in listing.splitlines()), 'other skills stay unfetched'
+
+    calls = _spy_git(monkeypatch)
+    second = Path(mod.fetch_skill('OpenHands/skills/skills/docker', str(tmp_path / 'ws2'), cache_dir=str(cache)))
+    assert (second / 'scripts' / 'run.sh').read_text() == 'echo run\n'
+    network = [c for c in calls if 'clone' in c or 'fetch' in c]
+    assert network == []
+
+
+def test_stale_mirror_fetches_new_commits(upstream, tmp_path, monkeypatch):
+    mod, root = upstream
+    cache = tmp_path / 'cache'
+    mod.fetch_skill('OpenHands/skills/skills/docker', str(tmp_path / 'ws'), cache_dir=str(cache))
+
+    (root / 'skills' / 'docker' / 'SKILL.md').write_text('---\nname: docker\n---\nv2\n')
+    git('-C', str(root), 'commit', '-qam', 'v2')
+    monkeypatch.setattr(mod, 'MIRROR_MAX_AGE', 0)
+
+    installed = Path(mod.fetch_skill('OpenHands/skills/skills/docker', str(tmp_path / 'ws'),
+                                     force=True, cache_dir=str(cache)))
+    assert (installed / 'SKILL.md').read_text().endswith('v2\n')
+
+
+def test_missing_skill_path_fails(upstream, tmp_path):
+    mod, _ = upstream
+    with pytest.raises(mod.SkillFetchError, match='not found'):
+        mod.fetch_skill('OpenHands/skills/skills/nope', str(tmp_path / 'ws'), cache_dir=str(tmp_path / 'cache'))
+
+
+def test_mirror_config_does_not_store_token(tmp_path, monkeypatch):
+    mod = load_fetch_skill_module()
+    root = commit_repo(_write_upstream(tmp_path / 'upstream'))
+    # Serve the real github.com URL from the local upstream
+    monkeypatch.setenv('GIT_CONFIG_COUNT', '1')
+    monkeypatch.setenv('GIT_CONFIG_KEY_0', f'url.{root.as_uri()}.insteadOf')
+    monkeypatch.setenv('GIT_CONFIG_VALUE_0', 'https://github.com/OpenHands/skills.git')
+    monkeypatch.setenv('GITHUB_TOKEN', 'ghp_secret123')
+    cache = tmp_path / 'cache'
+
+    installed = Path(mod.fetch_skill('OpenHands/skills/skills/docker', str(tmp_path / 'ws'),
+                                     cache_dir=str(cache)))
+
+    assert (installed / 'scripts' / 'run.sh').exists()
+    config = (cache / 'OpenHands' / 'skills.git' / 'config').read_text()
+    assert 'https://github.com/OpenHands/skills.git' in config
+    assert 'ghp_secret123' not in config
+    env = mod._git_env()
+    assert env['GIT_CONFIG_COUNT'] == '2'
+    assert env['GIT_CONFIG_KEY_1'] == 'http.https://github.com/.extraHeader'
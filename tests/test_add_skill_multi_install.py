@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from conftest import git, load_fetch_skill_module
+
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch, make_upstream):
+    root = tmp_path / 'upstream'
+    for name in ('docker', 'npm', 'unused'):
+        (root / 'skills' / name).mkdir(parents=True)
+        (root / 'skills' / name / 'SKILL.md').write_text(f'---\nname: {name}\n---\n')
+    mod, _ = make_upstream(root)
+
+    calls = []
+    real_run = subprocess.run
+
+    def run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, 'run', run)
+    return mod, calls
+
+
+def test_one_clone_per_repository(upstream, tmp_path):
+    mod, calls = upstream
+    urls = ['OpenHands/skills/skills/docker', 'OpenHands/skills/tree/main/skills/npm']
+
+    installed = mod.fetch_skills(urls, str(tmp_path / 'ws'))
+
+    skills_dir = tmp_path / 'ws' / '.agents' / 'skills'
+    assert installed == [str(skills_dir / 'docker'), str(skills_dir / 'npm')]
+    assert (skills_dir / 'npm' / 'SKILL.md').read_text() == '---\nname: npm\n---\n'
+    assert not (skills_dir / 'unused').exists()
+    assert len([c for c in calls if 'clone' in c]) == 1
+    sparse_sets = [c for c in calls if 'sparse-checkout' in c and 'set' in c]
+    assert len(sparse_sets) == 1 and sparse_sets[0][-2:] == ['skills/docker', 'skills/npm']
+
+
+def test_branches_are_separate_groups(upstream, tmp_path):
+    mod, calls = upstream
+    git('-C', str(tmp_path / 'upstream'), 'branch', 'dev')
+
+    mod.fetch_skills(['o/r/tree/main/skills/docker', 'o/r/tree/dev/skills/npm'],
+                     str(tmp_path / 'ws'), cache_dir=str(tmp_path / 'cache'))
+
+    fetches = [c for c in calls if 'fetch' in c and '--stdin' not in c]
+    assert sorted(c[-1] for c in fetches) == ['+refs/heads/dev:refs/heads/dev', '+refs/heads/main:refs/heads/main']
+    assert len([c for c in calls if 'clone' in c]) == 1
+
+
+def test_duplicate_skill_names_rejected(upstream, tmp_path):
+    mod, _ = upstream
+    with pytest.raises(SystemExit):
+        mod.fetch_skills(['o/r/skills/docker', 'o/other/skills/docker'], str(tmp_path / 'ws'))
+
+
+def test_load_manifest_formats(tmp_path):
+    mod = load_fetch_skill_module()
+    text = tmp_path / 'skills.txt'
+    text.write_text('# bootstrap\nOpenHands/skills/skills/docker\n\nOpenHands/skills/skills/npm  # node\n')
+    as_json = tmp_path / 'skills.json'
+    as_json.write_text(json.dumps({'skills': ['OpenHands/skills/skills/docker']}))
+
+    assert mod.load_manifest(str(text)) == ['OpenHands/skills/skills/docker', 'OpenHands/skills/skills/npm']
+    assert mod.load_manifest(str(as_json)) == ['OpenHands/skills/skills/docker']
+
+
+def test_cli_accepts_urls_and_manifest(upstream, tmp_path, monkeypatch):
+    mod, _ = upstream
+    manifest = tmp_path / 'skills.txt'
+    manifest.write_text('OpenHands/skills/skills/npm\n')
+    monkeypatch.setattr(sys, 'argv', ['fetch_skill.py', 'OpenHands/skills/skills/docker',
+                                      str(tmp_path / 'ws'), '--manifest', str(manifest)])
+
+    mod.main()
+
+    assert sorted(p.name for p in (tmp_path / 'ws' / '.agents' / 'skills').iterdir()) == ['docker', 'npm']
+
+
+def test_cli_accepts_options_between_url_and_workspace(upstream, tmp_path, monkeypatch):
+    mod, _ = upstream
+    monkeypatch.setattr(sys, 'argv', ['fetch_skill.py', 'OpenHands/skills/skills/docker', '--force',
+                                      'OpenHands/skills/skills/npm', '-j', '2', str(tmp_path / 'ws')])
+
+    mod.main()
+
+    assert sorted(p.name for p in (tmp_path / 'ws' / '.agents' / 'skills').iterdir()) == ['docker', 'npm']
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from conftest import commit_repo, load_fetch_skill_module
+
+
+def _make_repo(root: Path, skills: list[str]) -> Path:
+    for name in skills:
+        (root / 'skills' / name).mkdir(parents=True)
+        (root / 'skills' / name / 'SKILL.md').write_text(f'---\nname: {name}\n---\n')
+    return commit_repo(root)
+
+
+@pytest.fixture
+def repos(tmp_path, monkeypatch):
+    mod = load_fetch_skill_module()
+    roots = {name: _make_repo(tmp_path / name, [f'{name}-skill']) for name in ('alpha', 'beta', 'gamma')}
+
+    def build_repo_url(owner, repo):
+        if repo not in roots:
+            return (tmp_path / 'missing').as_uri()
+        return roots[repo].as_uri()
+
+    monkeypatch.setattr(mod, 'build_repo_url', build_repo_url)
+    return mod
+
+
+def test_repositories_are_fetched_concurrently(repos, tmp_path, monkeypatch):
+    mod = repos
+    active, peak = 0, 0
+    guard = threading.Lock()
+    real_sparse_clone = mod._sparse_clone
+
+    def slow_sparse_clone(*args):
+        nonlocal active, peak
+        with guard:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.2)
+        try:
+            real_sparse_clone(*args)
+        finally:
+            with guard:
+                active -= 1
+
+    monkeypatch.setattr(mod, '_sparse_clone', slow_sparse_clone)
+    urls = [f'o/{name}/skills/{name}-skill' for name in ('alpha', 'beta', 'gamma')]
+
+    installed = mod.fetch_skills(urls, str(tmp_path / 'ws'), max_workers=3)
+
+    assert [Path(p).name for p in installed] == ['alpha-skill', 'beta-skill', 'gamma-skill']
+    assert peak == 3
+
+
+def test_errors_are_aggregated_and_other_repos_still_install(repos, tmp_path):
+    mod = repos
+    urls = ['o/alpha/skills/alpha-skill', 'o/nowhere/skills/x', 'o/beta/skills/not-there']
+
+    with pytest.raises(mod.SkillFetchError) as excinfo:
+        mod.fetch_skills(urls, str(tmp_path / 'ws'))
+
+    sources = sorted(source for source, _ in excinfo.value.errors)
+    assert sources == ['o/beta@main', 'o/nowhere@main']
+    assert (tmp_path / 'ws' / '.agents' / 'skills' / 'alpha-skill' / 'SKILL.md').exists()
+
+
+def test_cli_reports_every_failure(repos, tmp_path, monkeypatch, capsys):
+    mod = repos
+    monkeypatch.setattr(sys, 'argv', ['fetch_skill.py', 'o/nowhere/skills/x', 'o/beta/skills/nope',
+                                      str(tmp_path / 'ws')])
+
+    with pytest.raises(SystemExit):
+        mod.main()
+
+    out = capsys.readouterr().out
+    assert '2 source(s) failed' in out
+    assert 'o/nowhere@main' in out and 'o/beta@main' in out
+
+
+def test_path_lock_is_shared_per_destination(tmp_path):
+    mod = load_fetch_skill_module()
+    assert mod._path_lock(tmp_path / 'a') is mod._path_lock(tmp_path / 'a')
+    assert mod._path_lock(tmp_path / 'a') is not mod._path_lock(tmp_path / 'b')
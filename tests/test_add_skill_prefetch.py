@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import git, load_fetch_skill_module
+
+
+@pytest.fixture
+def upstream(tmp_path, make_upstream):
+    root = tmp_path / 'upstream'
+    for name in ('npm', 'pdf'):
+        skill = root / 'skills' / name
+        skill.mkdir(parents=True)
+        (skill / 'SKILL.md').write_text(f'# {name}\n')
+    return make_upstream(root)
+
+
+def _missing_objects(mirror: Path) -> list[str]:
+    out = git('-C', str(mirror), 'rev-list', '--objects', '--missing=print', 'main')
+    return [line for line in out.splitlines() if line.startswith('?')]
+
+
+def _forbid_network(monkeypatch) -> None:
+    real_run = subprocess.run
+
+    def run(cmd, *args, **kwargs):
+        assert not {'clone', 'fetch'} & set(cmd), f'network access: {cmd}'
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, 'run', run)
+
+
+@pytest.mark.parametrize('source, expected', [
+    ('OpenHands/skills', ('OpenHands', 'skills', 'main', '')),
+    ('OpenHands/skills@dev', ('OpenHands', 'skills', 'dev', '')),
+    ('https://github.com/OpenHands/skills.git', ('OpenHands', 'skills', 'main', '')),
+    ('OpenHands/skills/skills/npm', ('OpenHands', 'skills', 'main', 'skills/npm')),
+])
+def test_parse_source(source, expected):
+    mod = load_fetch_skill_module()
+    assert mod.parse_source(source) == expected
+
+
+def test_prefetch_fills_mirror_with_skill_blobs(upstream, tmp_path):
+    mod, _ = upstream
+    cache = tmp_path / 'cache'
+
+    assert mod.prefetch(['o/r/skills/npm'], str(cache), once=True) == []
+
+    mirror = mod.mirror_path(str(cache), 'o', 'r')
+    missing = _missing_objects(mirror)
+    npm_blob = git('-C', str(mirror), 'rev-parse', 'main:skills/npm/SKILL.md').strip()
+    assert f'?{npm_blob}' not in missing
+    # Only the requested skill is downloaded
+    assert len(missing) == 1
+
+
+def test_prefetch_whole_repository(upstream, tmp_path):
+    mod, _ = upstream
+    cache = tmp_path / 'cache'
+
+    assert mod.prefetch(['o/r'], str(cache), once=True) == []
+
+    assert _missing_objects(mod.mirror_path(str(cache), 'o', 'r')) == []
+
+
+def test_prefetch_whole_repository_skips_history(upstream, tmp_path):
+    mod, root = upstream
+    old_blob = git('-C', str(root), 'rev-parse', 'main:skills/npm/SKILL.md').strip()
+    (root / 'skills' / 'npm' / 'SKILL.md').write_text('# npm v2\n')
+    git('-C', str(root), 'commit', '-qam', 'v2')
+    cache = tmp_path / 'cache'
+
+    assert mod.prefetch(['o/r'], str(cache), once=True) == []
+
+    mirror = mod.mirror_path(str(cache), 'o', 'r')
+    # Only blobs of the tip tree are downloaded, not those of older commits
+    assert _missing_objects(mirror) == [f'?{old_blob}']
+    tip = git('-C', str(mirror), 'ls-tree', '-r', '--format=%(objectname)', 'main').split()
+    present = git('-C', str(mirror), 'cat-file', '--batch-check', input='\n'.join(tip) + '\n')
+    assert 'missing' not in present
+
+
+def test_prefetch_reports_failing_sources(upstream, tmp_path):
+    mod, _ = upstream
+
+    errors = mod.prefetch(['o/r/skills/missing', 'o/r/skills/npm'], str(tmp_path / 'cache'), once=True)
+
+    assert [source for source, _ in errors] == ['o/r@main']
+
+
+def test_offline_install_served_from_prefetched_mirror(upstream, tmp_path, monkeypatch):
+    mod, _ = upstream
+    cache = str(tmp_path / 'cache')
+    mod.prefetch(['o/r/skills/npm'], cache, once=True)
+    _forbid_network(monkeypatch)
+
+    installed = mod.fetch_skill('o/r/skills/npm', str(tmp_path / 'ws'), cache_dir=cache, offline=True)
+
+    assert (Path(installed) / 'SKILL.md').read_text() == '# npm\n'
+
+
+def test_offline_install_fails_for_unfetched_content(upstream, tmp_path, monkeypatch):
+    mod, _ = upstream
+    cache = str(tmp_path / 'cache')
+    mod.prefetch(['o/r/skills/npm'], cache, once=True)
+    _forbid_network(monkeypatch)
+
+    with pytest.raises(mod.SkillFetchError, match='not prefetched'):
+        mod.fetch_skill('o/r/skills/pdf', str(tmp_path / 'ws'), cache_dir=cache, offline=True)
+    with pytest.raises(mod.SkillFetchError):
+        mod.fetch_skill('o/other/skills/npm', str(tmp_path / 'ws'), cache_dir=cache, offline=True)
+
+
+def test_offline_requires_cache_dir(upstream, tmp_path):
+    mod, _ = upstream
+
+    with pytest.raises(ValueError):
+        mod.fetch_skill('o/r/skills/npm', str(tmp_path / 'ws'), offline=True)
+
+
+def test_cli_prefetch_once(upstream, tmp_path, monkeypatch):
+    mod, _ = upstream
+    cache = tmp_path / 'cache'
+    sources = tmp_path / 'sources.txt'
+    sources.write_text('o/r/skills/pdf  # docs\n')
+    monkeypatch.setattr(sys, 'argv', ['fetch_skill.py', '--prefetch', '--once', 'o/r/skills/npm',
+                                      '--sources', str(sources), '--cache-dir', str(cache)])
+
+    with pytest.raises(SystemExit) as exc:
+        mod.main()
+
+    assert exc.value.code == 0
+    assert _missing_objects(mod.mirror_path(str(cache), 'o', 'r')) == []
+
+
+def test_mirror_fetches_hold_cross_process_lock(upstream, tmp_path, monkeypatch):
+    fcntl = pytest.importorskip('fcntl')
+    mod, _ = upstream
+    cache = tmp_path / 'cache'
+    mod.prefetch(['o/r'], str(cache), once=True)
+    lock_path = mod.mirror_path(str(cache), 'o', 'r') / mod.MIRROR_LOCK
+    real_git = mod._git
+    fetches = []
+
+    def checked_git(*args, **kwargs):
+        if 'fetch' in args:
+            # flock conflicts between open files even within one process
+            with open(lock_path) as f:
+                with pytest.raises(BlockingIOError):
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fetches.append(args)
+        return real_git(*args, **kwargs)
+
+    monkeypatch.setattr(mod, '_git', checked_git)
+    assert mod.prefetch(['o/r'], str(cache), once=True) == []
+    assert fetches
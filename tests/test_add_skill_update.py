@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import git
+
+
+@pytest.fixture
+def upstream(tmp_path, make_upstream):
+    root = tmp_path / 'upstream'
+    skill = root / 'skills' / 'theme-factory'
+    (skill / 'scripts').mkdir(parents=True)
+    (skill / 'SKILL.md').write_text('v1\n')
+    (skill / 'theme-showcase.pdf').write_bytes(os.urandom(256 * 1024))
+    (skill / 'scripts' / 'build.sh').write_text('#!/bin/sh\n')
+    (skill / 'scripts' / 'build.sh').chmod(0o755)
+    (skill / 'old.txt').write_text('going away\n')
+    return make_upstream(root, 'v1')
+
+
+def _advance(root: Path) -> None:
+    skill = root / 'skills' / 'theme-factory'
+    (skill / 'SKILL.md').write_text('v2\n')
+    (skill / 'old.txt').unlink()
+    (skill / 'new.txt').write_text('added\n')
+    git('-C', str(root), 'add', '-A')
+    git('-C', str(root), 'commit', '-qm', 'v2')
+
+
+def _spy_blob_fetches(monkeypatch) -> list[list[str]]:
+    fetched = []
+    real_run = subprocess.run
+
+    def run(cmd, *args, **kwargs):
+        if '--stdin' in cmd:
+            fetched.append(kwargs['input'].split())
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, 'run', run)
+    return fetched
+
+
+@pytest.mark.parametrize('use_mirror', [False, True])
+def test_update_transfers_only_changed_files(upstream, tmp_path, monkeypatch, use_mirror):
+    mod, root = upstream
+    cache = str(tmp_path / 'cache') if use_mirror else None
+    ws = tmp_path / 'ws'
+    installed = Path(mod.fetch_skill('o/r/skills/theme-factory', str(ws), cache_dir=cache))
+    pdf_inode = (installed / 'theme-showcase.pdf').stat().st_ino
+    _advance(root)
+    fetched = _spy_blob_fetches(monkeypatch)
+
+    assert mod.update_skills(str(ws), cache_dir=cache) == [str(installed)]
+
+    assert (installed / 'SKILL.md').read_text() == 'v2\n'
+    assert (installed / 'new.txt').read_text() == 'added\n'
+    assert not (installed / 'old.txt').exists()
+    assert os.access(installed / 'scripts' / 'build.sh', os.X_OK)
+    assert (installed / 'theme-showcase.pdf').stat().st_ino == pdf_inode
+    assert [len(batch) for batch in fetched] == [2]
+    assert not [p for p in installed.parent.iterdir() if p.name.startswith('.')]
+
+    lock = json.loads((ws / '.agents' / 'skills.lock').read_text())
+    assert lock['skills']['theme-factory']['commit'] == git('-C', str(root), 'rev-parse', 'main').strip()
+    assert lock['skills']['theme-factory']['tree'] == mod.git_tree_hash(installed)
+
+
+def test_update_when_current_is_a_noop(upstream, tmp_path, monkeypatch):
+    mod, _ = upstream
+    mod.fetch_skill('o/r/skills/theme-factory', str(tmp_path / 'ws'))
+    fetched = _spy_blob_fetches(monkeypatch)
+
+    assert mod.update_skills(str(tmp_path / 'ws')) == []
+    assert fetched == []
+
+
+def test_update_with_store_keeps_old_version_intact(upstream, tmp_path):
+    mod, root = upstream
+    store = tmp_path / 'store'
+    old_tree = git('-C', str(root), 'rev-parse', 'main:skills/theme-factory').strip()
+    mod.fetch_skill('o/r/skills/theme-factory', str(tmp_path / 'ws'), store_dir=str(store))
+    _advance(root)
+
+    mod.update_skills(str(tmp_path / 'ws'), store_dir=str(store))
+
+    new_tree = git('-C', str(root), 'rev-parse', 'main:skills/theme-factory').strip()
+    assert (store / new_tree[:2] / new_tree / 'new.txt').exists()
+    assert (store / old_tree[:2] / old_tree / 'SKILL.md').read_text() == 'v1\n'
+    assert mod.git_tree_hash(store / old_tree[:2] / old_tree) == old_tree
+
+
+def test_unknown_skill_rejected(upstream, tmp_path):
+    mod, _ = upstream
+    with pytest.raises(mod.SkillFetchError):
+        mod.update_skills(str(tmp_path / 'ws'), ['nope'])
+
+
+def test_cli_update(upstream, tmp_path, monkeypatch):
+    mod, root = upstream
+    mod.fetch_skill('o/r/skills/theme-factory', str(tmp_path / 'ws'))
+    _advance(root)
+    monkeypatch.setattr(sys, 'argv', ['fetch_skill.py', '--update', str(tmp_path / 'ws')])
+
+    mod.main()
+
+    assert (tmp_path / 'ws' / '.agents' / 'skills' / 'theme-factory' / 'SKILL.md').read_text() == 'v2\n'
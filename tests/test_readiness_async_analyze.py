@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+
+def _load_analyze_repo_module():
+    repo_root = Path(__file__).resolve().parents[1]
+    module_path = repo_root / 'skills' / 'readiness-report' / 'scripts' / 'analyze_repo.py'
+    spec = importlib.util.spec_from_file_location('analyze_repo', module_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _make_repo(root: Path) -> Path:
+    (root / '.github' / 'workflows').mkdir(parents=True)
+    (root / '.github' / 'workflows' / 'ci.yml').write_text('run: pytest --cov\nsecrets.TOKEN\n')
+    (root / 'tests').mkdir()
+    (root / 'tests' / 'test_app.py').write_text('def test_ok():\n    assert True\n')
+    (root / 'README.md').write_text('Run `pip install -e .` then `pytest`.\n')
+    (root / 'pyproject.toml').write_text('[tool.ruff]\n[tool.mypy]\nstrict = true\n')
+    (root / '.gitignore').write_text('__pycache__/\n.env\n')
+    return root
+
+
+def test_analyze_async_matches_sync_analysis(tmp_path: Path):
+    analyze_repo = _load_analyze_repo_module()
+    repo = _make_repo(tmp_path / 'repo')
+
+    sync_result = analyze_repo.RepoAnalyzer(str(repo)).analyze()
+    async_result = asyncio.run(analyze_repo.RepoAnalyzer(str(repo)).analyze_async())
+
+    # Probe output (git log, gh auth) is environment dependent but identical
+    # between the two runs, so the whole result must match.
+    assert asdict(async_result) == asdict(sync_result)
+
+
+def test_analyze_async_runs_many_analyses_concurrently(tmp_path: Path):
+    analyze_repo = _load_analyze_repo_module()
+    repos = [_make_repo(tmp_path / f'repo{i}') for i in range(4)]
+
+    async def run_all():
+        return await asyncio.gather(
+            *(analyze_repo.RepoAnalyzer(str(r)).analyze_async() for r in repos)
+        )
+
+    results = asyncio.run(run_all())
+
+    assert [r.repo_name for r in results] == [r.name for r in repos]
+    assert all(len(r.pillars) == 9 for r in results)
+
+
+def test_analyze_async_can_be_cancelled(tmp_path: Path):
+    analyze_repo = _load_analyze_repo_module()
+    repo = _make_repo(tmp_path / 'repo')
+    analyzer = analyze_repo.RepoAnalyzer(str(repo))
+
+    async def run_and_cancel():
+        task = asyncio.create_task(analyzer.analyze_async())
+        await asyncio.sleep(0)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(run_and_cancel())
+    assert analyzer.result.pillars == {}
+
+
+@pytest.mark.parametrize('cancel', [False, True])
+def test_run_command_async_reaps_killed_process(tmp_path: Path, monkeypatch, cancel):
+    analyze_repo = _load_analyze_repo_module()
+    analyzer = analyze_repo.RepoAnalyzer(str(_make_repo(tmp_path / 'repo')))
+    procs = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def spy_exec(*args, **kwargs):
+        procs.append(await real_exec(*args, **kwargs))
+        return procs[-1]
+
+    monkeypatch.setattr(asyncio, 'create_subprocess_exec', spy_exec)
+
+    async def run():
+        task = asyncio.create_task(analyzer._run_command_async(['sleep', '30'], timeout=0.2))
+        if cancel:
+            await asyncio.sleep(0.1)
+            task.cancel()
+        return await task
+
+    if cancel:
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(run())
+    else:
+        assert asyncio.run(run())[0] == -1
+    assert procs[0].returncode is not None
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import copy
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def _load_generate_report_module():
+    repo_root = Path(__file__).resolve().parents[1]
+    module_path = repo_root / 'skills' / 'readiness-report' / 'scripts' / 'generate_report.py'
+    spec = importlib.util.spec_from_file_location('generate_report', module_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _criterion(crit_id: str, level: int, status: str, reason: str) -> dict:
+    return {'id': crit_id, 'pillar': 'Testing', 'level': level, 'status': status,
+            'score': '', 'reason': reason}
+
+
+BASELINE = {
+    'repo_name': 'svc',
+    'pass_rate': 50.0,
+    'achieved_level': 0,
+    'level_scores': {'1': 50.0, '2': 0.0, '3': 100.0, '4': 100.0, '5': 100.0},
+    'pillars': {
+        'Testing': {
+            'criteria': [
+                _criterion('unit_tests_exist', 1, 'fail', 'No unit tests found'),
+                _criterion('unit_tests_runnable', 1, 'pass', 'Test commands documented'),
+                _criterion('test_isolation', 2, 'fail', 'No test isolation'),
+            ],
+        },
+    },
+}
+
+
+def test_diff_reports_only_changed_criteria():
+    generate_report = _load_generate_report_module()
+    current = copy.deepcopy(BASELINE)
+    current.update(pass_rate=100.0, achieved_level=1)
+    current['level_scores']['1'] = 100.0
+    criteria = current['pillars']['Testing']['criteria']
+    criteria[0].update(status='pass', reason='Unit tests found')
+    criteria[2].update(status='skip', reason='Not applicable')
+
+    diff = generate_report.diff_analyses(BASELINE, current)
+
+    assert [e['id'] for e in diff['newly_passing']] == ['unit_tests_exist']
+    assert diff['newly_failing'] == []
+    assert [(e['id'], e['before'], e['after']) for e in diff['skip_changes']] == [
+        ('test_isolation', 'fail', 'skip')
+    ]
+    assert diff['achieved_level'] == {'before': 0, 'after': 1}
+    assert diff['level_scores'] == {1: {'before': 50.0, 'after': 100.0, 'delta': 50.0}}
+
+    report = generate_report.generate_diff_report(diff)
+    assert '**Level**: Not yet L1 → L1' in report
+    assert '- `unit_tests_exist` (L1, Testing): Unit tests found' in report
+    assert 'unit_tests_runnable' not in report
+
+
+def test_diff_of_identical_analyses_is_empty():
+    generate_report = _load_generate_report_module()
+
+    report = generate_report.generate_diff_report(
+        generate_report.diff_analyses(BASELINE, copy.deepcopy(BASELINE))
+    )
+
+    assert report.endswith('No criterion changes.')
+
+
+def test_brief_diff_labels_each_count():
+    generate_report = _load_generate_report_module()
+    current = copy.deepcopy(BASELINE)
+    criteria = current['pillars']['Testing']['criteria']
+    criteria[0].update(status='pass', reason='Unit tests found')
+    criteria[1].update(status='fail', reason='No test commands')
+    criteria.append(_criterion('coverage', 2, 'pass', 'Coverage configured'))
+    del criteria[2]
+
+    report = generate_report.generate_diff_report(
+        generate_report.diff_analyses(BASELINE, current), brief=True
+    )
+
+    assert report.splitlines()[-1] == (
+        '1 newly failing, 1 newly passing, 1 new criteria, 1 removed criteria'
+    )
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+
+def _load_generate_report_module():
+    repo_root = Path(__file__).resolve().parents[1]
+    module_path = repo_root / 'skills' / 'readiness-report' / 'scripts' / 'generate_report.py'
+    spec = importlib.util.spec_from_file_location('generate_report', module_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _analysis(name: str, level: int, testing_pct: int, unit_tests: str) -> dict:
+    return {
+        'repo_name': name,
+        'pass_rate': float(testing_pct),
+        'achieved_level': level,
+        'pillars': {
+            'Testing': {
+                'name': 'Testing',
+                'passed': 1 if unit_tests == 'pass' else 0,
+                'total': 1,
+                'percentage': testing_pct,
+                'criteria': [
+                    {'id': 'unit_tests_exist', 'level': 1, 'status': unit_tests},
+                    {'id': 'flaky_test_detection', 'level': 4, 'status': 'skip'},
+                ],
+            },
+        },
+    }
+
+
+def test_fleet_aggregates_streamed_sources(tmp_path: Path):
+    generate_report = _load_generate_report_module()
+    analyses_dir = tmp_path / 'analyses'
+    analyses_dir.mkdir()
+    (analyses_dir / 'a.json').write_text(json.dumps(_analysis('a', 1, 100, 'pass')))
+    (analyses_dir / 'broken.json').write_text('{not json')
+    jsonl = tmp_path / 'more.jsonl'
+    jsonl.write_text('\n'.join(
+        json.dumps(_analysis(f'r{i}', 0, 0, 'fail')) for i in range(3)
+    ) + '\n')
+
+    fleet = generate_report.FleetAggregator()
+    errors = []
+    for data in generate_report.iter_analyses([str(analyses_dir), str(jsonl)], errors):
+        fleet.add(data)
+    summary = fleet.summary()
+
+    assert fleet.repo_count == 4
+    assert len(errors) == 1 and 'broken.json' in errors[0]
+    assert summary['level_distribution'][0] == 3
+    assert summary['level_distribution'][1] == 1
+    assert summary['criteria']['unit_tests_exist']['pass_rate'] == 25.0
+    assert summary['criteria']['flaky_test_detection']['skip'] == 4
+    assert summary['pillar_percentiles']['Testing'] == {10: 0, 25: 0, 50: 0, 75: 0, 90: 100}
+
+    report = generate_report.generate_fleet_report(fleet)
+    assert '**Repositories**: 4' in report
+    assert '| `unit_tests_exist` | L1 | Testing | 25.0% | 1 | 3 | 0 |' in report
+
+
+def test_fleet_skips_json_that_is_not_an_object(tmp_path: Path):
+    mod = _load_generate_report_module()
+    (tmp_path / 'a.json').write_text(json.dumps(_analysis('a', 2, 80, 'pass')))
+    (tmp_path / 'list.json').write_text('[1, 2]')
+    (tmp_path / 'many.jsonl').write_text('42\n' + json.dumps(_analysis('b', 1, 40, 'fail')) + '\n')
+
+    errors: list[str] = []
+    fleet = mod.FleetAggregator()
+    for data in mod.iter_analyses([str(tmp_path)], errors):
+        fleet.add(data)
+
+    assert fleet.repo_count == 2
+    assert sorted(Path(e.split(':')[0]).name for e in errors) == ['list.json', 'many.jsonl']
+    assert all('expected a JSON object' in e for e in errors)
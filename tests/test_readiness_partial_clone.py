@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+
+def _load_analyze_repo_module():
+    repo_root = Path(__file__).resolve().parents[1]
+    module_path = repo_root / 'skills' / 'readiness-report' / 'scripts' / 'analyze_repo.py'
+    spec = importlib.util.spec_from_file_location('analyze_repo', module_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _git(*args: str, cwd: Path) -> str:
+    return subprocess.run(
+        ['git', *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def _make_origin(root: Path) -> Path:
+    root.mkdir()
+    _git('init', '-q', '-b', 'main', cwd=root)
+    _git('config', 'uploadpack.allowFilter', 'true', cwd=root)
+    (root / '.github' / 'workflows').mkdir(parents=True)
+    (root / '.github' / 'workflows' / 'ci.yml').write_text('run: pytest --cov\n')
+    (root / 'src' / 'app').mkdir(parents=True)
+    (root / 'src' / 'app' / 'server.py').write_text('import logging\n')
+    (root / 'tests').mkdir()
+    (root / 'tests' / 'test_app.py').write_text('def test_ok():\n    assert True\n')
+    (root / 'docs').mkdir()
+    (root / 'docs' / 'guide.md').write_text('# Guide\n' * 1000)
+    (root / 'README.md').write_text('Run `pip install -e .` then `pytest`.\n')
+    (root / '.gitignore').write_text('__pycache__/\n')
+    _git('add', '.', cwd=root)
+    _git('-c', 'user.name=t', '-c', 'user.email=t@example.com',
+         'commit', '-q', '-m', 'init', cwd=root)
+    return root
+
+
+def _statuses(result) -> dict[str, str]:
+    return {
+        c.id: c.status.value
+        for pillar in result.pillars.values()
+        for c in pillar.criteria
+    }
+
+
+def test_glob_to_regex_follows_pathlib_semantics():
+    analyze_repo = _load_analyze_repo_module()
+    regex = analyze_repo._glob_to_regex
+
+    assert regex('**/*.py').match('a.py')
+    assert regex('**/*.py').match('src/app/a.py')
+    assert not regex('*.py').match('src/a.py')
+    assert regex('tests/**').match('tests')
+    assert regex('tests/**').match('tests/unit/test_a.py')
+    assert not regex('tests/**').match('testsuite')
+    assert regex('.github/workflows/*.yml').match('.github/workflows/ci.yml')
+
+
+def test_partial_clone_analysis_matches_working_tree(tmp_path: Path):
+    analyze_repo = _load_analyze_repo_module()
+    origin = _make_origin(tmp_path / 'origin')
+    clone = analyze_repo.clone_partial(origin.as_uri(), tmp_path / 'origin.git')
+
+    worktree_result = analyze_repo.RepoAnalyzer(str(origin)).analyze()
+    bare_analyzer = analyze_repo.RepoAnalyzer(str(clone))
+    bare_result = bare_analyzer.analyze()
+
+    assert isinstance(bare_analyzer.source, analyze_repo.GitTreeSource)
+    assert bare_result.repo_name == 'origin'
+    assert bare_result.languages == worktree_result.languages
+    assert _statuses(bare_result) == _statuses(worktree_result)
+
+    # Only blobs read by content checks were fetched; docs/guide.md is
+    # checked for existence only and must still be missing locally.
+    local_objects = _git('cat-file', '--batch-all-objects', '--batch-check', cwd=clone)
+    guide_blob = _git('rev-parse', 'HEAD:docs/guide.md', cwd=origin).strip()
+    readme_blob = _git('rev-parse', 'HEAD:README.md', cwd=origin).strip()
+    assert readme_blob in local_objects
+    assert guide_blob not in local_objects
+
+
+def test_no_checkout_clone_is_analyzed_from_its_git_tree(tmp_path: Path):
+    analyze_repo = _load_analyze_repo_module()
+    origin = _make_origin(tmp_path / 'origin')
+    clone = tmp_path / 'clone'
+    _git('clone', '-q', '--no-checkout', '--filter=blob:none', origin.as_uri(), str(clone),
+         cwd=tmp_path)
+
+    worktree_result = analyze_repo.RepoAnalyzer(str(origin)).analyze()
+    clone_analyzer = analyze_repo.RepoAnalyzer(str(clone))
+    clone_result = clone_analyzer.analyze()
+
+    assert isinstance(clone_analyzer.source, analyze_repo.GitTreeSource)
+    assert clone_result.repo_name == 'clone'
+    assert clone_result.languages == worktree_result.languages
+    assert _statuses(clone_result) == _statuses(worktree_result)
+
+
+def test_analyze_async_lists_the_tree_off_the_event_loop(tmp_path: Path, monkeypatch):
+    analyze_repo = _load_analyze_repo_module()
+    origin = _make_origin(tmp_path / 'origin')
+    clone = analyze_repo.clone_partial(origin.as_uri(), tmp_path / 'origin.git')
+    listing_threads = []
+    real_run = subprocess.run
+
+    def recording_run(cmd, *args, **kwargs):
+        if 'ls-tree' in cmd:
+            listing_threads.append(threading.current_thread())
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(analyze_repo.subprocess, 'run', recording_run)
+    analyzer = analyze_repo.RepoAnalyzer(str(clone))
+    assert listing_threads == []
+
+    result = asyncio.run(analyzer.analyze_async())
+
+    assert len(listing_threads) == 1
+    assert listing_threads[0] is not threading.main_thread()
+    assert result.languages == ['Python']
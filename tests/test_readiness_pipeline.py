@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / 'skills' / 'readiness-report' / 'scripts'
+
+
+def _load_module(name: str):
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f'{name}.py')
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _make_repo(root: Path) -> Path:
+    (root / 'src').mkdir(parents=True)
+    (root / 'src' / 'app.py').write_text('print("hi")\n')
+    (root / 'tests').mkdir()
+    (root / 'tests' / 'test_app.py').write_text('def test_ok():\n    assert True\n')
+    (root / 'README.md').write_text('# app\n\nRun `pytest` to test.\n')
+    (root / 'pyproject.toml').write_text('[project]\nname = "app"\n')
+    subprocess.run(['git', 'init', '-q', str(root)], check=True)
+    return root
+
+
+def test_analyze_and_report_matches_json_round_trip(tmp_path):
+    analyze_repo = _load_module('analyze_repo')
+    generate_report = _load_module('generate_report')
+    repo = _make_repo(tmp_path / 'app')
+
+    data, report = generate_report.analyze_and_report(str(repo))
+
+    result = analyze_repo.RepoAnalyzer(str(repo)).analyze()
+    round_trip = json.loads(json.dumps(analyze_repo.analysis_to_dict(result)))
+    assert json.loads(json.dumps(data)) == round_trip
+    assert report == generate_report.render_report(round_trip)
+    assert generate_report.render_report(result, 'brief') == generate_report.render_report(round_trip, 'brief')
+    assert json.loads(generate_report.render_report(result, 'json')) == round_trip
+
+
+def test_analyze_and_report_async(tmp_path):
+    generate_report = _load_module('generate_report')
+    repo = _make_repo(tmp_path / 'app')
+
+    data, report = asyncio.run(generate_report.analyze_and_report_async(str(repo), 'brief'))
+
+    assert data['repo_name'] == 'app'
+    assert report == generate_report.render_report(data, 'brief')
+
+
+def test_main_accepts_repo_path(tmp_path, monkeypatch):
+    generate_report = _load_module('generate_report')
+    repo = _make_repo(tmp_path / 'app')
+    out = tmp_path / 'report.md'
+    monkeypatch.setattr(sys, 'argv', ['generate_report.py', '--repo-path', str(repo), '-o', str(out)])
+
+    assert generate_report.main() == 0
+    assert out.read_text().startswith('# Agent Readiness Report: app')
+
+
+def test_in_process_html_loaded_by_path(tmp_path, monkeypatch):
+    # Loaded by path from elsewhere: the scripts directory is not on sys.path
+    monkeypatch.setattr(sys, 'path', [p for p in sys.path if p != str(SCRIPTS_DIR)])
+    monkeypatch.delitem(sys.modules, 'analyze_repo', raising=False)
+    spec = importlib.util.spec_from_file_location('report_by_path', SCRIPTS_DIR / 'generate_report.py')
+    generate_report = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generate_report)
+    repo = _make_repo(tmp_path / 'app')
+
+    data, report = generate_report.analyze_and_report(str(repo), 'html')
+
+    assert 'CriterionStatus' not in report
+    assert '<td class="pass">' in report
+    assert report == generate_report.render_report(json.loads(json.dumps(data)), 'html')
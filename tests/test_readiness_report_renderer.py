@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _load_generate_report_module():
+    repo_root = Path(__file__).resolve().parents[1]
+    module_path = repo_root / 'skills' / 'readiness-report' / 'scripts' / 'generate_report.py'
+    spec = importlib.util.spec_from_file_location('generate_report', module_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+ANALYSIS = {
+    'repo_name': 'svc',
+    'repo_type': 'application',
+    'languages': ['Python'],
+    'pass_rate': 50.0,
+    'total_passed': 1,
+    'total_criteria': 2,
+    'achieved_level': 0,
+    'level_scores': {'1': 50.0, '2': 100.0, '3': 100.0, '4': 100.0, '5': 100.0},
+    'pillars': {
+        'Testing': {
+            'passed': 1,
+            'total': 2,
+            'percentage': 50,
+            'criteria': [
+                {'id': 'unit_tests_exist', 'level': 1, 'status': 'pass',
+                 'score': '1/1', 'reason': 'Unit tests found'},
+                {'id': 'unit_tests_runnable', 'level': 1, 'status': 'fail',
+                 'score': '0/1', 'reason': 'No <script> & test docs'},
+            ],
+        },
+    },
+}
+
+
+def test_markdown_and_brief_render_from_shared_model():
+    generate_report = _load_generate_report_module()
+
+    markdown = generate_report.generate_markdown_report(ANALYSIS)
+    brief = generate_report.generate_brief_report(ANALYSIS)
+
+    assert markdown.startswith('# Agent Readiness Report: svc\n\n**Languages**: Python  \n')
+    assert '**Achieved Level**: **Not yet L1** (need 80% at L1)' in markdown
+    assert '| L1 | 50% | ⬜ 50% to go |' in markdown
+    assert '- **Testing** (50%): `unit_tests_exist`' in markdown
+    assert '| ✗ | `unit_tests_runnable` | 0/1 | No <script> & test docs |' in markdown
+    assert markdown.endswith('---\n*Report generated from repository analysis*')
+    assert brief.splitlines()[2] == '**Not yet L1** | 50.0% (1/2)'
+    assert brief.endswith('**Quick Wins:**\n- unit_tests_runnable: No <script> & test docs')
+
+
+def test_html_report_is_self_contained_and_escaped():
+    generate_report = _load_generate_report_module()
+
+    page = generate_report.generate_html_report(ANALYSIS)
+
+    assert page.startswith('<!DOCTYPE html>')
+    assert '<style>' in page and 'http' not in page
+    assert 'No &lt;script&gt; &amp; test docs' in page
+    assert '<script>' not in page
+
+
+def test_templates_are_compiled_once_and_reused():
+    generate_report = _load_generate_report_module()
+
+    renderer = generate_report.get_renderer('markdown')
+    reports = list(generate_report.render_reports([ANALYSIS, ANALYSIS], 'markdown'))
+
+    assert generate_report.get_renderer('markdown') is renderer
+    assert reports[0] == reports[1] == generate_report.generate_markdown_report(ANALYSIS)
+    with pytest.raises(ValueError):
+        generate_report.CompiledTemplate('{data.repo_name}')
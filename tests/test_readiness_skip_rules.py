@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def _load_analyze_repo_module():
+    repo_root = Path(__file__).resolve().parents[1]
+    module_path = repo_root / 'skills' / 'readiness-report' / 'scripts' / 'analyze_repo.py'
+    spec = importlib.util.spec_from_file_location('analyze_repo', module_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_skipped_criteria_do_no_io(tmp_path: Path):
+    analyze_repo = _load_analyze_repo_module()
+    repo = tmp_path / 'mylib'
+    (repo / 'mylib').mkdir(parents=True)
+    (repo / 'mylib' / 'health.py').write_text('def health(): pass\n')
+    (repo / 'setup.py').write_text('setup(name="mylib", description="A library")\n')
+
+    analyzer = analyze_repo.RepoAnalyzer(str(repo))
+    searched = []
+    original_search = analyzer._search_files
+
+    def recording_search(pattern, content_pattern=None):
+        searched.append((pattern, content_pattern))
+        return original_search(pattern, content_pattern)
+
+    analyzer._search_files = recording_search
+    result = analyzer.analyze()
+
+    assert result.repo_type == 'library'
+    observability = {c.id: c for c in result.pillars['Debugging & Observability'].criteria}
+    assert observability['health_checks'].status == analyze_repo.CriterionStatus.SKIP
+    assert observability['health_checks'].reason == 'Library, not a deployed service'
+    assert not any(content == r'health|ready|alive' for _, content in searched)
+    assert not any(content == r'(redact|sanitize|mask|pii)' for _, content in searched)
+
+
+def test_skip_reasons_are_resolved_before_checks(tmp_path: Path):
+    analyze_repo = _load_analyze_repo_module()
+    repo = tmp_path / 'service'
+    repo.mkdir()
+    (repo / 'README.md').write_text('A web service\n')
+
+    analyzer = analyze_repo.RepoAnalyzer(str(repo))
+    analyzer._detect_repo_type()
+    analyzer._resolve_skips()
+
+    assert analyzer._should_skip('monorepo_tooling') == (
+        True, 'Single-application repository, not a monorepo'
+    )
+    assert analyzer._should_skip('agents_md_validation')[0]
+    assert analyzer._should_skip('health_checks') == (False, '')
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import copy
+import importlib.util
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / 'skills' / 'readiness-report' / 'scripts'
+
+
+def _load_module(name: str):
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f'{name}.py')
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _analysis(pass_rate: float, level: int, statuses: dict[str, str], commit: str) -> dict:
+    return {
+        'repo_name': 'svc',
+        'commit': commit,
+        'pass_rate': pass_rate,
+        'achieved_level': level,
+        'total_passed': sum(s == 'pass' for s in statuses.values()),
+        'total_criteria': sum(s != 'skip' for s in statuses.values()),
+        'level_scores': {1: pass_rate},
+        'pillars': {
+            'Testing': {
+                'criteria': [
+                    {'id': crit_id, 'level': 1, 'status': status}
+                    for crit_id, status in statuses.items()
+                ],
+            },
+        },
+    }
+
+
+def test_trend_store_reports_deltas_and_regressions(tmp_path: Path):
+    trend_store = _load_module('trend_store')
+    generate_report = _load_module('generate_report')
+    base = _analysis(100.0, 1, {'readme': 'pass', 'unit_tests_exist': 'fail'}, 'a' * 40)
+    head = copy.deepcopy(base)
+    head.update(_analysis(50.0, 0, {'readme': 'fail', 'unit_tests_exist': 'pass'}, 'b' * 40))
+
+    with trend_store.TrendStore(str(tmp_path / 'trends.db')) as store:
+        store.record(base, recorded_at='2026-01-01T00:00:00+00:00')
+        store.record(head, recorded_at='2026-01-02T00:00:00+00:00')
+
+        delta = store.latest_deltas()[0]
+        assert delta['pass_rate_delta'] == -50.0
+        assert delta['level_delta'] == -1
+        assert [c['criterion_id'] for c in delta['regressions']] == ['readme']
+        assert [c['criterion_id'] for c in delta['improvements']] == ['unit_tests_exist']
+        assert store.run_for_commit('svc', 'aaaaaaa')['pass_rate'] == 100.0
+
+        report = generate_report.generate_trend_report(store, 'svc')
+        assert '**Pass Rate**: 50.0% (-50.0)' in report
+        assert '| `readme` | L1 | Testing | pass → fail |' in report
+
+
+def test_trend_store_queries_use_indexes(tmp_path: Path):
+    trend_store = _load_module('trend_store')
+
+    with trend_store.TrendStore(str(tmp_path / 'trends.db')) as store:
+        plan = ' '.join(
+            row[-1] for row in store.conn.execute(
+                'EXPLAIN QUERY PLAN SELECT id FROM runs WHERE repo = ? '
+                'ORDER BY recorded_at DESC, id DESC LIMIT 2', ('svc',)
+            )
+        )
+        assert 'runs_repo_recorded' in plan
+
+
+def test_trend_store_drops_unused_recorded_at_index(tmp_path: Path):
+    trend_store = _load_module('trend_store')
+    path = str(tmp_path / 'trends.db')
+    with trend_store.TrendStore(path) as store:
+        store.conn.execute('CREATE INDEX runs_recorded ON runs (recorded_at)')
+        store.conn.commit()
+
+    with trend_store.TrendStore(path) as store:
+        indexes = {row[0] for row in store.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'runs'"
+        )}
+        assert indexes == {'runs_repo_recorded', 'runs_repo_commit'}
+
+
+def test_nested_plain_directory_records_no_commit(tmp_path: Path):
+    import subprocess
+    analyze_repo = _load_module('analyze_repo')
+    trend_store = _load_module('trend_store')
+    outer = tmp_path / 'outer'
+    (outer / 'vendor' / 'lib').mkdir(parents=True)
+    (outer / 'README.md').write_text('# outer\n')
+    git = ['git', '-c', 'user.name=t', '-c', 'user.email=t@example.com', '-C', str(outer)]
+    subprocess.run(['git', 'init', '-q', str(outer)], check=True)
+    subprocess.run([*git, 'add', '.'], check=True)
+    subprocess.run([*git, 'commit', '-qm', 'init'], check=True)
+
+    nested = analyze_repo.RepoAnalyzer(str(outer / 'vendor' / 'lib')).analyze()
+    own = analyze_repo.RepoAnalyzer(str(outer)).analyze()
+
+    assert not nested.commit
+    assert own.commit and len(own.commit) == 40
+    with trend_store.TrendStore(str(tmp_path / 'trends.db')) as store:
+        run_id = store.record(analyze_repo.analysis_to_dict(nested))
+        assert store.conn.execute('SELECT commit_sha FROM runs WHERE id = ?', (run_id,)).fetchone()[0] is None
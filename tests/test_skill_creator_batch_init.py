@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / 'skills' / 'skill-creator' / 'scripts'
+
+
+def _load_module(name: str):
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f'{name}.py')
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_single_skill_template_validates(tmp_path, capsys):
+    init_skill = _load_module('init_skill')
+    quick_validate = _load_module('quick_validate')
+
+    skill_dir = init_skill.init_skill('my-skill', str(tmp_path))
+
+    assert quick_validate.validate_skill(skill_dir, deep=True) == (True, 'Skill is valid!')
+    assert '# My Skill' in (skill_dir / 'SKILL.md').read_text()
+
+
+def test_load_specs_from_csv_and_json(tmp_path):
+    mod = _load_module('init_skill')
+    csv_manifest = tmp_path / 'specs.csv'
+    csv_manifest.write_text('name,description,path\nbilling-api,"Call the billing API: invoices, refunds.",\nsearch,,other\n')
+    json_manifest = tmp_path / 'specs.json'
+    json_manifest.write_text(json.dumps({'skills': [{'name': 'billing-api'}]}))
+
+    assert mod.load_specs(csv_manifest) == [
+        {'name': 'billing-api', 'description': 'Call the billing API: invoices, refunds.'},
+        {'name': 'search', 'path': 'other'},
+    ]
+    assert mod.load_specs(json_manifest) == [{'name': 'billing-api'}]
+    json_manifest.write_text('[{"description": "nameless"}]')
+    with pytest.raises(ValueError):
+        mod.load_specs(json_manifest)
+    json_manifest.write_text('[{"name": "good-one"}, {"name": 123}]')
+    with pytest.raises(ValueError, match='#2 .*name must be a string'):
+        mod.load_specs(json_manifest)
+    json_manifest.write_text('[{"name": "good-one", "description": ["a", "b"]}]')
+    with pytest.raises(ValueError, match='#1 .*description must be a string'):
+        mod.load_specs(json_manifest)
+
+
+def test_init_skills_writes_and_validates_in_parallel(tmp_path):
+    mod = _load_module('init_skill')
+    quick_validate = _load_module('quick_validate')
+    specs = [{'name': f'service-{i}', 'description': f'Work with service {i}: deploys, logs.'} for i in range(20)]
+    specs.append({'name': 'elsewhere', 'path': str(tmp_path / 'other')})
+
+    results = mod.init_skills(specs, str(tmp_path / 'skills'), max_workers=4)
+
+    assert [name for name, _, _ in results] == [spec['name'] for spec in specs]
+    assert all(skill_dir for _, skill_dir, _ in results)
+    assert (tmp_path / 'other' / 'elsewhere' / 'SKILL.md').exists()
+    frontmatter = _load_module('frontmatter').load_frontmatter(tmp_path / 'skills' / 'service-3' / 'SKILL.md')
+    assert frontmatter == {'name': 'service-3', 'description': 'Work with service 3: deploys, logs.'}
+    assert quick_validate.validate_skills(quick_validate.find_skills(tmp_path), max_workers=1)[0][1]
+
+
+def test_failing_specs_leave_nothing_behind(tmp_path):
+    mod = _load_module('init_skill')
+    skills = tmp_path / 'skills'
+    (skills / 'taken').mkdir(parents=True)
+    specs = [
+        {'name': 'bad-desc', 'description': 'Renders <html>.'},
+        {'name': 'Bad_Name'},
+        {'name': 'taken'},
+        {'name': 'twice'},
+        {'name': 'twice'},
+        {'name': 'fine'},
+    ]
+
+    results = {name: (skill_dir, message) for name, skill_dir, message in mod.init_skills(specs, str(skills))}
+
+    assert 'angle brackets' in results['bad-desc'][1]
+    assert 'hyphen-case' in results['Bad_Name'][1]
+    assert 'already exists' in results['taken'][1]
+    assert 'more than once' in results['twice'][1]
+    assert results['fine'][0] == skills / 'fine'
+    assert sorted(p.name for p in skills.iterdir()) == ['fine', 'taken']
+
+
+def test_cli_manifest(tmp_path, monkeypatch, capsys):
+    mod = _load_module('init_skill')
+    manifest = tmp_path / 'specs.csv'
+    manifest.write_text('name,description\nalpha,First.\nbeta,Second <b>.\n')
+    monkeypatch.setattr(sys, 'argv', ['init_skill.py', '--manifest', str(manifest), '--path', str(tmp_path / 's')])
+
+    with pytest.raises(SystemExit) as exc:
+        mod.main()
+
+    assert exc.value.code == 1
+    out = capsys.readouterr().out
+    assert '✅ alpha' in out and '❌ beta' in out and '1/2 skill(s) initialized' in out
+
+
+def test_compiled_template_matches_str_format():
+    mod = _load_module('init_skill')
+    source = 'name: {name!r} | {title:>10} | {count:03d}'
+    fields = {'name': 'pdf', 'title': 'PDF', 'count': 7}
+
+    assert mod.CompiledTemplate(source).render(**fields) == source.format(**fields)
+    for bad in ('{skill.name}', '{name:{width}}'):
+        with pytest.raises(ValueError, match='Unsupported template field'):
+            mod.CompiledTemplate(bad)
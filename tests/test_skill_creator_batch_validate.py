@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / 'skills' / 'skill-creator' / 'scripts'
+
+
+def _load_quick_validate_module():
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location('quick_validate', SCRIPTS_DIR / 'quick_validate.py')
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_skill(root: Path, name: str, description: str = 'Does things.') -> Path:
+    skill = root / name
+    skill.mkdir(parents=True)
+    (skill / 'SKILL.md').write_text(f'---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n')
+    return skill
+
+
+@pytest.fixture
+def registry(tmp_path):
+    root = tmp_path / 'skills'
+    for i in range(6):
+        _write_skill(root, f'skill-{i}')
+    _write_skill(root, 'broken', description='Uses <html> tags.')
+    _write_skill(root / 'team', 'nested')
+    (root / 'skill-0' / 'references').mkdir()
+    (root / '.hidden').mkdir()
+    (root / '.hidden' / 'SKILL.md').write_text('not a skill')
+    return root
+
+
+def test_find_skills_discovers_nested_and_skips_hidden(registry):
+    mod = _load_quick_validate_module()
+
+    names = [p.relative_to(registry).as_posix() for p in mod.find_skills(registry)]
+
+    assert names == ['broken'] + [f'skill-{i}' for i in range(6)] + ['team/nested']
+
+
+@pytest.mark.parametrize('jobs', [1, 3])
+def test_validate_skills_keeps_order_and_reports_failures(registry, jobs):
+    mod = _load_quick_validate_module()
+    paths = mod.find_skills(registry)
+
+    results = mod.validate_skills(paths, max_workers=jobs)
+
+    assert [r[0] for r in results] == [str(p) for p in paths]
+    assert [Path(p).name for p, valid, _ in results if not valid] == ['broken']
+    assert 'angle brackets' in results[0][2]
+
+
+def test_json_and_junit_reports(registry):
+    mod = _load_quick_validate_module()
+    results = mod.validate_skills(mod.find_skills(registry), max_workers=1)
+
+    data = json.loads(mod.format_report(results, 'json'))
+    assert (data['total'], data['passed'], data['failed']) == (8, 7, 1)
+
+    suite = ET.fromstring(mod.format_report(results, 'junit'))
+    assert suite.get('tests') == '8' and suite.get('failures') == '1'
+    failures = [case.get('name') for case in suite if case.find('failure') is not None]
+    assert failures == [str(registry / 'broken')]
+
+
+def test_cli_all_exits_nonzero_on_failure(registry, tmp_path, monkeypatch):
+    mod = _load_quick_validate_module()
+    out = tmp_path / 'report.json'
+    monkeypatch.setattr(sys, 'argv', ['quick_validate.py', '--all', str(registry),
+                                      '--format', 'json', '--output', str(out), '-j', '2'])
+
+    with pytest.raises(SystemExit) as exc:
+        mod.main()
+
+    assert exc.value.code == 1
+    assert json.loads(out.read_text())['failed'] == 1
+
+
+def test_cli_single_skill_output_unchanged(registry, monkeypatch, capsys):
+    mod = _load_quick_validate_module()
+    monkeypatch.setattr(sys, 'argv', ['quick_validate.py', str(registry / 'skill-1')])
+
+    with pytest.raises(SystemExit) as exc:
+        mod.main()
+
+    assert exc.value.code == 0
+    assert capsys.readouterr().out == 'Skill is valid!\n'
+
+
+@pytest.mark.parametrize('jobs', [1, 3])
+def test_validate_skills_reports_undecodable_skill_without_aborting(registry, jobs):
+    mod = _load_quick_validate_module()
+    (registry / 'skill-2' / 'SKILL.md').write_bytes(b'---\nname: skill-2\ndescription: caf\xe9\n---\n')
+    paths = mod.find_skills(registry)
+
+    results = mod.validate_skills(paths, max_workers=jobs)
+
+    assert [r[0] for r in results] == [str(p) for p in paths]
+    failed = {Path(p).name: message for p, valid, message in results if not valid}
+    assert sorted(failed) == ['broken', 'skill-2']
+    assert failed['skill-2'].startswith('UnicodeDecodeError: ')
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / 'skills' / 'skill-creator' / 'scripts'
+
+
+def _load_quick_validate_module():
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location('quick_validate', SCRIPTS_DIR / 'quick_validate.py')
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def skill(tmp_path):
+    skill = tmp_path / 'my-skill'
+    (skill / 'scripts').mkdir(parents=True)
+    (skill / 'references').mkdir()
+    (skill / 'assets').mkdir()
+    (skill / 'SKILL.md').write_text(
+        '---\nname: my-skill\ndescription: Does things.\n---\n\n'
+        'See [the API](references/api.md#auth), [docs](https://example.com) and [top](#usage).\n'
+        '```\n[not a link](missing.md)\n```\n'
+        'Inline `[code](missing.md)` is ignored too.\n'
+    )
+    (skill / 'references' / 'api.md').write_text('Back to [skill](../SKILL.md), ![logo](../assets/logo%20big.png)\n')
+    (skill / 'scripts' / 'run.py').write_text('print("ok")\n')
+    (skill / 'assets' / 'logo big.png').write_bytes(b'\x89PNG')
+    return skill
+
+
+def test_deep_check_passes_for_consistent_skill(skill):
+    mod = _load_quick_validate_module()
+
+    assert mod.deep_check(skill) == []
+    assert mod.validate_skill(skill, deep=True) == (True, 'Skill is valid!')
+
+
+def test_deep_check_reports_every_problem(skill, monkeypatch):
+    mod = _load_quick_validate_module()
+    monkeypatch.setattr(mod, 'MAX_ASSET_SIZE', 1024)
+    (skill / 'scripts' / 'broken.py').write_text('def f(:\n    pass\n')
+    (skill / 'references' / 'api.md').write_text('See [guide](guide.md) and [skill](../SKILL.md)\n')
+    (skill / 'assets' / 'video.mp4').write_bytes(b'\0' * 4096)
+
+    problems = mod.deep_check(skill)
+
+    assert len(problems) == 3
+    assert problems[0] == 'assets/video.mp4: asset is 0.0 MiB (limit 0 MiB)'
+    assert problems[1] == 'references/api.md: broken link to guide.md'
+    assert problems[2].startswith('scripts/broken.py:1: SyntaxError')
+    valid, message = mod.validate_skill(skill)
+    assert valid
+    valid, message = mod.validate_skill(skill, deep=True)
+    assert not valid and 'broken link to guide.md' in message
+
+
+def test_deep_check_reports_unreadable_files(skill, tmp_path):
+    mod = _load_quick_validate_module()
+    for rel in ('assets/gone.png', 'references/gone.md', 'scripts/gone.py'):
+        (skill / rel).symlink_to(tmp_path / 'nowhere')
+
+    problems = mod.deep_check(skill)
+
+    assert problems == [
+        'assets/gone.png: unreadable: No such file or directory',
+        'references/gone.md: unreadable: No such file or directory',
+        'scripts/gone.py: unreadable: No such file or directory',
+    ]
+    cache = tmp_path / 'cache.json'
+    valid, message = mod.validate_skills([skill], max_workers=1, cache_path=cache, deep=True)[0][1:]
+    assert not valid and 'assets/gone.png: unreadable' in message
+
+
+def test_deep_results_are_cached_separately(skill, tmp_path):
+    mod = _load_quick_validate_module()
+    cache = tmp_path / 'cache.json'
+    assert mod.validate_skills([skill], max_workers=1, cache_path=cache, deep=True)[0][1]
+
+    (skill / 'references' / 'api.md').write_text('See [guide](guide.md)\n')
+
+    assert mod.validate_skills([skill], max_workers=1, cache_path=cache)[0][1]
+    assert not mod.validate_skills([skill], max_workers=1, cache_path=cache, deep=True)[0][1]
+
+
+def test_cli_deep_runs_in_parallel(skill, tmp_path, monkeypatch, capsys):
+    mod = _load_quick_validate_module()
+    other = tmp_path / 'other-skill'
+    (other / 'scripts').mkdir(parents=True)
+    (other / 'SKILL.md').write_text('---\nname: other-skill\ndescription: Other.\n---\n')
+    (other / 'scripts' / 'bad.py').write_text('return 1 +\n')
+    monkeypatch.setattr(sys, 'argv', ['quick_validate.py', '--all', str(tmp_path), '--deep', '-j', '2'])
+
+    with pytest.raises(SystemExit) as exc:
+        mod.main()
+
+    assert exc.value.code == 1
+    out = capsys.readouterr().out
+    assert '1/2 skills valid' in out
+    assert 'scripts/bad.py:1: SyntaxError' in out
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / 'skills' / 'skill-creator' / 'scripts'
+
+
+def _load_frontmatter_module():
+    spec = importlib.util.spec_from_file_location('frontmatter', SCRIPTS_DIR / 'frontmatter.py')
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize('skill_md', sorted(REPO_ROOT.glob('skills/*/SKILL.md')), ids=lambda p: p.parent.name)
+def test_matches_yaml_for_repository_skills(skill_md):
+    mod = _load_frontmatter_module()
+    text = mod.read_frontmatter_text(skill_md)
+
+    assert mod.parse_frontmatter(text) == yaml.safe_load(text)
+
+
+@pytest.mark.parametrize('text', [
+    'name: docker\ndescription: Run Docker. Use when building images.\ntriggers:\n- docker\n- container',
+    "name: x\ndescription: 'It''s quoted'\ntriggers:\n  - \"git\"\n  - gitlab\n# comment\nlicense:",
+    'name: x\ndescription: yes',
+    'name: x\ndescription: 1.0',
+    'name: x\ndescription: >\n  folded\n  text',
+    'name: x\nmetadata:\n  version: 2',
+    'name: x\ntriggers: [a, b]',
+    'name: x\ndescription: a #comment',
+    'on: x',
+])
+def test_fast_path_agrees_with_yaml(text):
+    mod = _load_frontmatter_module()
+
+    assert mod.parse_frontmatter(text) == yaml.safe_load(text)
+
+
+def test_simple_frontmatter_does_not_need_yaml(monkeypatch):
+    mod = _load_frontmatter_module()
+    monkeypatch.setitem(sys.modules, 'yaml', None)
+
+    assert mod.parse_frontmatter('name: npm\ntriggers:\n- npm') == {'name': 'npm', 'triggers': ['npm']}
+    with pytest.raises(ImportError):
+        mod.parse_frontmatter('name: npm\nmetadata:\n  a: 1')
+
+
+def test_reads_only_the_frontmatter(tmp_path):
+    mod = _load_frontmatter_module()
+    skill_md = tmp_path / 'SKILL.md'
+    skill_md.write_bytes(b'---\nname: x\ndescription: d\n---\n\n' + bytes(range(128, 256)))
+
+    assert mod.load_frontmatter(skill_md) == {'name': 'x', 'description': 'd'}
+
+
+@pytest.mark.parametrize('content, message', [
+    ('# no frontmatter\n', 'No YAML frontmatter found'),
+    ('---\nname: x\n', 'Invalid frontmatter format'),
+    ('---\n- a\n- b\n---\n', 'must be a YAML dictionary'),
+    ('---\nname: a: b\n---\n', 'Invalid YAML'),
+])
+def test_errors(tmp_path, content, message):
+    mod = _load_frontmatter_module()
+    skill_md = tmp_path / 'SKILL.md'
+    skill_md.write_text(content)
+
+    with pytest.raises(mod.FrontmatterError, match=message):
+        mod.load_frontmatter(skill_md)
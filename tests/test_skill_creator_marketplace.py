@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / 'skills' / 'skill-creator' / 'scripts'
+
+
+def _load_build_marketplace_module():
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location('build_marketplace', SCRIPTS_DIR / 'build_marketplace.py')
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_skill(skills_dir: Path, dirname: str, description: str, name: str | None = None) -> Path:
+    skill = skills_dir / dirname
+    skill.mkdir(parents=True, exist_ok=True)
+    (skill / 'SKILL.md').write_text(
+        f'---\nname: {name or dirname}\ndescription: {description}\ntriggers:\n- {dirname}\n---\n\n# Body\n'
+    )
+    return skill
+
+
+@pytest.fixture
+def project(tmp_path):
+    skills_dir = tmp_path / 'skills'
+    _write_skill(skills_dir, 'docker', 'Run Docker.')
+    _write_skill(skills_dir, 'npm', 'Use npm.')
+    marketplace = tmp_path / '.plugin' / 'marketplace.json'
+    marketplace.parent.mkdir()
+    marketplace.write_text(json.dumps({
+        'name': 'registry',
+        'metadata': {'pluginRoot': './skills'},
+        'plugins': [
+            {'name': 'docker', 'source': './docker', 'description': 'Old text.',
+             'category': 'infrastructure', 'keywords': ['docker', 'containers']},
+            {'name': 'gone', 'source': './gone', 'description': 'Removed.'},
+        ],
+    }, indent=2))
+    return skills_dir, marketplace
+
+
+def test_check_reports_drift(project):
+    mod = _load_build_marketplace_module()
+    skills_dir, marketplace = project
+    skills, errors = mod.scan_skills(skills_dir)
+
+    problems = mod.check_marketplace(json.loads(marketplace.read_text()), skills)
+
+    assert errors == {}
+    assert problems == [
+        'docker: description differs from SKILL.md frontmatter',
+        'gone: source ./gone has no SKILL.md',
+        'npm: missing from marketplace',
+    ]
+
+
+def test_build_keeps_curated_fields(project):
+    mod = _load_build_marketplace_module()
+    skills_dir, marketplace = project
+    skills, _ = mod.scan_skills(skills_dir)
+
+    built = mod.build_marketplace(json.loads(marketplace.read_text()), skills)
+
+    assert built['name'] == 'registry'
+    assert built['plugins'] == [
+        {'name': 'docker', 'source': './docker', 'description': 'Run Docker.',
+         'category': 'infrastructure', 'keywords': ['docker', 'containers']},
+        {'name': 'npm', 'source': './npm', 'description': 'Use npm.', 'keywords': ['npm']},
+    ]
+    assert mod.check_marketplace(built, skills) == []
+
+
+def test_incremental_scan_parses_only_changed_skills(project, monkeypatch):
+    mod = _load_build_marketplace_module()
+    skills_dir, _ = project
+    cache, _ = mod.scan_skills(skills_dir)
+    cache = json.loads(json.dumps(cache))
+    _write_skill(skills_dir, 'npm', 'Use npm and npx for packages.')
+    parsed = []
+    real = mod.load_frontmatter
+    monkeypatch.setattr(mod, 'load_frontmatter', lambda path: parsed.append(Path(path).parent.name) or real(path))
+
+    skills, _ = mod.scan_skills(skills_dir, cache)
+
+    assert parsed == ['npm']
+    assert skills['npm']['description'] == 'Use npm and npx for packages.'
+    assert skills['docker']['description'] == 'Run Docker.'
+
+
+def test_cli_build_then_check(project, monkeypatch, tmp_path):
+    mod = _load_build_marketplace_module()
+    _, marketplace = project
+    cache = tmp_path / 'cache.json'
+    monkeypatch.setattr(sys, 'argv', ['build_marketplace.py', '--marketplace', str(marketplace),
+                                      '--cache', str(cache)])
+    mod.main()
+    assert '"keywords": ["docker", "containers"]' in marketplace.read_text()
+
+    monkeypatch.setattr(sys, 'argv', ['build_marketplace.py', '--marketplace', str(marketplace), '--check'])
+    mod.main()
+
+    _write_skill(project[0], 'docker', 'Run Docker.', name='docker-cli')
+    with pytest.raises(SystemExit) as exc:
+        mod.main()
+    assert exc.value.code == 1
+
+
+def test_serialization_matches_repository_index():
+    mod = _load_build_marketplace_module()
+    text = (REPO_ROOT / '.plugin' / 'marketplace.json').read_text()
+
+    assert mod.dump_marketplace(json.loads(text)) == text
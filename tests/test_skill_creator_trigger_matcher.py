@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import random
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / 'skills' / 'skill-creator' / 'scripts'
+
+
+def _load_module(name: str):
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f'{name}.py')
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_skill(root: Path, name: str, triggers: list[str]) -> Path:
+    skill = root / name
+    skill.mkdir(parents=True, exist_ok=True)
+    value = ''.join(f'\n- {t}' for t in triggers)
+    (skill / 'SKILL.md').write_text(f'---\nname: {name}\ndescription: The {name} skill.\ntriggers:{value}\n---\n')
+    return skill
+
+
+TRIGGERS = {
+    'github': ['github', 'git'],
+    'gitlab': ['gitlab', 'git'],
+    'kubernetes': ['kubernetes', 'k8s'],
+    'ssh': ['ssh', 'remote server'],
+    'codereview': ['/codereview'],
+}
+
+
+def test_match_returns_skills_in_message_order():
+    mod = _load_module('trigger_matcher')
+    matcher = mod.TriggerMatcher.compile(TRIGGERS)
+
+    assert matcher.match('Deploy to K8s over SSH, then push to GitHub') == ['kubernetes', 'ssh', 'github', 'gitlab']
+    assert matcher.match('log into the Remote   Server') == ['ssh']
+    assert matcher.match('nothing relevant') == []
+    assert sorted(matcher.find('gitlab')) == [(0, 3, 'git'), (0, 6, 'gitlab')]
+
+
+def test_word_boundaries_ignore_matches_inside_words():
+    mod = _load_module('trigger_matcher')
+    matcher = mod.TriggerMatcher.compile(TRIGGERS, word_boundaries=True)
+
+    assert matcher.match('open a github issue') == ['github']
+    assert matcher.match('use git, then /codereview!') == ['github', 'gitlab', 'codereview']
+    assert matcher.match('digital sshd') == []
+
+
+def test_automaton_agrees_with_naive_scan():
+    mod = _load_module('trigger_matcher')
+    rng = random.Random(3)
+    triggers = {
+        f'skill-{i}': [''.join(rng.choices('abcd ', k=rng.randint(1, 6))).strip() or 'a' for _ in range(3)]
+        for i in range(200)
+    }
+    matcher = mod.TriggerMatcher.compile(triggers)
+    normalized = {s: [' '.join(t.split()) for t in ts] for s, ts in triggers.items()}
+
+    for _ in range(300):
+        message = ''.join(rng.choices('abcde ', k=rng.randint(0, 60)))
+        assert set(matcher.match(message)) == mod.naive_match(normalized, message)
+
+
+def test_saved_automaton_is_reused_until_a_skill_changes(tmp_path, monkeypatch):
+    mod = _load_module('trigger_matcher')
+    skills = [_write_skill(tmp_path, name, triggers) for name, triggers in TRIGGERS.items()]
+    automaton = tmp_path / 'cache' / 'triggers.json'
+    first = mod.load_matcher(skills, automaton)
+    assert json.loads(automaton.read_text())['triggers'] == first.triggers
+
+    compiled = []
+    real_compile = mod.TriggerMatcher.compile.__func__
+    monkeypatch.setattr(mod.TriggerMatcher, 'compile',
+                        classmethod(lambda cls, *a, **kw: compiled.append(1) or real_compile(cls, *a, **kw)))
+    loaded = mod.load_matcher(skills, automaton)
+    assert compiled == []
+    assert loaded.match('push to github') == first.match('push to github')
+
+    _write_skill(tmp_path, 'npm', ['npm', 'node packages'])
+    skills.append(tmp_path / 'npm')
+    assert mod.load_matcher(skills, automaton).match('install node packages') == ['npm']
+    assert compiled == [1]
+
+
+def test_benchmark_reports_timings():
+    mod = _load_module('trigger_matcher')
+    messages = ['push to github', 'k8s pods', 'ssh into the remote server', 'hello'] * 10
+
+    result = mod.benchmark(TRIGGERS, messages, repeat=1)
+
+    assert result['messages'] == 40 and result['skills'] == 5 and result['triggers'] == 8
+    assert result['mismatches'] == 0
+    assert result['automaton_seconds'] > 0 and result['naive_seconds'] > 0
+
+
+def test_cli_match(tmp_path, monkeypatch, capsys):
+    mod = _load_module('trigger_matcher')
+    for name, triggers in TRIGGERS.items():
+        _write_skill(tmp_path / 'skills', name, triggers)
+    monkeypatch.setattr(sys, 'argv', ['trigger_matcher.py', str(tmp_path / 'skills'),
+                                      '--automaton', str(tmp_path / 'a.json'), '--match', 'run /codereview'])
+
+    mod.main()
+
+    assert capsys.readouterr().out == 'codereview\n'
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / 'skills' / 'skill-creator' / 'scripts'
+
+
+def _load_module(name: str):
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f'{name}.py')
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_skill(root: Path, name: str, triggers) -> Path:
+    skill = root / name
+    skill.mkdir(parents=True)
+    if isinstance(triggers, list):
+        value = ''.join(f'\n- {t}' for t in triggers)
+    else:
+        value = f' {triggers}'
+    (skill / 'SKILL.md').write_text(f'---\nname: {name}\ndescription: The {name} skill.\ntriggers:{value}\n---\n')
+    return skill
+
+
+@pytest.mark.parametrize('triggers, message', [
+    (['docker', 'container'], 'Skill is valid!'),
+    ('docker', 'Triggers must be a list of strings, got str'),
+    (['docker', "''"], 'Trigger #2 must be a non-empty string'),
+    (['Docker', 'docker'], "Duplicate trigger 'docker'"),
+])
+def test_validate_skill_checks_triggers(tmp_path, triggers, message):
+    mod = _load_module('quick_validate')
+
+    assert mod.validate_skill(_write_skill(tmp_path, 'docker', triggers))[1] == message
+
+
+def test_find_overlaps_reports_duplicates_prefixes_and_substrings():
+    mod = _load_module('trigger_index')
+    triggers = {
+        'github': ['github', 'git'],
+        'gitlab': ['gitlab', 'git'],
+        'github-pr-review': ['/github-pr-review'],
+        'ssh': ['ssh', 'ssh keys'],
+    }
+
+    report = mod.find_overlaps(triggers)
+
+    assert report['duplicates'] == [{'trigger': 'git', 'skills': ['github', 'gitlab']}]
+    assert [(o['trigger'], o['within'], o['kind']) for o in report['overlaps']] == [
+        ('git', '/github-pr-review', 'substring'),
+        ('github', '/github-pr-review', 'substring'),
+        ('git', 'github', 'prefix'),
+        ('git', 'gitlab', 'prefix'),
+    ]
+
+
+def test_find_overlaps_matches_pairwise_comparison():
+    mod = _load_module('trigger_index')
+    rng = random.Random(7)
+    triggers = {
+        f'skill-{i}': list({''.join(rng.choices('abc', k=rng.randint(1, 5))) for _ in range(4)})
+        for i in range(40)
+    }
+    owners = {}
+    for skill, values in triggers.items():
+        for t in values:
+            owners.setdefault(t, set()).add(skill)
+
+    expected = sorted(
+        (short, long)
+        for short in owners for long in owners
+        if short != long and short in long and owners[short] - owners[long]
+    )
+    overlaps = mod.find_overlaps(triggers)['overlaps']
+
+    assert sorted((o['trigger'], o['within']) for o in overlaps) == expected
+
+
+def test_load_triggers_normalizes(tmp_path):
+    mod = _load_module('trigger_index')
+    skill = _write_skill(tmp_path, 'ssh', ['SSH', 'Remote   Server', 'ssh'])
+
+    assert mod.load_triggers([skill]) == {'ssh': ['ssh', 'remote server']}
+
+
+def test_cli_trigger_report(tmp_path, monkeypatch, capsys):
+    mod = _load_module('quick_validate')
+    _write_skill(tmp_path, 'github', ['github', 'git'])
+    _write_skill(tmp_path, 'gitlab', ['gitlab', 'git'])
+    monkeypatch.setattr(sys, 'argv', ['quick_validate.py', '--all', str(tmp_path), '--triggers', '--format', 'json'])
+
+    with pytest.raises(SystemExit) as exc:
+        mod.main()
+
+    assert exc.value.code == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data['triggers']['duplicates'] == [{'trigger': 'git', 'skills': ['github', 'gitlab']}]
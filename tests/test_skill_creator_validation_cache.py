@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / 'skills' / 'skill-creator' / 'scripts'
+
+
+def _load_quick_validate_module():
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location('quick_validate', SCRIPTS_DIR / 'quick_validate.py')
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def skills(tmp_path):
+    paths = []
+    for name in ('alpha', 'beta', 'gamma'):
+        skill = tmp_path / 'skills' / name
+        skill.mkdir(parents=True)
+        (skill / 'SKILL.md').write_text(f'---\nname: {name}\ndescription: The {name} skill.\n---\n')
+        paths.append(skill)
+    return paths
+
+
+def _count_validations(mod, monkeypatch) -> list[str]:
+    validated = []
+    real = mod.validate_skill
+
+    def validate_skill(skill_path, deep=False):
+        validated.append(Path(skill_path).name)
+        return real(skill_path, deep=deep)
+
+    monkeypatch.setattr(mod, 'validate_skill', validate_skill)
+    return validated
+
+
+def test_unchanged_skills_are_served_from_cache(skills, tmp_path, monkeypatch):
+    mod = _load_quick_validate_module()
+    cache = tmp_path / 'cache.json'
+    first = mod.validate_skills(skills, max_workers=1, cache_path=cache)
+    (skills[1] / 'SKILL.md').write_text('---\nname: beta\ndescription: Uses <b>.\n---\n')
+    validated = _count_validations(mod, monkeypatch)
+
+    second = mod.validate_skills(skills, max_workers=1, cache_path=cache)
+
+    assert validated == ['beta']
+    assert [r[1] for r in first] == [True, True, True]
+    assert [r[1] for r in second] == [True, False, True]
+    assert mod.validate_skills(skills, max_workers=1, cache_path=cache) == second
+    assert validated == ['beta']
+
+
+def test_cache_is_invalidated_by_validator_changes(skills, tmp_path, monkeypatch):
+    mod = _load_quick_validate_module()
+    cache = tmp_path / 'cache.json'
+    mod.validate_skills(skills, max_workers=1, cache_path=cache)
+    monkeypatch.setattr(mod, 'validator_version', lambda: 'new-rules')
+    validated = _count_validations(mod, monkeypatch)
+
+    mod.validate_skills(skills, max_workers=1, cache_path=cache)
+
+    assert validated == ['alpha', 'beta', 'gamma']
+
+
+def test_cache_keeps_most_recently_used_entries(skills, tmp_path, monkeypatch):
+    mod = _load_quick_validate_module()
+    monkeypatch.setattr(mod, 'MAX_CACHE_ENTRIES', 2)
+    cache = tmp_path / 'cache.json'
+    mod.validate_skills(skills, max_workers=1, cache_path=cache)
+    mod.validate_skills(skills[:1], max_workers=1, cache_path=cache)
+
+    assert len(json.loads(cache.read_text())['results']) == 2
+    validated = _count_validations(mod, monkeypatch)
+    mod.validate_skills(skills, max_workers=1, cache_path=cache)
+    assert validated == ['beta']
+
+
+def test_corrupt_cache_is_ignored(skills, tmp_path):
+    mod = _load_quick_validate_module()
+    cache = tmp_path / 'cache.json'
+    cache.write_text('{not json')
+
+    results = mod.validate_skills(skills, max_workers=2, cache_path=cache)
+
+    assert all(valid for _, valid, _ in results)
+    assert json.loads(cache.read_text())['validator'] == mod.validator_version()